@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""!
+    @brief Batch export of many exercise sheets in parallel for SpeakMaths Trainer software
+"""
+
+##
+# @file basis.Batch.py
+#
+# @brief Batch export of many exercise sheets in parallel for SpeakMaths Trainer software
+#
+# @details A sheet spec is a dictionary with the keys
+#     output (path of the PDF file, required), level (required), n (required),
+#     oper (list of operators), minval, maxval, seed and unique (optional, see basis.Session),
+#     decimals, backend, and title (optional, written in the header of the pages).
+#
+# @date 2026-10-18
+#
+# @version 1.1
+#
+# @author MBruliard
+##
+
+
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from basis import Instrument
+from basis.Cache import SheetCache
+from basis.FixedPoint import DECIMALS
+from basis.Session import Session, BACKEND, exportSessions
+
+
+# Global Constants
+# # Required keys of a sheet spec
+SPEC_REQUIRED = ['output', 'level', 'n']
+# # Required keys of a sheet spec merged with others in one PDF file, and keys accepted but not used. See exportMerged
+MERGE_REQUIRED = ['level', 'n']
+MERGE_IGNORED = ['output']
+# # Optional keys of a sheet spec and their default values
+SPEC_DEFAULTS = {'oper': None, 'minval': 1, 'maxval': 10, 'seed': None, 'unique': False, 'decimals': DECIMALS,
+                 'backend': BACKEND, 'title': None}
+
+
+def checkSpec(spec, required=SPEC_REQUIRED, ignored=()):
+    """!
+        @brief Completes a sheet spec with its default values
+
+        @param spec [dict] sheet spec
+        @param required [list] required keys. See SPEC_REQUIRED
+        @param ignored [list] keys accepted and removed from the spec. See MERGE_IGNORED
+        @return the completed spec
+    """
+    if not isinstance(spec, dict):
+        raise ValueError("Error: a sheet spec must be a JSON object")
+    # ...
+    for key in spec:
+        if key not in required and key not in SPEC_DEFAULTS and key not in ignored:
+            raise ValueError("Error: unknown key '{0}' in sheet spec".format(key))
+        # ...
+    # ...
+    for key in required:
+        if key not in spec:
+            raise ValueError("Error: key '{0}' is required in a sheet spec".format(key))
+        # ...
+    # ...
+    return dict(SPEC_DEFAULTS, **{key: value for key, value in spec.items() if key not in ignored})
+# ...
+
+
+def loadSpecs(filename, required=SPEC_REQUIRED, ignored=()):
+    """!
+        @brief Reads a list of sheet specs from a JSON file
+
+        @param filename path of a JSON file holding a list of sheet specs
+        @param required [list] required keys. See SPEC_REQUIRED
+        @param ignored [list] keys accepted and removed from the specs. See checkSpec
+        @return list of completed specs
+    """
+    with open(filename) as f:
+        specs = json.load(f)
+    # ...
+    if not isinstance(specs, list):
+        raise ValueError("Error: the JSON file must hold a list of sheet specs")
+    # ...
+    return [checkSpec(spec, required, ignored) for spec in specs]
+# ...
+
+
+def exportSheet(spec, cache=None):
+    """!
+        @brief Builds the Session of one sheet spec and exports it as a PDF file
+
+        @param spec [dict] completed sheet spec
+        @param cache optional directory of a basis.Cache.SheetCache to get the sheets with a seed from
+        @return path of the PDF file
+    """
+    if cache is not None:
+        SheetCache(cache).export(spec['output'], spec['level'], spec['n'], oper=spec['oper'],
+                                 minval=spec['minval'], maxval=spec['maxval'], seed=spec['seed'], 
+                                 unique=spec['unique'], decimals=spec['decimals'], backend=spec['backend'], 
+                                 title=spec['title'])
+        return spec['output']
+    # ...
+    session = Session(spec['n'], spec['level'], oper=spec['oper'],
+                      minval=spec['minval'], maxval=spec['maxval'], seed=spec['seed'], unique=spec['unique'],
+                      decimals=spec['decimals'])
+    session.export(spec['output'], backend=spec['backend'], title=spec['title'])
+    return spec['output']
+# ...
+
+
+def renderSheet(spec, cache=None):
+    """!
+        @brief Builds the Session of one sheet spec and returns its PDF file
+
+        @param spec [dict] completed sheet spec, without output
+        @param cache optional directory of a basis.Cache.SheetCache to get the sheets with a seed from
+        @return bytes of the PDF file
+    """
+    if cache is not None and spec['seed'] is not None:
+        sheet = SheetCache(cache).fetch(spec['level'], spec['n'], oper=spec['oper'], minval=spec['minval'],
+                                        maxval=spec['maxval'], seed=spec['seed'], unique=spec['unique'],
+                                        decimals=spec['decimals'], backend=spec['backend'], title=spec['title'])[0]
+        try:
+            with open(sheet, 'rb') as f:
+                return f.read()
+            # ...
+        except FileNotFoundError:
+            # removed by another process since: drawn again below
+            pass
+        # ...
+    # ...
+    buffer = io.BytesIO()
+    session = Session(spec['n'], spec['level'], oper=spec['oper'],
+                      minval=spec['minval'], maxval=spec['maxval'], seed=spec['seed'], unique=spec['unique'],
+                      decimals=spec['decimals'])
+    session.export(buffer, backend=spec['backend'], title=spec['title'])
+    return buffer.getvalue()
+# ...
+
+
+def exportProfiled(spec, cache=None):
+    """!
+        @brief exportSheet with the instrumentation enabled in the worker process
+
+        @return tuple (path of the PDF file, report of the profile. See basis.Instrument.Profile.report)
+    """
+    profile = Instrument.enable()
+    try:
+        path = exportSheet(spec, cache)
+    finally:
+        Instrument.disable()
+    # ...
+    return path, profile.report()
+# ...
+
+
+def exportBatch(specs, workers=None, progress=None, profile=None, cache=None):
+    """!
+        @brief Exports many sheets in parallel, one sheet per task of a process pool
+
+        @param specs [list] sheet specs. See checkSpec
+        @param workers [int] number of processes. Number of CPUs per default
+        @param progress [callable] optional callback called as progress(nb_done, nb_sheets, path) after each sheet
+        @param profile [basis.Instrument.Profile] optional profile receiving the stages and counters of all the sheets
+        @param cache optional directory of a basis.Cache.SheetCache shared by the processes
+        @return tuple (number of sheets, elapsed seconds)
+    """
+    specs = [checkSpec(spec) for spec in specs]
+    workers = workers or os.cpu_count() or 1
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        task = exportSheet if profile is None else exportProfiled
+        futures = [pool.submit(task, spec, cache) for spec in specs]
+        for done, future in enumerate(as_completed(futures), 1):
+            path = future.result()
+            if profile is not None:
+                path, report = path
+                profile.merge(report)
+            # ...
+            if progress is not None:
+                progress(done, len(specs), path)
+            # ...
+        # ...
+    # ...
+    return len(specs), time.perf_counter() - start
+# ...
+
+
+def exportMerged(specs, filename, answers=None, backend=BACKEND, progress=None):
+    """!
+        @brief Exports many sheets into one PDF file, e.g. to print a whole class. See basis.Session.exportSessions
+
+        @details The sessions are built one at a time, as their sheets are written: the output of the specs
+        is accepted but not used, and their title is written in the header of their sheet
+
+        @param specs [list] sheet specs, output not required. See MERGE_REQUIRED
+        @param filename path of the PDF file
+        @param answers optional path of the answer keys of all the sheets
+        @param backend [str] PDF writer. See basis.Session.BACKENDS
+        @param progress [callable] optional callback called as progress(nb_done, nb_sheets) after each sheet
+        @return tuple (number of sheets, elapsed seconds)
+    """
+    specs = [checkSpec(spec, MERGE_REQUIRED, MERGE_IGNORED) for spec in specs]
+    sessions = (Session(spec['n'], spec['level'], oper=spec['oper'],
+                        minval=spec['minval'], maxval=spec['maxval'], seed=spec['seed'], unique=spec['unique'],
+                        decimals=spec['decimals']) for spec in specs)
+
+    start = time.perf_counter()
+    nb = exportSessions(sessions, filename, titles=[spec['title'] for spec in specs], answers=answers, backend=backend,
+                        progress=None if progress is None else lambda done, count: progress(done, len(specs)))
+    return nb, time.perf_counter() - start
+# ...
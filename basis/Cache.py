@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+"""!
+    @brief On-disk cache of the exported sheets for SpeakMaths Trainer software
+"""
+
+##
+# @file basis.Cache.py
+#
+# @brief On-disk cache of the exported sheets for SpeakMaths Trainer software
+#
+# @details A sheet is stored under the hash of its parameters, its seed and RENDERER_VERSION: the same
+# parameters give back the stored PDF file without generating nor drawing anything. Sheets without
+# seed are random and never cached.
+# Files are written under a temporary name then renamed, so that a reader never sees a partial file
+# and several processes can share one directory. The least recently used sheets are removed when the
+# directory is larger than its limit.
+#
+# @date 2026-10-18
+#
+# @version 1.1
+#
+# @author MBruliard
+##
+
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+from basis import Instrument
+from basis.Files import replaceFile
+from basis.FixedPoint import DECIMALS
+
+
+# Global Constants
+# # Version of the drawing of the sheets (basis.Layout and basis.MyPDF). To increase whenever a sheet
+# # with the same parameters would be drawn differently, so that the former sheets are not used anymore
+RENDERER_VERSION = 2
+
+# # Default directory and size limit of the cache
+CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'speakmaths')
+CACHE_SIZE = 256*2**20
+
+# # Number of fetches of SheetCache.export whose files are removed by another process before they are 
+# # copied, before the sheet is drawn without the cache
+FETCH_TRIES = 3
+
+
+def sheetKey(level, n, oper=None, minval=1, maxval=10, seed=None, unique=False, pools=False, decimals=DECIMALS, 
+             backend='reportlab', title=None):
+    """!
+        @brief Hash of the parameters of a sheet. See basis.Session
+
+        @return hexadecimal str, or None for a sheet without seed
+    """
+    if seed is None:
+        return None
+    # ...
+    params = {'version': RENDERER_VERSION, 'level': level, 'n': n, 'oper': oper,
+              'minval': minval, 'maxval': maxval, 'seed': seed}
+    if unique:
+        params['unique'] = True
+    # ...
+    if pools:
+        # the pools give other operations for the same seed
+        params['pools'] = True
+    # ...
+    if decimals != DECIMALS:
+        params['decimals'] = decimals
+    # ...
+    if backend != 'reportlab':
+        # same sheet, other bytes
+        params['backend'] = backend
+    # ...
+    if title:
+        params['title'] = title
+    # ...
+    return hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()
+# ...
+
+
+class SheetCache:
+    """!
+        Definition of the class SheetCache
+
+        @brief Directory of exported sheets, addressed by the hash of their parameters, with LRU eviction
+    """
+
+    def __init__(self, directory=CACHE_DIR, maxBytes=CACHE_SIZE):
+        """!
+            Class Constructor
+
+            @param directory path of the directory of the cache, created if needed
+            @param maxBytes [int] size limit of the directory in bytes
+        """
+        self.directory = directory
+        self.maxBytes = maxBytes
+        os.makedirs(directory, exist_ok=True)
+    # ...
+
+
+    def paths(self, key):
+        """!
+            @brief Paths of the sheet and of the answer key stored under @param key
+        """
+        base = os.path.join(self.directory, key)
+        return base + '.pdf', base + '-answers.pdf'
+    # ...
+
+
+    def fetch(self, level, n, oper=None, minval=1, maxval=10, seed=None, answers=False, unique=False, pools=None, 
+              decimals=DECIMALS, backend='reportlab', title=None):
+        """!
+            @brief Path of the stored sheet of these parameters, exported first if it is not stored yet
+
+            @param answers [bool] also get the answer key
+            @param title [str] optional title written in the header of the pages
+            @return tuple (path of the sheet, path of the answer key or None, True if found in the cache),
+            or None if the sheet has no seed
+        """
+        key = sheetKey(level, n, oper, minval, maxval, seed, unique, pools is not None, decimals, backend, title)
+        if key is None:
+            return None
+        # ...
+        sheet, answer = self.paths(key)
+        wanted = [sheet, answer] if answers else [sheet]
+        try:
+            for path in wanted:
+                # a used sheet becomes the most recent one
+                os.utime(path)
+            # ...
+            Instrument.count('cache hits')
+            return sheet, answer if answers else None, True
+        except FileNotFoundError:
+            pass
+        # ...
+
+        from basis.Session import Session
+
+        Instrument.count('cache misses')
+        session = Session(n, level, oper, minval, maxval, seed, unique, pools, decimals)
+        temp = [self._temporary() for path in wanted]
+        try:
+            session.export(temp[0], answers=temp[1] if answers else None, backend=backend, title=title)
+            for path, written in zip(wanted, temp):
+                replaceFile(written, path)
+            # ...
+        finally:
+            for written in temp:
+                if os.path.exists(written):
+                    os.remove(written)
+                # ...
+            # ...
+        # ...
+        self.evict(keep=wanted)
+        return sheet, answer if answers else None, False
+    # ...
+
+
+    def export(self, filename, level, n, oper=None, minval=1, maxval=10, seed=None, answers=None, unique=False, 
+               pools=None, decimals=DECIMALS, backend='reportlab', title=None):
+        """!
+            @brief Same as Session.export, through the cache: copies the stored files when they exist
+
+            @param filename path of the PDF file
+            @param answers optional path of the answer key
+            @param title [str] optional title written in the header of the pages
+            @return True if the sheet was found in the cache
+        """
+        for attempt in range(FETCH_TRIES):
+            found = self.fetch(level, n, oper, minval, maxval, seed, answers is not None, unique, pools, decimals, 
+                               backend, title)
+            if found is None:
+                break
+            # ...
+            sheet, answer, hit = found
+            try:
+                shutil.copyfile(sheet, filename)
+                if answers is not None:
+                    shutil.copyfile(answer, answers)
+                # ...
+                return hit
+            except FileNotFoundError:
+                # removed by another process since the fetch: fetched again
+                pass
+            # ...
+        # ...
+        from basis.Session import Session
+
+        session = Session(n, level, oper, minval, maxval, seed, unique, pools, decimals)
+        session.export(filename, answers=answers, backend=backend, title=title)
+        return False
+    # ...
+
+
+    def evict(self, keep=()):
+        """!
+            @brief Removes the least recently used sheets until the directory is below its size limit
+
+            @param keep [list] paths not to remove, e.g. the sheet just stored
+            @return number of files removed
+        """
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.pdf') and entry.path not in keep:
+                try:
+                    info = entry.stat()
+                except FileNotFoundError:
+                    continue
+                # ...
+                entries.append((info.st_mtime, info.st_size, entry.path))
+            # ...
+        # ...
+        total = sum(size for mtime, size, path in entries)
+        removed = 0
+        for mtime, size, path in sorted(entries):
+            if total <= self.maxBytes:
+                break
+            # ...
+            try:
+                os.remove(path)
+                removed += 1
+            except FileNotFoundError:
+                # already removed by another process
+                pass
+            # ...
+            total -= size
+        # ...
+        return removed
+    # ...
+
+
+    def _temporary(self):
+        """!
+            @brief New temporary file in the directory of the cache, on the same file system as the sheets
+        """
+        fd, path = tempfile.mkstemp(suffix='.tmp', dir=self.directory)
+        os.close(fd)
+        return path
+    # ...
+
+# ... end class
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""!
+    @brief File helpers of SpeakMaths Trainer software, without dependencies
+"""
+
+##
+# @file basis.Files.py
+#
+# @brief File helpers of SpeakMaths Trainer software, without dependencies
+#
+# @details Shared by basis.Pool and basis.Cache, which write their files under a temporary name then
+# rename them. This module only uses the standard library, so that importing it loads nothing else.
+#
+# @date 2026-10-18
+#
+# @version 1.1
+#
+# @author MBruliard
+##
+
+
+import os
+
+
+def replaceFile(temp, path):
+    """!
+        @brief Renames a file written by tempfile.mkstemp to @param path, with the mode of the files 
+        created by open: 0666 less the umask, where mkstemp gives 0600 and other users could not read it
+    """
+    # the umask is only read by setting it
+    umask = os.umask(0)
+    os.umask(umask)
+    os.chmod(temp, 0o666 & ~umask)
+    os.replace(temp, path)
+# ...
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+"""!
+    @brief Fixed-point numbers of the operations of levels 3 and 4 for SpeakMaths Trainer software
+"""
+
+##
+# @file basis.FixedPoint.py
+#
+# @brief Fixed-point numbers of the operations of levels 3 and 4 for SpeakMaths Trainer software
+#
+# @details The real numbers of levels 3 and 4 have a fixed number of decimals: a number x with d
+# decimals is the integer x * 10**d, its units. They are drawn as units, and the results, the digits
+# and the texts are computed on the units with integer arithmetic:
+#     a + b, a - b    units of a and b added, d decimals
+#     a x b           units multiplied, 2d decimals
+#     a / b           rounded half away from zero to d decimals
+# so that they are exact: 0.1 + 0.2 is written 0.30. Operations keep a and b as floats, the
+# nearest ones to their units, from which toUnits gives back the units exactly: their units must
+# stay below MAX_UNITS, see checkRange. The results are kept as their units, exact Python or int64
+# integers, and as floats for the computations that do not need them exact.
+# The numbers of levels 1 and 2 and of the euclidian divisions of level 3 are integers: 0 decimals.
+#
+# @date 2026-10-18
+#
+# @version 1.1
+#
+# @author MBruliard
+##
+
+
+from decimal import Decimal, InvalidOperation
+
+import numpy as np
+
+
+# Global Constants
+# # Default number of decimals of the real numbers
+DECIMALS = 2
+
+# # Largest number of decimals
+MAX_DECIMALS = 6
+
+# # Largest units of a and b: floats hold exactly the integers below
+MAX_UNITS = 2**53
+
+# # Operators codes, as basis.Operation.CODE_ADD to CODE_DIV
+_ADD, _SUB, _MUL, _DIV = range(4)
+
+
+def checkDecimals(decimals):
+    """!
+        @brief Raises TypeError if @param decimals is not a number of decimals in [0, MAX_DECIMALS]
+    """
+    if not isinstance(decimals, int) or isinstance(decimals, bool) or not 0 <= decimals <= MAX_DECIMALS:
+        raise TypeError("Error: Argument decimals must be an integer between 0 and {0} included".format(MAX_DECIMALS))
+    # ...
+# ...
+
+
+def checkRange(minval, maxval, decimals):
+    """!
+        @brief Raises ValueError if the numbers of [minval, maxval] with @param decimals decimals have units
+        of MAX_UNITS or more, which floats do not hold exactly
+    """
+    if max(abs(minval), abs(maxval)) * 10**decimals >= MAX_UNITS:
+        raise ValueError("Error: minval and maxval must be lower than {0} in absolute value with {1} decimals".format(
+            MAX_UNITS // 10**decimals, decimals))
+    # ...
+# ...
+
+
+def operationDecimals(level, oper, decimals=DECIMALS):
+    """!
+        @brief Numbers of decimals of the numbers of an operation
+
+        @param level [int] difficulty level
+        @param oper [str] operator. See basis.Operation.LIST_OPERATIONS
+        @param decimals [int] decimals of the real numbers of levels 3 and 4
+        @return tuple (decimals of a, of b, of the result)
+    """
+    if level <= 2 or (level == 3 and oper == '/'):
+        return 0, 0, 0
+    elif oper == '/':
+        # level 4: b is an integer
+        return decimals, 0, decimals
+    elif oper == 'x':
+        return decimals, decimals, 2*decimals
+    # ...
+    return decimals, decimals, decimals
+# ...
+
+
+def toUnits(x, decimals):
+    """!
+        @brief Units of a number with @param decimals decimals: the integer x * 10**decimals
+    """
+    if isinstance(x, int):
+        return x * 10**decimals
+    # ...
+    return int(round(x * 10**decimals))
+# ...
+
+
+def numberText(units, decimals):
+    """!
+        @brief Text of a number given by its units, with exactly @param decimals decimals
+
+        @details Integer arithmetic only: the digits of the units, and the decimal point inserted
+    """
+    digits = str(abs(units))
+    if decimals > 0:
+        digits = digits.rjust(decimals + 1, '0')
+        digits = digits[:-decimals] + '.' + digits[-decimals:]
+    # ...
+    return '-' + digits if units < 0 else digits
+# ...
+
+
+def parseUnits(text, decimals):
+    """!
+        @brief Units of a number written as text, read exactly
+
+        @return int, or None if @param text is not a number with at most @param decimals decimals
+    """
+    try:
+        units = Decimal(text).scaleb(decimals)
+    except InvalidOperation:
+        return None
+    # ...
+    if not units.is_finite() or units != units.to_integral_value():
+        return None
+    # ...
+    return int(units)
+# ...
+
+
+def roundDivision(num, den):
+    """!
+        @brief Integer nearest to num / den, halves rounded away from zero. Works on ints and int arrays
+    """
+    q = (2*abs(num) + abs(den)) // (2*abs(den))
+    return np.where((num < 0) != (den < 0), -q, q) if isinstance(q, np.ndarray) else (-q if (num < 0) != (den < 0) else q)
+# ...
+
+
+def resultUnits(a, b, oper, decimals):
+    """!
+        @brief Exact result of an operation of real numbers, in units
+
+        @param a [int] units of a, with @param decimals decimals
+        @param b [int] units of b, with @param decimals decimals, or the integer b of a division
+        @param oper [str] operator
+        @param decimals [int] decimals of a
+        @return units of the result. See operationDecimals for its decimals
+    """
+    if oper == '+':
+        return a + b
+    elif oper == '-':
+        return a - b
+    elif oper == 'x':
+        return a * b
+    # ...
+    return roundDivision(a, b)
+# ...
+
+
+def resultArray(a, b, codes, decimals):
+    """!
+        @brief Results of operations of real numbers, as the floats nearest to their exact values. See unitsArray
+    """
+    return unitsFloats(unitsArray(a, b, codes, decimals), codes, decimals)
+# ...
+
+
+def unitsFloats(units, codes, decimals):
+    """!
+        @brief Floats nearest to exact results of operations of real numbers given by their units. See unitsArray
+    """
+    scale = 10**decimals
+    # integer units divided by a power of 10: the float nearest to the exact result
+    return (units / np.where(codes == _MUL, scale**2, scale)).astype(np.float64)
+# ...
+
+
+def unitsArray(a, b, codes, decimals):
+    """!
+        @brief Vectorized resultUnits: exact results of operations of real numbers, in units
+
+        @param a [numpy.ndarray] first numbers, on the grid of @param decimals decimals
+        @param b [numpy.ndarray] second numbers, on the same grid, or integers for the divisions
+        @param codes [numpy.ndarray] operators codes. See basis.Operation.operatorCodes
+        @param decimals [int] decimals of a
+        @return int64 array of the units of the results, object array of Python integers beyond int64
+    """
+    scale = 10**decimals
+    division = codes == _DIV
+    x = np.rint(a * scale).astype(np.int64)
+    y = np.where(division, b, np.rint(b * scale)).astype(np.int64)
+
+    if len(x) and float(np.abs(x).max()) * float(np.abs(y).max()) >= 2.0**62:
+        # products beyond int64: Python integers
+        x, y = x.astype(object), y.astype(object)
+    # ...
+    product = codes == _MUL
+    units = np.where(product, x * y, x + np.where(codes == _SUB, -y, y))
+    if division.any():
+        units[division] = roundDivision(x[division], y[division])
+    # ...
+    return units
+# ...
+
+
+def tableUnits(level, a, b, codes, decimals=DECIMALS):
+    """!
+        @brief Exact results of operations of any level, in units of their decimals. See operationDecimals
+
+        @details The euclidian divisions give their quotient
+
+        @return int64 array, object array of Python integers beyond int64
+    """
+    division = codes == _DIV
+    decimals = decimals if level >= 3 else 0
+    euclid = division & ((level == 3) | (decimals == 0))
+    units = unitsArray(a, b, codes, decimals)
+    if euclid.any():
+        units[euclid] = np.floor_divide(np.rint(a[euclid]), b[euclid]).astype(np.int64)
+    # ...
+    return units
+# ...
+
+
+def drawUnits(lo, hi, m, rng, excluded=()):
+    """!
+        @brief Draws @param m integers uniformly in [lo, hi], without the values of @param excluded
+
+        @details Retry-free: each integer is drawn among the allowed ones, then shifted over the
+        excluded values lower or equal to it
+
+        @param rng [numpy.random.Generator] random generator
+        @param excluded [list] arrays (or ints) of values to exclude, different on each row and all in [lo, hi]
+        @return int64 array
+    """
+    k = rng.integers(lo, hi - len(excluded) + 1, m)
+    if len(excluded) == 2:
+        excluded = [np.minimum(*excluded), np.maximum(*excluded)]
+    elif len(excluded) > 2:
+        excluded = np.sort(np.broadcast_arrays(*excluded), axis=0)
+    # ...
+    for e in excluded:
+        k += k >= e
+    # ...
+    return k
+# ...
@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+"""!
+    @brief Optional timing of the stages of a sheet and counters for SpeakMaths Trainer software
+"""
+
+##
+# @file basis.Instrument.py
+#
+# @brief Optional timing of the stages of a sheet and counters for SpeakMaths Trainer software
+#
+# @details Disabled per default: stage() then returns a shared empty context and count() returns at
+# once. Once enable() is called, the stages (generation, layout, drawing, save) record their time and
+# the counters (operations, pages, bytes) their values, until disable().
+# Stages can be nested: the time of a stage does not include the time of the stages inside it, so
+# that the times of all the stages add up to the measured time.
+#
+# @date 2026-10-18
+#
+# @version 1.1
+#
+# @author MBruliard
+##
+
+
+import json
+import time
+from contextlib import nullcontext
+
+
+# Global Constants
+# # Context returned by stage() when the instrumentation is disabled
+NULL_STAGE = nullcontext()
+
+# # Current profile, None when disabled
+_profile = None
+
+
+class Profile:
+    """!
+        Definition of the class Profile
+
+        @brief Accumulates the exclusive time of named stages and the value of named counters
+    """
+
+    def __init__(self):
+        """!
+            Class Constructor
+        """
+        # name: [seconds, calls]
+        self.stages = {}
+        # name: value
+        self.counters = {}
+        # stages in progress: [name, start, time of the nested stages]
+        self.stack = []
+    # ...
+
+
+    def enter(self, name):
+        """!
+            @brief Starts the stage @param name
+        """
+        self.stack.append([name, time.perf_counter(), 0.0])
+    # ...
+
+
+    def exit(self):
+        """!
+            @brief Ends the last started stage
+        """
+        name, start, nested = self.stack.pop()
+        elapsed = time.perf_counter() - start
+        record = self.stages.setdefault(name, [0.0, 0])
+        record[0] += elapsed - nested
+        record[1] += 1
+        if self.stack:
+            self.stack[-1][2] += elapsed
+        # ...
+    # ...
+
+
+    def stage(self, name):
+        """!
+            @brief Context timing the stage @param name
+        """
+        return _Stage(self, name)
+    # ...
+
+
+    def timed(self, name, iterable):
+        """!
+            @brief Times as stage @param name the production of each item of @param iterable
+
+            @return generator of the items of @param iterable
+        """
+        iterator = iter(iterable)
+        while True:
+            self.enter(name)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.exit()
+            # ...
+            yield item
+        # ...
+    # ...
+
+
+    def count(self, name, value=1):
+        """!
+            @brief Adds @param value to the counter @param name
+        """
+        self.counters[name] = self.counters.get(name, 0) + value
+    # ...
+
+
+    def merge(self, report):
+        """!
+            @brief Adds the values of a report of another profile, e.g. of another process. See report
+        """
+        for name, record in report['stages'].items():
+            total = self.stages.setdefault(name, [0.0, 0])
+            total[0] += record['seconds']
+            total[1] += record['calls']
+        # ...
+        for name, value in report['counters'].items():
+            self.count(name, value)
+        # ...
+    # ...
+
+
+    def report(self):
+        """!
+            @brief Recorded values as a dictionary that can be saved as JSON
+        """
+        return {
+            'stages': {name: {'seconds': s, 'calls': c} for name, (s, c) in self.stages.items()},
+            'counters': dict(self.counters),
+        }
+    # ...
+
+
+    def summary(self):
+        """!
+            @brief Recorded values as a text table
+        """
+        total = sum(s for s, c in self.stages.values()) or 1.0
+        lines = ["{0:<12} {1:>10} {2:>6} {3:>8}".format('stage', 'seconds', '%', 'calls')]
+        for name, (s, c) in sorted(self.stages.items(), key=lambda item: -item[1][0]):
+            lines.append("{0:<12} {1:>10.4f} {2:>6.1f} {3:>8}".format(name, s, 100*s/total, c))
+        # ...
+        for name, value in sorted(self.counters.items()):
+            lines.append("{0:<12} {1:>10}".format(name, value))
+        # ...
+        return "\n".join(lines)
+    # ...
+
+
+    def dump(self, filename):
+        """!
+            @brief Saves the report as a JSON file
+        """
+        with open(filename, 'w') as f:
+            json.dump(self.report(), f, indent=1)
+        # ...
+    # ...
+
+# ... end class
+
+
+class _Stage:
+    """!
+        @brief Context manager of a stage of a Profile
+    """
+
+    __slots__ = ('profile', 'name')
+
+    def __init__(self, profile, name):
+        self.profile = profile
+        self.name = name
+    # ...
+
+    def __enter__(self):
+        self.profile.enter(self.name)
+        return self
+    # ...
+
+    def __exit__(self, *exc):
+        self.profile.exit()
+        return False
+    # ...
+
+# ... end class
+
+
+# Functions
+def enable():
+    """!
+        @brief Starts recording into a new Profile
+
+        @return the new Profile
+    """
+    global _profile
+    _profile = Profile()
+    return _profile
+# ...
+
+
+def disable():
+    """!
+        @brief Stops recording
+
+        @return the Profile recorded until now, or None
+    """
+    global _profile
+    profile, _profile = _profile, None
+    return profile
+# ...
+
+
+def current():
+    """!
+        @brief Profile being recorded, or None when disabled
+    """
+    return _profile
+# ...
+
+
+def stage(name):
+    """!
+        @brief Context timing the stage @param name, doing nothing when disabled
+    """
+    if _profile is None:
+        return NULL_STAGE
+    # ...
+    return _profile.stage(name)
+# ...
+
+
+def count(name, value=1):
+    """!
+        @brief Adds @param value to the counter @param name, doing nothing when disabled
+    """
+    if _profile is not None:
+        _profile.count(name, value)
+    # ...
+# ...
@@ -0,0 +1,481 @@
+# -*- coding: utf-8 -*-
+"""!
+    @brief Layout engine of the operations on the pages of an exercise sheet
+"""
+
+##
+# @file basis.Layout.py
+#
+# @brief Layout engine of the operations on the pages of an exercise sheet
+#
+# @details Positions follow the coordinates of MyPDF.writeOperation: from the left of the text area
+# and from its top. The layout does not render anything and does not need reportlab.
+# The shapes of the operations of a table are computed from digit matrices, by chunks of DIGITS_CHUNK
+# operations: the characters of all the numbers at once, extracted with NumPy integer divisions, then
+# read by the layout and by the rendering. See digitMatrix and tableShapes. Tables of less than
+# DIGITS_MIN operations are shaped one operation at a time.
+#
+# @date 2026-10-18
+#
+# @version 1.1
+#
+# @author MBruliard
+##
+
+
+import unicodedata
+
+import numpy as np
+
+from basis.Operation import decomposition, LIST_OPERATIONS, CODE_MUL, CODE_DIV
+from basis.OperationTable import OperationTable
+from basis.FixedPoint import operationDecimals, toUnits, numberText
+
+
+# Global Constants
+# # Spacing between two digits of an operation, as in MyPDF.writeOperation
+SPACING = 20
+
+# # Text area of an A4 page of MyPDF (page size minus margins), in pt
+A4_TEXT_AREA = (210*72/25.4 - 50 - 50, 297*72/25.4 - 80 - 100)
+
+# # Number of operations of a table turned into digit matrices at once
+DIGITS_CHUNK = 4096
+
+# # Smallest table whose shapes are read from digit matrices. The matrices cost a fixed time that
+# # smaller tables do not pay back
+DIGITS_MIN = 64
+
+# # Powers of 10 in int64
+POWERS = 10**np.arange(19, dtype=np.int64)
+
+# # Largest units read from digit matrices, where POWERS ends. Larger numbers are written one at a time
+DIGITS_MAX = 10**18
+
+# # Letters missing from WinAnsiEncoding that Unicode does not decompose, written without their stroke
+STROKES = str.maketrans('ŁłĐđĦħıŦŧ', 'LlDdHhiTt')
+
+
+def formatNumber(x, decimals=0):
+    """!
+        @brief Text of a number on a sheet, with exactly @param decimals decimals. See basis.FixedPoint
+    """
+    return numberText(toUnits(x, decimals), decimals)
+# ...
+
+
+def winAnsiText(text):
+    """!
+        @brief Text as written with the standard font of the sheets, in WinAnsiEncoding (cp1252): the 
+        characters it lacks are written without their accent or stroke, e.g. a title "Łucja Dvořák" as 
+        "Lucja Dvorák", else as ?
+    """
+    try:
+        text.encode('cp1252')
+        return text
+    except UnicodeEncodeError:
+        pass
+    # ...
+    chars = []
+    for c in text.translate(STROKES):
+        try:
+            c.encode('cp1252')
+        except UnicodeEncodeError:
+            c = unicodedata.normalize('NFKD', c).encode('cp1252', 'ignore').decode('cp1252') or '?'
+        # ...
+        chars.append(c)
+    # ...
+    return ''.join(chars)
+# ...
+
+
+def numberDecimals(operation):
+    """!
+        @brief Decimals of a, b and the result of an operation. See basis.FixedPoint.operationDecimals
+    """
+    return operationDecimals(operation.level, operation.oper, operation.decimals)
+# ...
+
+
+def resultText(operation):
+    """!
+        @brief Answer of an operation as written in the answer key
+
+        @param operation [basis.Operation] operation
+        @return tuple (result, remainder): quotient and remainder for a division of integers, 
+        else the result and an empty remainder
+    """
+    da, db, dres = numberDecimals(operation)
+    if operation.oper == '/' and da == 0:
+        q, r = divmod(int(operation.a), int(operation.b))
+        return str(q), str(r)
+    # ...
+    return numberText(operation.units, dres), ''
+# ...
+
+
+def operationShape(operation):
+    """!
+        @brief Shape of the drawing of an operation, shared by the layout and the rendering
+
+        @param operation [basis.Operation] operation to draw
+        @return tuple (oper, deca, decb, width, result, remainder): the operator, the characters of a 
+        and b, the width of the drawing in spacings and the answer as given by resultText. For other 
+        operations than divisions, width is also the column of the units, where the numbers and the 
+        answer are right-aligned
+    """
+    da, db, dres = numberDecimals(operation)
+    deca = decomposition(operation.a, da)
+    decb = decomposition(operation.b, db)
+    mla, mlb = len(deca), len(decb)
+    ml = max(mla, mlb)
+    
+    result, remainder = resultText(operation)
+    if operation.oper == '/':
+        # dividend | divisor, with the quotient under the divisor
+        width = max(ml + 1.5, mla + max(mlb, len(result)) + 1.5)
+    elif operation.oper == 'x':
+        # the product may have as many digits as both numbers
+        width = max(ml + 1, mla + mlb, len(result))
+    else:
+        width = max(ml + 1, len(result))
+    # ...
+    return operation.oper, deca, decb, width, result, remainder
+# ...
+
+
+def digitMatrix(units, decimals):
+    """!
+        @brief Characters of numbers, extracted at once with NumPy integer divisions
+
+        @details Each row holds the characters of one number, as numberText in basis.FixedPoint: the
+        digits of its units, with the sign and the decimal point when needed, left-aligned and padded 
+        with null characters
+
+        @param units [numpy.ndarray] units of the numbers, lower than DIGITS_MAX in absolute value. See digitsFit
+        @param decimals [numpy.ndarray] number of decimals of each number
+        @return tuple (matrix [uint32] of the characters codes, lengths [int64] of the rows)
+    """
+    units = np.asarray(units)
+    negative = units < 0
+    units = np.abs(units).astype(np.int64)
+    point = decimals > 0
+
+    # number of digits, at least one before the decimal point
+    digits = np.ones(len(units), dtype=np.int64)
+    rest = units // 10
+    for k in range(len(POWERS)):
+        if not (rest > 0).any():
+            break
+        # ...
+        digits += rest > 0
+        rest //= 10
+    # ...
+    digits = np.maximum(digits, decimals + 1)
+    lengths = digits + point + negative
+
+    matrix = np.zeros((len(units), int(lengths.max(initial=0))), dtype=np.uint32)
+    for c in range(matrix.shape[1]):
+        # position from the right, then rank of the digit
+        p = lengths - 1 - c
+        j = np.clip(p - (point & (p > decimals)), 0, len(POWERS) - 1)
+        char = ord('0') + units // POWERS[j] % 10
+        char = np.where(point & (p == decimals), ord('.'), char)
+        char = np.where(negative & (c == 0), ord('-'), char)
+        matrix[:, c] = np.where(p >= 0, char, 0)
+    # ...
+    return matrix, lengths
+# ...
+
+
+def digitsFit(units):
+    """!
+        @brief True if all the @param units, int64 or Python integers, are lower than DIGITS_MAX in absolute value
+    """
+    return bool(np.all(np.abs(units) < DIGITS_MAX))
+# ...
+
+
+def matrixTexts(matrix):
+    """!
+        @brief Rows of a digit matrix as str
+    """
+    if matrix.shape[1] == 0:
+        return [''] * len(matrix)
+    # ...
+    return np.ascontiguousarray(matrix).view('<U%d' % matrix.shape[1]).ravel().tolist()
+# ...
+
+
+def tableDecimals(level, codes, decimals):
+    """!
+        @brief Vectorized basis.FixedPoint.operationDecimals
+
+        @param codes [numpy.ndarray] operators codes
+        @return tuple of arrays (decimals of a, of b, of the result)
+    """
+    division = codes == CODE_DIV
+    d = decimals if level >= 3 else 0
+    da = np.where(division & (level == 3), 0, d)
+    db = np.where(division, 0, da)
+    return da, db, np.where(codes == CODE_MUL, 2*da, da)
+# ...
+
+
+def tableShapes(table, start=0, stop=None):
+    """!
+        @brief Shapes of the operations of an OperationTable, as operationShape, from digit matrices
+
+        @param table [basis.OperationTable] operations
+        @param start [int] first row
+        @param stop [int] end of the rows. End of the table per default
+        @return list of shapes. See operationShape
+    """
+    stop = len(table) if stop is None else stop
+    a, b, codes, units = table.a[start:stop], table.b[start:stop], table.codes[start:stop], table.units[start:stop]
+    division = codes == CODE_DIV
+    da, db, dres = tableDecimals(table.level, codes, table.decimals)
+
+    if not digitsFit(units):
+        # beyond int64: Python integers, one operation at a time
+        return [operationShape(table[i]) for i in range(start, stop)]
+    # ...
+    # units of a and b, held exactly by the floats. See basis.FixedPoint.checkRange
+    ua = np.rint(a * 10.0**da).astype(np.int64)
+    ub = np.rint(b * 10.0**db).astype(np.int64)
+
+    # integer divisions: the units hold the quotient, then the remainder
+    euclid = division & (da == 0)
+    units = units.astype(np.int64)
+    remainder = np.where(euclid, ua - units*ub, 0)
+
+    # one matrix for the 4 numbers of each operation
+    matrix, lengths = digitMatrix(np.concatenate([ua, ub, units, remainder]), 
+                                  np.concatenate([da, db, dres, np.zeros(len(a), dtype=np.int64)]))
+    texta, textb, textres, textrem = (matrixTexts(rows) for rows in np.split(matrix, 4))
+    la, lb, lres, lrem = np.split(lengths, 4)
+
+    ml = np.maximum(la, lb)
+    width = np.select([division, codes == CODE_MUL],
+                      [np.maximum(ml + 1.5, la + np.maximum(lb, lres) + 1.5), np.maximum(ml + 1, np.maximum(la + lb, lres))],
+                      np.maximum(ml + 1, lres))
+
+    shapes = []
+    for code, x, y, w, q, r, e in zip(codes.tolist(), texta, textb, width.tolist(), textres, textrem, euclid.tolist()):
+        if code == CODE_DIV:
+            shapes.append(('/', x, y, w, q, r if e else ''))
+        else:
+            shapes.append((LIST_OPERATIONS[code], x, y, int(w), q, ''))
+        # ...
+    # ...
+    return shapes
+# ...
+
+
+def operationBox(operation, sp=SPACING, shape=None):
+    """!
+        @brief Size of the drawing of an operation by MyPDF.writeOperation
+
+        @details The box starts one spacing right of and one spacing above the position given to
+        writeOperation. See anchor
+
+        @param operation [basis.Operation] operation to draw
+        @param sp [float] spacing between two digits
+        @param shape [tuple] shape of @param operation if already known. See operationShape
+        @return tuple (width, height)
+    """
+    oper, deca, decb, width, result, remainder = shape or operationShape(operation)
+    if oper == '/':
+        # the vertical line goes from one spacing above to 4 below
+        return width*sp, 5*sp
+    # ...
+    # operator and digits, the rule and the answer dots
+    return width*sp, 4.5*sp
+# ...
+
+
+def operationGlyphs(shape, w, h, sp=SPACING):
+    """!
+        @brief Texts of the drawing of an operation: operator and digits of both numbers
+
+        @param shape [tuple] shape of the operation. See operationShape
+        @param w [float] horizontal position of the operation. See MyPDF.writeOperation
+        @param h [float] vertical position of the operation. See MyPDF.writeOperation
+        @param sp [float] spacing between two digits
+        @return list of (text, w, h)
+    """
+    oper, deca, decb, width, result, remainder = shape
+    mla = len(deca)
+    
+    if oper == '/':
+        # dividend, then divisor on the right of the vertical line
+        return ([(d, w + (j+1)*sp, h) for j, d in enumerate(deca)] + 
+                [(d, w + (mla+j+2)*sp, h) for j, d in enumerate(decb)])
+    # ...
+    # numbers right-aligned on the column of units, operator on the first column
+    return ([(d, w + (width - mla + j + 1)*sp, h) for j, d in enumerate(deca)] + 
+            [(oper, w + sp, h + sp)] + 
+            [(d, w + (width - len(decb) + j + 1)*sp, h + sp) for j, d in enumerate(decb)])
+# ...
+
+
+def answerGlyphs(operation, shape, w, h, sp=SPACING):
+    """!
+        @brief Texts of the answer of an operation, for the answer key
+
+        @param operation [basis.Operation] operation
+        @param shape [tuple] shape of the operation, holding its answer. See operationShape
+        @param w [float] horizontal position of the operation. See MyPDF.writeOperation
+        @param h [float] vertical position of the operation. See MyPDF.writeOperation
+        @param sp [float] spacing between two digits
+        @return list of (text, w, h)
+    """
+    oper, deca, decb, width, result, remainder = shape
+    mla = len(deca)
+    
+    if oper == '/':
+        # quotient under the divisor, remainder right-aligned under the dividend
+        return ([(c, w + (mla+j+2)*sp, h + sp) for j, c in enumerate(result)] + 
+                [(c, w + (mla - len(remainder) + j + 1)*sp, h + 3*sp) for j, c in enumerate(remainder)])
+    # ...
+    # result on the row of the answer dots
+    return [(c, w + (width - len(result) + j + 1)*sp, h + 3*sp) for j, c in enumerate(result)]
+# ...
+
+
+def operationSkeleton(shape, fontsize=12, dots=True, sp=SPACING):
+    """!
+        @brief Static part of the drawing of an operation - rule lines and answer dots - shared by 
+        the PDF backends, which draw it once per shape as a form
+
+        @details Coordinates are in pt from the position given to writeOperation, upwards. The name is the 
+        same with and without the dots: the pages of an exercise sheet and of its answer key draw the 
+        same forms, each file with its own content. See MyPDF.shareStreams
+
+        @param shape [tuple] shape of the operation. See operationShape
+        @param fontsize [int] fontsize of the answer dots
+        @param dots [bool] with the answer dots. No dots on an answer key
+        @return tuple (name of the form, bounding box, lines as (x1, y1, x2, y2), positions (x, y) of the dots)
+    """
+    oper, deca, decb, width = shape[:4]
+    mla = len(deca)
+    ml = max(mla, len(decb))
+    
+    if oper == '/':
+        name = "division_%d_%d" % (mla, ml)
+    else:
+        name = "operation_%d_%d" % (width, fontsize)
+    # ...
+    box = (-sp, -5*sp, (width + 3)*sp, 2*sp)
+    
+    if oper == '/':
+        # the vertical line, then the horizontal line
+        return name, box, [((mla + 1.5)*sp, sp, (mla + 1.5)*sp, -4*sp), (sp, -0.5*sp, (ml + 2.5)*sp, -0.5*sp)], []
+    # ...
+    # the rule, then the results
+    return name, box, [(sp, -2*sp, (width + 1)*sp, -2*sp)], [((i + 1)*sp, -3*sp) for i in range(0, width) if dots]
+# ...
+
+
+def anchor(x, y, sp=SPACING):
+    """!
+        @brief Position to give to MyPDF.writeOperation for a box placed at (x, y)
+    """
+    return x - sp, y + sp
+# ...
+
+
+class Layout:
+    """!
+        Definition of the class Layout
+
+        @brief Shelf packing of boxes into pages: boxes are placed left to right on a shelf, a new
+        shelf starts below the highest box of the previous one, and a new page when the page is full
+    """
+
+    def __init__(self, width=A4_TEXT_AREA[0], height=A4_TEXT_AREA[1], gap=SPACING, top=SPACING):
+        """!
+            Class Constructor
+
+            @param width [float] width of the text area of a page
+            @param height [float] height of the text area of a page
+            @param gap [float] minimal space between two boxes
+            @param top [float] space kept at the top of each page, below the header
+        """
+        self.width = width
+        self.height = height
+        self.gap = gap
+        self.top = top
+
+        # Current page, position on the current shelf and height of the shelf
+        self.page = 0
+        self.x = 0
+        self.y = top
+        self.shelf = 0
+    # ...
+
+
+    def place(self, width, height):
+        """!
+            @brief Place the next box
+
+            @param width [float] width of the box
+            @param height [float] height of the box
+            @return tuple (page, x, y) of the top left corner of the box. Pages start at 0
+        """
+        if self.x > 0 and self.x + width > self.width:
+            self.y += self.shelf + self.gap
+            self.x = 0
+            self.shelf = 0
+        # ...
+        if self.y > self.top and self.y + height > self.height:
+            self.page += 1
+            self.x = 0
+            self.y = self.top
+            self.shelf = 0
+        # ...
+        position = (self.page, self.x, self.y)
+        self.x += width + self.gap
+        self.shelf = max(self.shelf, height)
+        return position
+    # ...
+
+# ... end class
+
+
+def layoutOperations(operations, layout=None):
+    """!
+        @brief Computes the box of each operation and packs it, in one pass
+
+        @details The shapes of an OperationTable, or of a Session, are read from digit matrices. See
+        tableShapes
+
+        @param operations [iterable] operations to place. Can be any iterable or generator
+        @param layout [Layout] packing to use. A4 text area of MyPDF per default
+        @return generator of (operation, shape, page, w, h) where shape is given by operationShape 
+        and (w, h) is the position to give to MyPDF.writeOperation
+    """
+    layout = layout or Layout()
+    for operation, shape in _shapes(operations):
+        page, x, y = layout.place(*operationBox(operation, shape=shape))
+        yield (operation, shape, page) + anchor(x, y)
+    # ...
+# ...
+
+
+def _shapes(operations):
+    """!
+        @brief Operations with their shapes: by chunks of digit matrices for a table, else one at a time
+    """
+    table = getattr(operations, 'table', operations)
+    if not isinstance(table, OperationTable) or len(table) < DIGITS_MIN:
+        for operation in operations:
+            yield operation, operationShape(operation)
+        # ...
+        return
+    # ...
+    for start in range(0, len(table), DIGITS_CHUNK):
+        stop = min(start + DIGITS_CHUNK, len(table))
+        yield from zip((table[i] for i in range(start, stop)), tableShapes(table, start, stop))
+    # ...
+# ...
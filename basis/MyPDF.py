@@ -16,13 +16,25 @@
 ##
 
 
+import os
 from math import floor
-from basis.Operation import decomposition
 
+from basis import Instrument
+from basis.Layout import operationShape, operationGlyphs, answerGlyphs, operationSkeleton, winAnsiText
+
+import reportlab
+from reportlab import rl_config
 from reportlab.lib.pagesizes import A4
+from reportlab.lib.rl_accel import escapePDF
+from reportlab.pdfbase import pdfdoc
 from reportlab.pdfgen import canvas
 
 
+# Global Constants
+# # reportlab versions whose pages take content streams encoded by MyPDF.encodePage
+SHARED_STREAMS = int(reportlab.Version.split('.')[0]) >= 3
+
+
 class MyPDF (canvas.Canvas): 
     """!
         The PDF Writing class
@@ -30,11 +42,14 @@ class MyPDF (canvas.Canvas):
         Definition of the class MyPDF that create a PDF file from a list of operations stored in @class Session
     """    
     
-    def __init__ (self, filename):
+    def __init__ (self, filename, batchText=True, title=None):
         """!
             @brief Class constructor
             
             @param filename local path to save the PDF file obtain 
+            @param batchText [bool] collect all the text of a page into one text object. 
+            One text operation per call of writeText otherwise
+            @param title [str] optional title written in the header of the pages of the first sheet
         """
         super().__init__(filename, pagesize=A4)
         
@@ -45,6 +60,26 @@ class MyPDF (canvas.Canvas):
         self.marginLeft = 50
         self.marginRight = 50;
         
+        # Text operations of the current page and their font state
+        self.batchText = batchText
+        self.pageText = None
+        self.pageFont = None
+        self.fontName = self._doc.getInternalFontName("Helvetica")
+        
+        # Text operations of the answers of the current page, drawn after the page content, the 
+        # last page content encoded, and the sheet whose encoded pages are reused, see shareStreams
+        self.answerText = None
+        self.answerFont = None
+        self.lastPage = None
+        self.partner = None
+        
+        # Whether the skeleton forms have answer dots, by name. See operationSkeleton
+        self.skeletons = {}
+        
+        # First page and title of the current sheet
+        self.sheetPage = 1
+        self.title = title
+        
         self.writeHeader()
           
     # ...
@@ -62,17 +97,218 @@ class MyPDF (canvas.Canvas):
     # ...
     
     
+    def newSheet(self, title=None):
+        """!
+            @brief Starts a new sheet on a new page: its pages have their own header, title and numbers from 1
+            
+            @param title [str] optional title written in the header of the pages of the sheet
+        """
+        self.showPage()
+        self.sheetPage = self.getPageNumber()
+        self.title = title
+        self.writeHeader()
+    # ...
+    
+    
+    def showPage(self):
+        """!
+            @brief Close the current page, after drawing its text object and the text object of its answers
+        """
+        self.flushText()
+        answers = None
+        if self.answerText is not None:
+            self.answerText.append("ET")
+            answers = "\n".join(self.answerText)
+            self.answerText = None
+            self.answerFont = None
+        # ...
+        if answers is not None and not SHARED_STREAMS:
+            self.addLiteral(answers)
+        # ...
+        super().showPage()
+        if SHARED_STREAMS:
+            self.encodePage(answers)
+        # ...
+        Instrument.count('pages')
+    # ...
+    
+    
+    def save(self):
+        """!
+            @brief Save the PDF file, after drawing the text object of the last page
+        """
+        with Instrument.stage('save'):
+            self.flushText()
+            super().save()
+        # ...
+        if Instrument.current() is not None:
+            Instrument.count('bytes', self.fileSize())
+        # ...
+    # ...
+    
+    
+    def shareStreams(self, sheet):
+        """!
+            @brief Reuses the encoded pages of @param sheet, whose pages this file draws again, then writes
+            the answers on them: its answer key. See basis.Session.writeOperations
+            
+            @details A page is reused when its content is the same as the last page closed by @param sheet.
+            The answers are a content stream of their own, after the page
+            
+            @param sheet [MyPDF] exercise sheet, whose pages are closed before the ones of this file
+        """
+        self.partner = sheet
+    # ...
+    
+    
+    def encodePage(self, answers=None):
+        """!
+            @brief Encodes the content stream of the page just closed, or takes it from the sheet of 
+            shareStreams when its last page has the same content, then adds the stream of the answers
+            
+            @details reportlab encodes the single content stream of a page when the file is saved, and 
+            has no public API for more streams or for encoded ones: this method sets the Contents of the 
+            last reportlab.pdfbase.pdfdoc.PDFPage itself, as PDFPage.check_format does. It relies on the 
+            page objects of the reportlab versions of SHARED_STREAMS
+            
+            @param answers [str] text object of the answers of the page, None if there are none
+        """
+        page = self._doc.Pages.pages[-1]
+        filters = []
+        if page.compression:
+            filters = [pdfdoc.PDFBase85Encode, pdfdoc.PDFZCompress] if rl_config.useA85 else [pdfdoc.PDFZCompress]
+        # ...
+        content = page.stream
+        last = self.partner.lastPage if self.partner is not None else None
+        if last is not None and last[0] == content and last[1] == filters:
+            encoded = last[2]
+        else:
+            encoded = content
+            for f in reversed(filters):
+                encoded = f.encode(encoded)
+            # ...
+        # ...
+        self.lastPage = (content, filters, encoded)
+        page.stream = None
+        
+        # with its Filter entry, the stream is written as is
+        entries = {"Filter": pdfdoc.PDFArray([pdfdoc.PDFName(f.pdfname) for f in filters])} if filters else {}
+        stream = pdfdoc.PDFStream(pdfdoc.PDFDictionary(entries), encoded)
+        if answers is None:
+            page.Contents = stream
+            return
+        # ...
+        page.Contents = pdfdoc.PDFArray([self._doc.Reference(stream), 
+                                         self._doc.Reference(pdfdoc.PDFStream(content=answers, filters=filters or None))])
+    # ...
+    
+    
+    def fileSize(self):
+        """!
+            @brief Size of the saved PDF file in bytes
+        """
+        if isinstance(self._filename, str):
+            return os.path.getsize(self._filename)
+        # ...
+        return self._filename.tell()
+    # ...
+    
+    
+    def flushText(self):
+        """!
+            @brief Draw the text collected on the current page as one text object
+        """
+        if self.pageText is not None:
+            self.pageText.append("ET")
+            self.addLiteral("\n".join(self.pageText))
+            self.pageText = None
+            self.pageFont = None
+        # ...
+    # ...
+    
+    
     def writeText(self, text, w, h, fontsize=12):
         """!
             @brief write some text on the PDF file.
             
+            @details With batchText, the text goes into the text object of the page, as 
+            pre-formatted text operations, and the font is only set when it changes. The characters 
+            outside of WinAnsiEncoding are replaced, see basis.Layout.winAnsiText
+            
             @param text [str]   text to write
             @param w    [float] horizontal position of the text. Start from the left
             @param h    [float] vertical position of the text. Start from the top
             @param fontsize [int] define the fontsize of the text. Set at 12pt per default
         """
-        self.setFont("Helvetica", fontsize)
-        self.drawString(self.marginLeft + w, self.height - self.marginTop - h, text)
+        text = winAnsiText(text)
+        if not self.batchText:
+            self.setFont("Helvetica", fontsize)
+            self.drawString(self.marginLeft + w, self.height - self.marginTop - h, text)
+            return
+        # ...
+        # the bytes of WinAnsiEncoding, as escaped by escapePDF
+        text = text.encode('cp1252').decode('latin-1')
+        self.writeGlyphs(self.formatGlyphs([(text, w, h)]), fontsize)
+    # ...
+    
+    
+    def formatGlyphs(self, glyphs):
+        """!
+            @brief Text operations of many texts, formatted once to be written on one or many files. See writeGlyphs
+            
+            @param glyphs [list] texts to write as (text, w, h). See basis.Layout.operationGlyphs
+            @return str with batchText, else the list of the texts, drawn one at a time
+        """
+        if not self.batchText:
+            return list(glyphs)
+        # ...
+        return "\n".join(["1 0 0 1 %.2f %.2f Tm (%s) Tj" % (self.marginLeft + w, self.height - self.marginTop - h, 
+                                                            escapePDF(text)) for text, w, h in glyphs])
+    # ...
+    
+    
+    def writeGlyphs(self, text, fontsize=12, answer=False):
+        """!
+            @brief Writes text operations formatted by formatGlyphs into the text object of the page
+            
+            @param text formatted text operations. See formatGlyphs
+            @param fontsize [int] fontsize of the text
+            @param answer [bool] write them into the text object of the answers, drawn after the page. See shareStreams
+        """
+        if not text:
+            return
+        # ...
+        if not self.batchText:
+            self.setFont("Helvetica", fontsize)
+            for string, w, h in text:
+                self.drawString(self.marginLeft + w, self.height - self.marginTop - h, string)
+            # ...
+            return
+        # ...
+        if answer:
+            self.answerText, self.answerFont = self.appendText(self.answerText, self.answerFont, text, fontsize)
+        else:
+            self.pageText, self.pageFont = self.appendText(self.pageText, self.pageFont, text, fontsize)
+        # ...
+    # ...
+    
+    
+    def appendText(self, operations, font, text, fontsize):
+        """!
+            @brief Appends formatted text operations to a text object, and sets the font when it changes
+            
+            @param operations [list] text object, None if not started
+            @param font [int] fontsize set in the text object
+            @return tuple (text object, fontsize set)
+        """
+        if operations is None:
+            operations = ["BT"]
+        # ...
+        if font != fontsize:
+            operations.append("%s %s Tf" % (self.fontName, fontsize))
+        # ...
+        operations.append(text)
+        return operations, fontsize
     # ...
     
     
@@ -95,86 +331,127 @@ class MyPDF (canvas.Canvas):
     def writeHeader(self):
         """!
             @brief defines the Header style of a page. Used on each page of the PDF file
+            
+            @details The static part of the header is a form XObject defined once and reused on every page
         """
-        self.writeParagraph("Printed with SpeakMath Trainer", self.marginLeft, 
-                            -25, fontsize=10)
-        self.writeText("Page %s" % self.getPageNumber(), 
+        if not self.hasForm('header'):
+            self.beginForm('header')
+            self.writeParagraph("Printed with SpeakMath Trainer", self.marginLeft, 
+                                -25, fontsize=10)
+            self.line(self.marginLeft, self.height - self.marginTop, 
+                      self.width - self.marginRight,  self.height - self.marginTop)
+            self.endForm()
+        # ...
+        self.doForm('header')
+        
+        if self.title:
+            self.writeText(self.title, 0, -45, fontsize=14)
+        # ...
+        self.writeText("Page %s" % (self.getPageNumber() - self.sheetPage + 1), 
                        self.width - 3*self.marginRight, 
                        -25, fontsize=10)
-        
-        self.line(self.marginLeft, self.height - self.marginTop, 
-                  self.width - self.marginRight,  self.height - self.marginTop)
     # ...
     
     
-    def writeOperation(self, operation, w, h, fontsize=12):
+    def operationSkeleton(self, shape, fontsize=12, dots=True):
         """!
-            @brief Display a well-posed elementary operation
+            @brief Static part of the layout of an operation - rule lines and answer dots - as a 
+            form XObject, defined once per shape and reused by every operation of this shape
             
-            @param operation [basis.Operation]  Operation to display
-            @param w    [float] horizontal position of the text. Start from the left
-            @param h    [float] vertical position of the text. Start from the top
-            @param fontsize [int] define the fontsize of the text. Set at 12pt per default
+            @details The origin of the form is the position of the operation given to writeOperation. 
+            See basis.Layout.operationSkeleton. A file drawing a skeleton both with and without dots 
+            has a form for each
+            
+            @param shape [tuple] shape of the operation. See basis.Layout.operationShape
+            @param fontsize [int] fontsize of the answer dots
+            @param dots [bool] draw the answer dots. No dots on an answer key
+            @return name of the form
         """
+        name, box, lines, points = operationSkeleton(shape, fontsize, dots)
+        if self.skeletons.setdefault(name, bool(points)) != bool(points):
+            name = "dots_" + name if points else "rule_" + name
+        # ...
+        if self.hasForm(name):
+            return name
+        # ...
         
-        self.setFont("Helvetica", fontsize)
-        
-        # find max length 
-        deca = decomposition(operation.a)
-        decb = decomposition(operation.b)
-        mla = len(deca)
-        mlb = len(decb)
-        
-        ml = max(mla, mlb)
-        
-        # spacing
-        sp = 20
-        
-        if operation.oper == '/':
-            
-            # line 1
-            for j in range(0, mla):
-                self.writeText(str(deca[j]), w + (j+1)*sp, h)
-            # ...
-            for j in range(0, mlb):
-                self.writeText(str(deca[j]), w + + sp +(mla+j+1)*sp, h)
+        self.beginForm(name, *box)
+        for line in lines:
+            self.line(*line)
+        # ...
+        if points:
+            self.setFont("Helvetica", fontsize)
+            for x, y in points:
+                self.drawString(x, y, ".")
             # ...
+        # ...
+        self.endForm()
+        return name
+    # ...
+    
+    
+    def drawOperation(self, shape, glyphs, w, h, fontsize=12, dots=True):
+        """!
+            @brief Display an operation from its shape and its texts
             
-            # then we draw the vertical line
-            self.line(w + self.marginLeft + (mla + 1.5)*sp, 
-                      self.height - self.marginTop - (h - sp), 
-                      w + self.marginLeft + (mla + 1.5)*sp, 
-                      self.height - self.marginTop - (h + 4*sp))
-            
-            # then we draw the horizontal line
-            self.line(w + self.marginLeft + sp, 
-                      self.height - self.marginTop - (h + 0.5*sp), 
-                      w + self.marginLeft + (ml+2.5)*sp, 
-                      self.height - self.marginTop - (h + 0.5*sp))
+            @param shape [tuple] shape of the operation. See basis.Layout.operationShape
+            @param glyphs [list] texts to write as (text, w, h). See basis.Layout.operationGlyphs
+            @param w    [float] horizontal position of the operation. Start from the left
+            @param h    [float] vertical position of the operation. Start from the top
+            @param fontsize [int] define the fontsize of the text. Set at 12pt per default
+            @param dots [bool] draw the answer dots
+        """
+        self.drawFragment(shape, self.operationFragment(glyphs, w, h), fontsize, dots)
+    # ...
+    
+    
+    def operationFragment(self, glyphs, w, h):
+        """!
+            @brief Content of an operation formatted once, to be drawn on an exercise sheet and on its 
+            answer key: the position of its skeleton and the texts of its operands. See drawFragment
             
-        else:
-            # first we draw the value of a
-            for j in range(0, mla):
-                self.writeText(str(deca[j]), w + (ml - mla + 1)*sp + (j+1)*sp, h)
-            # ...
+            @param glyphs [list] texts to write as (text, w, h). See basis.Layout.operationGlyphs
+            @param w    [float] horizontal position of the operation. Start from the left
+            @param h    [float] vertical position of the operation. Start from the top
+            @return tuple (position of the skeleton, formatted texts). See formatGlyphs
+        """
+        return "q 1 0 0 1 %.4f %.4f cm" % (self.marginLeft + w, self.height - self.marginTop - h), self.formatGlyphs(glyphs)
+    # ...
+    
+    
+    def drawFragment(self, shape, fragment, fontsize=12, dots=True):
+        """!
+            @brief Display an operation from its shape and its fragment. See operationFragment
             
-            # second line
-            self.writeText(operation.oper, w + sp, h + sp)
-            for j in range(0, mlb):
-                self.writeText(str(decb[j]), w + (ml - mlb + 1)*sp + (j+1)*sp, h+sp)
-            # ...
+            @param shape [tuple] shape of the operation. See basis.Layout.operationShape
+            @param fragment [tuple] formatted content of the operation
+            @param fontsize [int] define the fontsize of the text. Set at 12pt per default
+            @param dots [bool] draw the answer dots
+        """
+        position, text = fragment
+        # rule lines and answer dots, at the position of the operation
+        name = self.operationSkeleton(shape, fontsize, dots)
+        self.addLiteral(position)
+        self.doForm(name)
+        self.addLiteral("Q")
+        self.writeGlyphs(text, fontsize)
+    # ...
+    
+    
+    def writeOperation(self, operation, w, h, fontsize=12, answer=False):
+        """!
+            @brief Display a well-posed elementary operation
             
-            # trace
-            self.line(w + self.marginLeft + sp, 
-                      self.height - self.marginTop - (h + 2*sp), 
-                      w + self.marginLeft + (ml+2)*sp, 
-                      self.height - self.marginTop - (h + 2*sp))
-                    
-            # results
-            for i in range(0, ml+1):
-                self.writeText(".", w+(ml+1)*sp, h + 3*sp)
-            # ...
+            @param operation [basis.Operation]  Operation to display
+            @param w    [float] horizontal position of the text. Start from the left
+            @param h    [float] vertical position of the text. Start from the top
+            @param fontsize [int] define the fontsize of the text. Set at 12pt per default
+            @param answer [bool] write the answer in place of the answer dots
+        """
+        shape = operationShape(operation)
+        self.drawOperation(shape, operationGlyphs(shape, w, h), w, h, fontsize, dots=not answer)
+        if answer:
+            self.writeGlyphs(self.formatGlyphs(answerGlyphs(operation, shape, w, h)), fontsize, answer=True)
         # ...
-        
     # ...
 # ....
\ No newline at end of file
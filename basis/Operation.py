@@ -16,14 +16,32 @@
 ##
 
 
-from random import randint, uniform
-from math import floor
+from random import randint
+
+import numpy as np
+
+from basis.Sampling import sampleLevelOne, sampleLevelTwo, sampleLevelThree, sampleLevelFour
+from basis.Sampling import domainSize, enumerable, enumerateDomain
+from basis.Pool import drawPooled
+from basis.FixedPoint import DECIMALS, checkDecimals, checkRange, operationDecimals, toUnits, numberText, resultUnits, resultArray, unitsFloats, tableUnits
 
 
 # Global Constants
 # # Authorized characters as operation
 LIST_OPERATIONS =  ['+', '-', 'x', '/'];
 
+# # Operators codes used by the vectorized generator: position in LIST_OPERATIONS
+CODE_ADD, CODE_SUB, CODE_MUL, CODE_DIV = range(len(LIST_OPERATIONS))
+
+# # Unique operations: least part of new operations among the last draws before sampling the rest 
+# # without replacement from the enumerated domain
+UNIQUE_MIN_ACCEPTANCE = 0.5
+# # Unique operations: the domain is enumerated when it is smaller than this many times the missing 
+# # operations. Enumerating costs about 10 times less per element than drawing with the set
+UNIQUE_DOMAIN_RATIO = 10
+# # Unique operations: batches without any new operation before giving up, when the domain is too large to be enumerated
+UNIQUE_MAX_FAILURES = 100
+
 
 class Operation:
     """!
@@ -33,7 +51,7 @@ class Operation:
     """
     
     
-    def __init__(self, level=1, a=0, b=0, oper="+", minval=1, maxval=10):
+    def __init__(self, level=1, a=0, b=0, oper="+", minval=1, maxval=10, decimals=DECIMALS):
         """!
             Class Constructor    
             
@@ -43,6 +61,8 @@ class Operation:
             @param oper [str] character representing the type of operation
             @param minval [float] minimal value to generate randomly @param a and @param b
             @param maxval [float] maximal value to generate randomly @param a and @param b
+            @param decimals [int] decimals of the real numbers of levels 3 and 4. @param a and @param b 
+            are rounded to them. See basis.FixedPoint
                         
         """
         if not isinstance(a, int) and not isinstance(a,float):
@@ -54,6 +74,7 @@ class Operation:
         if (LIST_OPERATIONS + [None]).count(oper) == 0:
              raise TypeError("Error: parameter 'oper' must as value in LIST_OPERATIONS")
         # ...
+        checkDecimals(decimals)
         
         
         if oper is None:
@@ -62,11 +83,14 @@ class Operation:
         # ...
         
         self.level = level;
-        self.a = float(a);
-        self.b = float(b);
+        self.decimals = decimals;
         self.oper = oper;
+        da, db, dres = operationDecimals(level, oper, decimals)
+        self.a = toUnits(a, da) / 10**da;
+        self.b = toUnits(b, db) / 10**db;
         
-        while (self.a == self.b) or (self.a == 0) or (self.b == 0) :
+        # the samplers draw directly a valid couple: no retry needed
+        if (self.a == self.b) or (self.a == 0) or (self.b == 0) :
             if level == 1:
                 self.generateLevelOneNumbers();
             elif level == 2:
@@ -78,11 +102,57 @@ class Operation:
             # ...
         # ...
     
+        self.units = self.computeUnits()
         self.res = self.computeResult();
 
     # ...
     
     
+    @staticmethod
+    def generateBatch(level, n, opers=None, minval=1, maxval=10, rng=None, unique=False, pools=None, decimals=DECIMALS, 
+                      units=False):
+        """!
+            @brief Generate @param n operations at once as NumPy arrays
+            
+            @details Follows the rules of generateLevelOneNumbers to generateLevelFourNumbers,
+            drawing whole arrays of valid operands (a != b, a != 0, b != 0) with the batch 
+            samplers of basis.Sampling instead of one Operation at a time.
+            
+            @param level [int] difficulty level
+            @param n [int] number of operations to generate
+            @param opers [list] operators allowed in the batch. See LIST_OPERATIONS. All of them per default
+            @param minval [float] minimal value to generate randomly a and b
+            @param maxval [float] maximal value to generate randomly a and b
+            @param rng [numpy.random.Generator|int] random generator or seed. A fresh generator per default
+            @param unique [bool] never give twice the same operation (a, oper, b). See generateUnique
+            @param pools optional directory of the pools to draw from. See basis.Pool
+            @param decimals [int] decimals of the real numbers of levels 3 and 4. See basis.FixedPoint
+            @param units [bool] also return the exact results, in units. See basis.FixedPoint.tableUnits
+            
+            @return tuple (a, b, codes, res) of arrays of length @param n. codes [uint8] are positions in LIST_OPERATIONS.
+            (a, b, codes, res, units) with @param units
+        """
+        rng = np.random.default_rng(rng)
+        if level >= 2:
+            checkRange(minval, maxval, decimals if level >= 3 else 0)
+        # ...
+        
+        if unique:
+            a, b, codes = generateUnique(level, n, opers, minval, maxval, rng, pools, decimals)
+        else:
+            codes = operatorCodes(opers)
+            codes = codes[rng.integers(0, len(codes), n)]
+            
+            a, b = drawPooled(level, codes == CODE_DIV, minval, maxval, rng, pools, decimals)
+        # ...
+        if units:
+            exact = tableUnits(level, a, b, codes, decimals)
+            return a, b, codes, computeResults(a, b, codes, level, decimals, exact), exact
+        # ...
+        return a, b, codes, computeResults(a, b, codes, level, decimals)
+    # ...
+    
+    
     def __str__(self):
         """!
             @brief Redefines the standard console output of the class
@@ -93,7 +163,13 @@ class Operation:
     def computeResult(self):
         """!
             @brief Compute the solution of the operation        
+            
+            @details Exact for the real numbers of levels 3 and 4, computed on their units. See basis.FixedPoint
         """
+        da, db, dres = operationDecimals(self.level, self.oper, self.decimals)
+        if da > 0:
+            return self.computeUnits() / 10**dres
+        # ...
         if self.oper == "+":
             return self.a + self.b
         elif self.oper == "-":
@@ -105,6 +181,20 @@ class Operation:
         # ...
     # ...
     
+    
+    def computeUnits(self):
+        """!
+            @brief Exact solution of the operation, in units of its decimals: an integer. See basis.FixedPoint
+            
+            @details An euclidian division gives its quotient
+        """
+        da, db, dres = operationDecimals(self.level, self.oper, self.decimals)
+        if self.oper == "/" and da == 0:
+            return int(self.a) // int(self.b)
+        # ...
+        return resultUnits(toUnits(self.a, da), toUnits(self.b, db), self.oper, da)
+    # ...
+    
      
     def generateLevelOneNumbers(self):
         """
@@ -113,11 +203,7 @@ class Operation:
             @details Level 1 : values between 1 and 10. Pas de retenue: a > b
         """
         
-        a = randint(1, 10);
-        b = randint(a, 10);
-        
-        self.b = a;
-        self.a = b;
+        self.a, self.b = sampleLevelOne()
     # ...
     
     
@@ -131,14 +217,7 @@ class Operation:
             @param maxval [float] maximal value to generate randomly @param a and @param b
         """    
         
-        self.a = randint(minval, maxval);
-        
-        dec = decomposition(self.a);
-        b = [];
-        for i in range(0, len(dec)):
-            b.append(randint(0, dec[i]));
-        # ...
-        self.b = int(''.join([str(i) for i in b]))    
+        self.a, self.b = sampleLevelTwo(minval, maxval)
     # ...
     
     def generateLevelThreeNumbers(self, minval, maxval):
@@ -151,13 +230,7 @@ class Operation:
             @param maxval [float] maximal value to generate randomly @param a and @param b
         """    
         
-        self.a = uniform(minval, maxval)
-        self.b = uniform(minval, maxval)
-        
-        if self.oper == "/":
-            self.b = randint(1, 9);
-            self.a = randint(1, 100)*self.b;
-        # ...
+        self.a, self.b = sampleLevelThree(minval, maxval, self.oper == "/", self.decimals)
     # ...
     
     def generateLevelFourNumbers(self, minval, maxval):
@@ -168,28 +241,169 @@ class Operation:
             @param maxval [float] maximal value to generate randomly @param a and @param b
         """    
         
-        self.a = uniform(minval, maxval)
-        self.b = uniform(minval, maxval)
-        if self.oper == "/":
-            self.b = randint(2, floor(min(self.a, self.b)));
-        # ...  
+        self.a, self.b = sampleLevelFour(minval, maxval, self.oper == "/", self.decimals)
     # ...
     
 # ... end class
 
 
 # Functions
-def decomposition(n):
+def decomposition(n, decimals=0):
     """!
         Generates the base 10 decomposition of a number
         
-        @param n [int] integer number
-        @return base 10 decomposition of @parma n in a list 
+        @param n [int|float] number, with at most @param decimals decimals
+        @param decimals [int] number of decimals written
+        @return characters of @param n written in base 10 in a list: its digits, with the sign and the 
+        decimal point when needed. See basis.FixedPoint.numberText
+    """
+    return list(numberText(toUnits(n, decimals), decimals))
+# ...
+
+
+def operatorCodes(opers=None):
+    """!
+        Converts a list of operators into their codes
+        
+        @param opers [list|str] operators symbols. See LIST_OPERATIONS. All of them per default
+        @return array [uint8] of the positions of @param opers in LIST_OPERATIONS
+    """
+    if opers is None or len(opers) == 0:
+        opers = LIST_OPERATIONS
+    # ...
+    if type(opers) is str:
+        opers = [opers]
+    # ...
+    for o in opers:
+        if LIST_OPERATIONS.count(o) == 0:
+            raise TypeError("Error: parameter 'opers' must only contain values of LIST_OPERATIONS")
+        # ...
+    # ...
+    return np.array([LIST_OPERATIONS.index(o) for o in opers], dtype=np.uint8)
+# ...
+
+
+def computeResults(a, b, codes, level=1, decimals=DECIMALS, units=None):
+    """!
+        Vectorized version of Operation.computeResult
+        
+        @param a [numpy.ndarray] first numbers
+        @param b [numpy.ndarray] second numbers
+        @param codes [numpy.ndarray] operators codes. See operatorCodes
+        @param level [int] difficulty level
+        @param decimals [int] decimals of the real numbers of levels 3 and 4. See basis.FixedPoint
+        @param units [numpy.ndarray] exact solutions if already known. See basis.FixedPoint.tableUnits
+        @return array of the solutions
     """
-    result = []
-    while n > 0:
-        result.append(n % 10)
-        n = n // 10
+    if level == 4 and decimals > 0:
+        # real numbers: exact results on their units
+        return resultArray(a, b, codes, decimals) if units is None else unitsFloats(units, codes, decimals)
+    # ...
+    with np.errstate(divide='ignore', invalid='ignore'):
+        res = np.select([codes == CODE_ADD, codes == CODE_SUB, codes == CODE_MUL],
+                        [a + b, a - b, a * b], a / b)
+    # ...
+    if level == 3 and decimals > 0:
+        # real numbers, but the euclidian divisions
+        real = codes != CODE_DIV
+        if units is None:
+            res[real] = resultArray(a[real], b[real], codes[real], decimals)
+        else:
+            res[real] = unitsFloats(units[real], codes[real], decimals)
+        # ...
+    # ...
+    return res
+# ...
+
+
+def generateUnique(level, n, opers, minval, maxval, rng, pools=None, decimals=DECIMALS):
+    """!
+        Draws @param n different operations (a, oper, b)
+        
+        @details The operations are drawn by batches and the ones already given are dropped, using a set 
+        of (a, code, b). When less than UNIQUE_MIN_ACCEPTANCE of a batch is new, or when the remaining 
+        domain is less than UNIQUE_DOMAIN_RATIO times the missing operations, the rest is sampled without 
+        replacement from the enumerated domain: the same distribution as dropping the repeated operations, 
+        at a cost which does not grow when @param n comes close to the size of the domain. The real numbers 
+        are on a finite grid too, enumerated up to basis.Sampling.ENUMERATION_MAX couples. Beyond it, 
+        ValueError after UNIQUE_MAX_FAILURES batches without any new operation.
+        See Operation.generateBatch for the parameters
+        
+        @return tuple (a, b, codes) of arrays of length @param n
+    """
+    allowed, weights = np.unique(operatorCodes(opers), return_counts=True)
+    sizes = [domainSize(level, code == CODE_DIV, minval, maxval, decimals) for code in allowed]
+    if n > sum(sizes):
+        raise ValueError("Error: only {0} different operations with these parameters".format(sum(sizes)))
+    # ...
+    finite = all(enumerable(level, code == CODE_DIV, size) for code, size in zip(allowed, sizes))
+    # ...
+    
+    seen = set()
+    parts = []
+    missing = n
+    acceptance = 1.0
+    failures = 0
+    while missing > 0:
+        if finite and (acceptance < UNIQUE_MIN_ACCEPTANCE or UNIQUE_DOMAIN_RATIO*missing >= sum(sizes) - len(seen)):
+            parts.append(_sampleDomain(level, allowed, weights, minval, maxval, parts, missing, rng, decimals))
+            break
+        # ...
+        codes = allowed[np.searchsorted(np.cumsum(weights), rng.integers(0, weights.sum(), missing), side='right')]
+        a, b = drawPooled(level, codes == CODE_DIV, minval, maxval, rng, pools, decimals)
+        keep = []
+        for i, key in enumerate(zip(a.tolist(), codes.tolist(), b.tolist())):
+            if key not in seen:
+                seen.add(key)
+                keep.append(i)
+            # ...
+        # ...
+        parts.append((a[keep], b[keep], codes[keep]))
+        acceptance = len(keep) / missing
+        missing -= len(keep)
+        failures = 0 if keep else failures + 1
+        if failures >= UNIQUE_MAX_FAILURES:
+            raise ValueError("Error: no new operation in {0} draws after {1} different operations, out of {2}: "
+                             "ask for fewer operations".format(UNIQUE_MAX_FAILURES, len(seen), sum(sizes)))
+        # ...
+    # ...
+    return tuple(np.concatenate(column) for column in zip(*parts))
+# ...
+
+
+def _sampleDomain(level, allowed, weights, minval, maxval, parts, m, rng, decimals=DECIMALS):
+    """!
+        Samples @param m operations without replacement from the enumerated domain, without the 
+        operations of @param parts
+        
+        @details Weighted sampling without replacement by exponential keys (Efraimidis-Spirakis): 
+        the @param m largest keys log(u)/p come in the order of successive draws
+        
+        @return tuple (a, b, codes) of arrays of length @param m
+    """
+    a, b, codes, p = [], [], [], []
+    for code, weight in zip(allowed, weights):
+        x, y, q = enumerateDomain(level, code == CODE_DIV, minval, maxval, decimals)
+        a.append(x)
+        b.append(y)
+        codes.append(np.full(len(x), code, dtype=np.uint8))
+        p.append(q * weight)
+    # ...
+    a, b, codes, p = (np.concatenate(column) for column in (a, b, codes, p))
+    
+    # one int64 per operation, from the units of a and b on the grid of the decimals
+    scale = 10**decimals if level >= 3 else 1
+    units = lambda x: np.rint(x*scale).astype(np.int64)
+    low, high = min(units(a).min(), units(b).min()), max(units(a).max(), units(b).max())
+    span = high - low + 1
+    encode = lambda x, y, c: ((units(x) - low)*len(LIST_OPERATIONS) + c)*span + units(y) - low
+    if parts:
+        done = np.concatenate([encode(x, y, c) for x, y, c in parts])
+        free = ~np.isin(encode(a, b, codes), done)
+        a, b, codes, p = a[free], b[free], codes[free], p[free]
     # ...
-    return result[::-1];
-# ...
\ No newline at end of file
+    keys = -rng.exponential(size=len(p)) / p
+    chosen = np.argpartition(-keys, m - 1)[:m]
+    chosen = chosen[np.argsort(-keys[chosen])]
+    return a[chosen], b[chosen], codes[chosen]
+# ...
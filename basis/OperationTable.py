@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""!
+    @brief Defines the OperationTable class for SpeakMaths Trainer software
+"""
+
+##
+# @file basis.OperationTable.py
+#
+# @brief Defines the OperationTable class for SpeakMaths Trainer software
+#
+# @date 2026-10-18
+#
+# @version 1.1
+#
+# @author MBruliard
+##
+
+
+import numpy as np
+
+from basis.FixedPoint import DECIMALS, tableUnits
+from basis.Operation import Operation, LIST_OPERATIONS
+
+
+class OperationTable:
+    """!
+        Definition of the class OperationTable
+
+        @brief stores a list of operations as columns: typed arrays for a, b and res, and one uint8 code per operator
+    """
+
+    def __init__(self, level, a, b, codes, res, decimals=DECIMALS, units=None):
+        """!
+            Class Constructor
+
+            @param level [int] difficulty level of the operations
+            @param a [array] first numbers
+            @param b [array] second numbers
+            @param codes [array] operators codes, positions in LIST_OPERATIONS
+            @param res [array] solutions of the operations, as floats
+            @param decimals [int] decimals of the real numbers of levels 3 and 4. See basis.FixedPoint
+            @param units [array] exact solutions, in units. Computed from a and b per default. 
+            See basis.FixedPoint.tableUnits
+        """
+        self.level = level
+        self.decimals = decimals
+        self.a = np.asarray(a, dtype=np.float64)
+        self.b = np.asarray(b, dtype=np.float64)
+        self.codes = np.asarray(codes, dtype=np.uint8)
+        self.res = np.asarray(res, dtype=np.float64)
+        self.units = tableUnits(level, self.a, self.b, self.codes, decimals) if units is None else np.asarray(units)
+    # ...
+
+
+    @classmethod
+    def generate(cls, level, n, opers=None, minval=1, maxval=10, rng=None, unique=False, pools=None, decimals=DECIMALS):
+        """!
+            @brief Build a table of @param n random operations. See Operation.generateBatch
+        """
+        a, b, codes, res, units = Operation.generateBatch(level, n, opers, minval, maxval, rng, unique, pools, decimals, 
+                                                         units=True)
+        return cls(level, a, b, codes, res, decimals, units)
+    # ...
+
+
+    def __len__(self):
+        return len(self.codes)
+    # ...
+
+
+    def __getitem__(self, i):
+        """!
+            @brief Access to the operation @param i
+
+            @return a read-only OperationView on the row @param i, or a list of views when @param i is a slice,
+            as the list of operations did
+        """
+        n = len(self)
+        if isinstance(i, slice):
+            return [OperationView(self, j) for j in range(*i.indices(n))]
+        # ...
+        if not -n <= i < n:
+            raise IndexError("Error: operation index out of range")
+        # ...
+        return OperationView(self, i % n)
+    # ...
+
+
+    def __iter__(self):
+        for i in range(0, len(self)):
+            yield OperationView(self, i)
+        # ...
+    # ...
+
+
+    def assign(self, i, other, j=0):
+        """!
+            @brief Replaces the operation @param i by the operation @param j of the table @param other
+        """
+        for name in ('a', 'b', 'codes', 'res', 'units'):
+            column = getattr(self, name)
+            dtype = np.result_type(column, getattr(other, name)) if name == 'units' else column.dtype
+            if not column.flags.writeable or dtype != column.dtype:
+                # columns read from the pools: copied before their first change. Units beyond int64: Python integers
+                column = column.astype(dtype)
+                setattr(self, name, column)
+            # ...
+            column[i] = getattr(other, name)[j]
+        # ...
+    # ...
+
+
+    def contains(self, a, b, code):
+        """!
+            @brief True if the operation (a, code, b) is in the table
+        """
+        return bool(np.any((self.a == a) & (self.b == b) & (self.codes == code)))
+    # ...
+
+
+    def nbytes(self):
+        """!
+            @brief Memory used by the columns of the table, in bytes
+        """
+        return self.a.nbytes + self.b.nbytes + self.codes.nbytes + self.res.nbytes + self.units.nbytes
+    # ...
+
+# ... end class
+
+
+class OperationView(Operation):
+    """!
+        Definition of the class OperationView
+
+        @brief lightweight read-only Operation reading its values in a row of an OperationTable
+    """
+
+    __slots__ = ('table', 'index')
+
+    def __init__(self, table, index):
+        """!
+            Class Constructor
+
+            @param table [OperationTable] table holding the values
+            @param index [int] row of the operation in @param table
+        """
+        self.table = table
+        self.index = index
+    # ...
+
+    @property
+    def level(self):
+        return self.table.level
+    # ...
+
+    @property
+    def decimals(self):
+        return self.table.decimals
+    # ...
+
+    @property
+    def a(self):
+        return _number(self.table.a[self.index])
+    # ...
+
+    @property
+    def b(self):
+        return _number(self.table.b[self.index])
+    # ...
+
+    @property
+    def oper(self):
+        return LIST_OPERATIONS[self.table.codes[self.index]]
+    # ...
+
+    @property
+    def res(self):
+        return _number(self.table.res[self.index])
+    # ...
+
+    @property
+    def units(self):
+        return int(self.table.units[self.index])
+    # ...
+
+# ... end class
+
+
+# Functions
+def _number(x):
+    """!
+        @brief Converts a value of a column into a Python number: an int when it is integral, as
+        drawn by the integer levels, else a float
+    """
+    x = float(x)
+    return int(x) if x.is_integer() else x
+# ...
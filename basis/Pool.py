@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""!
+    @brief Precomputed pools of the operations of the integer levels for SpeakMaths Trainer software
+"""
+
+##
+# @file basis.Pool.py
+#
+# @brief Precomputed pools of the operations of the integer levels for SpeakMaths Trainer software
+#
+# @details A pool holds every couple (a, b) that the samplers of basis.Sampling can draw for one level
+# and one range, with their cumulative probabilities: levels 1 and 2, and the divisions of level 3.
+# It is saved once as a .npy file (see tools.build_pools) and memory-mapped when loaded, so that
+# opening a pool reads nothing but its header and each couple costs one uniform draw and one binary
+# search, whatever the size of the pool.
+# The draws from a pool follow the same distribution as the samplers, but not the same sequence: a
+# seed gives other operations with a pool than without.
+#
+# @date 2026-10-18
+#
+# @version 1.1
+#
+# @author MBruliard
+##
+
+
+import os
+import tempfile
+
+import numpy as np
+
+from basis.FixedPoint import DECIMALS
+from basis.Files import replaceFile
+from basis.Sampling import enumerateDomain, drawBatch
+
+
+# Global Constants
+# # Pools loaded, by path. Only the pools found are kept: a pool built later, by any process, is 
+# loaded on its first use. See loadPool
+_pools = {}
+
+
+class OperationPool:
+    """!
+        Definition of the class OperationPool
+
+        @brief Memory-mapped table of the couples (a, b) of one level and range: rows a, b and
+        cumulative probabilities
+    """
+
+    def __init__(self, filename):
+        """!
+            Class Constructor
+
+            @param filename path of the .npy file of the pool. See buildPool
+        """
+        self.filename = filename
+        self.table = np.load(filename, mmap_mode='r')
+    # ...
+
+
+    def __len__(self):
+        return self.table.shape[1]
+    # ...
+
+
+    def draw(self, m, rng):
+        """!
+            @brief Draws @param m couples with their probabilities
+
+            @param rng [numpy.random.Generator] random generator
+            @return tuple (a, b) of float arrays
+        """
+        cum = self.table[2]
+        index = np.minimum(np.searchsorted(cum, rng.random(m) * cum[-1], side='right'), len(self) - 1)
+        return np.asarray(self.table[0][index]), np.asarray(self.table[1][index])
+    # ...
+
+# ... end class
+
+
+# Functions
+def poolKind(level, division):
+    """!
+        @brief Name of the kind of operations of a pool, or None when a or b are real numbers
+    """
+    if level in (1, 2):
+        # the same couples for every operator
+        return 'all'
+    elif level == 3 and division:
+        return 'division'
+    # ...
+    return None
+# ...
+
+
+def poolPath(directory, level, division, minval, maxval):
+    """!
+        @brief Path of the pool file of a level and range, or None when a or b are real numbers
+    """
+    kind = poolKind(level, division)
+    if kind is None:
+        return None
+    # ...
+    if level == 1 or level == 3:
+        # the range is not used by these samplers
+        minval, maxval = 1, 10
+    # ...
+    return os.path.join(directory, "level{0}_{1}_{2}_{3}.npy".format(level, kind, int(minval), int(maxval)))
+# ...
+
+
+def buildPool(directory, level, division, minval, maxval):
+    """!
+        @brief Enumerates the couples of a level and range and saves them as a pool file
+
+        @details The file is written under a temporary name then renamed
+
+        @return path of the pool file
+    """
+    path = poolPath(directory, level, division, minval, maxval)
+    if path is None:
+        raise ValueError("Error: no finite pool of operations for level {0}".format(level))
+    # ...
+    a, b, p = enumerateDomain(level, division, minval, maxval)
+    table = np.stack([a, b, np.cumsum(p)])
+
+    os.makedirs(directory, exist_ok=True)
+    fd, temp = tempfile.mkstemp(suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.save(f, table)
+        # ...
+        replaceFile(temp, path)
+    finally:
+        if os.path.exists(temp):
+            os.remove(temp)
+        # ...
+    # ...
+    _pools.pop(path, None)
+    return path
+# ...
+
+
+def loadPool(directory, level, division, minval, maxval):
+    """!
+        @brief Memory-mapped pool of a level and range, if it was built in @param directory
+
+        @return OperationPool, or None
+    """
+    path = poolPath(directory, level, division, minval, maxval)
+    if path is None:
+        return None
+    # ...
+    if path not in _pools:
+        if not os.path.exists(path):
+            return None
+        # ...
+        _pools[path] = OperationPool(path)
+    # ...
+    return _pools[path]
+# ...
+
+
+def drawPooled(level, division, minval, maxval, rng, directory=None, decimals=DECIMALS):
+    """!
+        @brief Same as basis.Sampling.drawBatch, drawing from the pools of @param directory when they
+        were built, with the samplers otherwise. @param decimals is the one of drawBatch
+
+        @return tuple (a, b) of float arrays
+    """
+    pool = loadPool(directory, level, True, minval, maxval) if directory is not None else None
+    if pool is None:
+        return drawBatch(level, division, minval, maxval, rng, decimals)
+    # ...
+    m = len(division)
+    if level != 3 or division.all():
+        return pool.draw(m, rng)
+    # ...
+    # level 3: real numbers, then the divisions from the pool
+    a, b = drawBatch(level, np.zeros(m, dtype=bool), minval, maxval, rng, decimals)
+    a[division], b[division] = pool.draw(np.count_nonzero(division), rng)
+    return a, b
+# ...
@@ -0,0 +1,477 @@
+# -*- coding: utf-8 -*-
+"""!
+    @brief Direct PDF writer for SpeakMaths Trainer software, without reportlab
+"""
+
+##
+# @file basis.RawPDF.py
+#
+# @brief Direct PDF writer for SpeakMaths Trainer software, without reportlab
+#
+# @details The sheets only use the standard Helvetica font, straight lines and page breaks: RawPDF
+# writes these PDF objects itself, with the same interface as basis.MyPDF (writeText, writeOperation,
+# drawOperation, newPage, save). The content streams are built from pre-encoded byte templates, and
+# each page is written to the output as soon as it is closed: the memory used does not grow with the
+# number of pages. The output can be a path or any binary stream, even one that cannot seek.
+# Objects 1 to 4 are reserved for the catalog, the page tree, the font and the shared resources,
+# written at the end with the cross-reference table.
+#
+# @date 2026-10-18
+#
+# @version 1.1
+#
+# @author MBruliard
+##
+
+
+import zlib
+
+from basis import Instrument
+from basis.Layout import operationShape, operationGlyphs, answerGlyphs, operationSkeleton, winAnsiText
+
+
+# Global Constants
+# # A4 page size in pt, as reportlab.lib.pagesizes.A4
+A4 = (595.2755905511812, 841.8897637795277)
+
+# # Objects written at the end
+CATALOG, PAGES, FONT, RESOURCES = 1, 2, 3, 4
+
+# # Content stream templates
+TEXT_FONT = b"/F1 %d Tf\n"
+TEXT_SHOW = b"1 0 0 1 %.2f %.2f Tm (%s) Tj\n"
+FORM_AT = b"q 1 0 0 1 %.2f %.2f cm "
+FORM_DO = b"/%s Do Q\n"
+LINE = b"%.2f %.2f m %.2f %.2f l S\n"
+
+# # Characters to escape in a PDF string
+ESCAPES = str.maketrans({'\\': '\\\\', '(': '\\(', ')': '\\)'})
+
+
+class RawPDF:
+    """!
+        The PDF Writing class without reportlab
+
+        Definition of the class RawPDF that writes the PDF objects of the sheets directly
+    """
+
+    def __init__(self, filename, compress=True, title=None, header=True):
+        """!
+            @brief Class constructor
+
+            @param filename local path to save the PDF file, or binary stream to write it to
+            @param compress [bool] compress the content streams
+            @param title [str] optional title written in the header of the pages of the first sheet
+            @param header [bool] start the first page with its header. False to write pages 
+            drawn elsewhere, see writePage
+        """
+        if isinstance(filename, str):
+            self.out = open(filename, 'wb')
+            self.owned = True
+        else:
+            self.out = filename
+            self.owned = False
+        # ...
+        self.compress = compress
+
+        self.width, self.height = A4
+        self.marginTop = 80;
+        self.marginBottom = 100;
+        self.marginLeft = 50
+        self.marginRight = 50;
+
+        # Byte offsets of the objects, numbered from 1, and bytes written
+        self.offsets = {}
+        self.written = 0
+        self.nextObject = RESOURCES + 1
+
+        # Forms by name, and object numbers of the pages
+        self.forms = {}
+        self.pages = []
+
+        # Drawings and text operations of the current page, and its font
+        self.pageDraw = []
+        self.pageText = []
+        self.pageFont = None
+
+        # Text operations of the answers of the current page, drawn after the page content, the
+        # last page content encoded, and the sheet whose encoded pages are reused, see shareStreams
+        self.answerText = []
+        self.answerFont = None
+        self.lastPage = None
+        self.partner = None
+
+        # Whether the skeleton forms have answer dots, by name. See operationSkeleton
+        self.skeletons = {}
+
+        # First page and title of the current sheet
+        self.sheetPage = 1
+        self.title = title
+
+        self.emit(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        if header:
+            self.writeHeader()
+        # ...
+    # ...
+
+
+    def emit(self, data):
+        """!
+            @brief Writes bytes to the output, counting them for the offsets of the objects
+        """
+        self.out.write(data)
+        self.written += len(data)
+    # ...
+
+
+    def writeObject(self, body, number=None):
+        """!
+            @brief Writes an indirect object
+
+            @param body [bytes] content of the object
+            @param number [int] number of a reserved object. A new number per default
+            @return number of the object
+        """
+        if number is None:
+            number = self.nextObject
+            self.nextObject += 1
+        # ...
+        self.offsets[number] = self.written
+        self.emit(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+        return number
+    # ...
+
+
+    def encode(self, content):
+        """!
+            @brief Data of a stream as written in the file: compressed if compress is set
+        """
+        return zlib.compress(content) if self.compress else content
+    # ...
+
+
+    def writeStream(self, content, entries=b"", encoded=False):
+        """!
+            @brief Writes a stream object
+
+            @param content [bytes] data of the stream
+            @param entries [bytes] other entries of the dictionary of the stream
+            @param encoded [bool] @param content is already encoded. See encode
+            @return number of the object
+        """
+        if not encoded:
+            content = self.encode(content)
+        # ...
+        if self.compress:
+            entries += b" /Filter /FlateDecode"
+        # ...
+        return self.writeObject(b"<< /Length %d%s >>\nstream\n%s\nendstream" % (len(content), entries, content))
+    # ...
+
+
+    def getPageNumber(self):
+        """!
+            @brief Number of the current page, from 1
+        """
+        return len(self.pages) + 1
+    # ...
+
+
+    def newPage(self):
+        """!
+            @brief add a new page to the PDF file
+        """
+        self.showPage()
+        self.writeHeader()
+    # ...
+
+
+    def newSheet(self, title=None):
+        """!
+            @brief Starts a new sheet on a new page: its pages have their own header, title and numbers from 1
+
+            @param title [str] optional title written in the header of the pages of the sheet
+        """
+        self.showPage()
+        self.sheetPage = self.getPageNumber()
+        self.title = title
+        self.writeHeader()
+    # ...
+
+
+    def showPage(self):
+        """!
+            @brief Close the current page: writes its content streams and its page object
+        """
+        self.writePage(self.pageStreams(), encoded=True)
+    # ...
+
+
+    def shareStreams(self, sheet):
+        """!
+            @brief Reuses the encoded pages of @param sheet, whose pages this file draws again, then writes
+            the answers on them: its answer key. See basis.MyPDF.shareStreams
+
+            @param sheet [RawPDF] exercise sheet, whose pages are closed before the ones of this file
+        """
+        self.partner = sheet
+    # ...
+
+
+    def pageStreams(self):
+        """!
+            @brief Encoded content streams of the current page, which is cleared: its content, taken from
+            the sheet of shareStreams when its last page has the same content, then its answers if any
+
+            @return list of bytes
+        """
+        content = b"".join(self.pageDraw)
+        if self.pageText:
+            content += b"BT\n" + b"".join(self.pageText) + b"ET\n"
+        # ...
+        last = self.partner.lastPage if self.partner is not None else None
+        if last is not None and last[0] == content and self.partner.compress == self.compress:
+            streams = [last[1]]
+        else:
+            streams = [self.encode(content)]
+        # ...
+        self.lastPage = (content, streams[0])
+        if self.answerText:
+            streams.append(self.encode(b"BT\n" + b"".join(self.answerText) + b"ET\n"))
+        # ...
+        self.pageDraw = []
+        self.pageText = []
+        self.pageFont = None
+        self.answerText = []
+        self.answerFont = None
+        return streams
+    # ...
+
+
+    def writePage(self, contents, encoded=False):
+        """!
+            @brief Writes a page from its content streams
+
+            @param contents [list] content streams of the page, as bytes. Its forms must be defined, see defineForm
+            @param encoded [bool] @param contents are already encoded. See encode
+        """
+        streams = [self.writeStream(content, encoded=encoded) for content in contents]
+        if len(streams) == 1:
+            contents = b"%d 0 R" % streams[0]
+        else:
+            contents = b"[%s]" % b" ".join(b"%d 0 R" % stream for stream in streams)
+        # ...
+        self.pages.append(self.writeObject(b"<< /Type /Page /Parent %d 0 R /Resources %d 0 R /Contents %s >>"
+                                           % (PAGES, RESOURCES, contents)))
+        Instrument.count('pages')
+    # ...
+
+
+    def save(self):
+        """!
+            @brief Closes the last page and writes the page tree, the resources and the cross-reference table
+        """
+        with Instrument.stage('save'):
+            self.showPage()
+            self.close()
+        # ...
+        Instrument.count('bytes', self.fileSize())
+    # ...
+
+
+    def close(self):
+        """!
+            @brief Writes the page tree, the resources and the cross-reference table, after the last page
+        """
+        self.writeObject(b"<< /Type /Catalog /Pages %d 0 R >>" % PAGES, CATALOG)
+        self.writeObject(b"<< /Type /Pages /Count %d /Kids [%s] /MediaBox [0 0 %.4f %.4f] >>"
+                         % (len(self.pages), b" ".join(b"%d 0 R" % page for page in self.pages),
+                            self.width, self.height), PAGES)
+        self.writeObject(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>", FONT)
+        self.writeObject(self.resources(), RESOURCES)
+
+        start = self.written
+        size = self.nextObject
+        xref = [b"xref\n0 %d\n0000000000 65535 f \n" % size]
+        xref += [b"%010d 00000 n \n" % self.offsets[number] for number in range(1, size)]
+        self.emit(b"".join(xref))
+        self.emit(b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (size, CATALOG, start))
+        if self.owned:
+            self.out.close()
+        # ...
+    # ...
+
+
+    def fileSize(self):
+        """!
+            @brief Size of the saved PDF file in bytes
+        """
+        return self.written
+    # ...
+
+
+    def resources(self, forms=True):
+        """!
+            @brief Resources dictionary: the font, and the forms defined
+        """
+        xobjects = b" ".join(b"/%s %d 0 R" % (name, number) for name, number in self.forms.items())
+        if not forms or not xobjects:
+            return b"<< /Font << /F1 %d 0 R >> >>" % FONT
+        # ...
+        return b"<< /Font << /F1 %d 0 R >> /XObject << %s >> >>" % (FONT, xobjects)
+    # ...
+
+
+    def writeText(self, text, w, h, fontsize=12):
+        """!
+            @brief write some text on the PDF file.
+
+            @details All the text of a page goes into one text object, and the font is only set when it changes.
+        The characters outside of WinAnsiEncoding are replaced, see basis.Layout.winAnsiText
+
+            @param text [str]   text to write
+            @param w    [float] horizontal position of the text. Start from the left
+            @param h    [float] vertical position of the text. Start from the top
+            @param fontsize [int] define the fontsize of the text. Set at 12pt per default
+        """
+        self.writeGlyphs(self.formatGlyphs([(winAnsiText(text), w, h)]), fontsize)
+    # ...
+
+
+    def formatGlyphs(self, glyphs):
+        """!
+            @brief Text operations of many texts, formatted once to be written on one or many files. See writeGlyphs
+
+            @param glyphs [list] texts to write as (text, w, h). See basis.Layout.operationGlyphs
+            @return bytes
+        """
+        return b"".join([TEXT_SHOW % (self.marginLeft + w, self.height - self.marginTop - h,
+                                      text.translate(ESCAPES).encode('cp1252')) for text, w, h in glyphs])
+    # ...
+
+
+    def writeGlyphs(self, text, fontsize=12, answer=False):
+        """!
+            @brief Writes text operations formatted by formatGlyphs into the text object of the page
+
+            @param text [bytes] formatted text operations
+            @param fontsize [int] fontsize of the text
+            @param answer [bool] write them into the text object of the answers, drawn after the page. See shareStreams
+        """
+        if not text:
+            return
+        # ...
+        if answer:
+            if self.answerFont != fontsize:
+                self.answerText.append(TEXT_FONT % fontsize)
+                self.answerFont = fontsize
+            # ...
+            self.answerText.append(text)
+            return
+        # ...
+        if self.pageFont != fontsize:
+            self.pageText.append(TEXT_FONT % fontsize)
+            self.pageFont = fontsize
+        # ...
+        self.pageText.append(text)
+    # ...
+
+
+    def writeHeader(self):
+        """!
+            @brief defines the Header style of a page. Used on each page of the PDF file
+
+            @details The static part of the header is a form defined once and reused on every page
+        """
+        if b'header' not in self.forms:
+            top = self.height - self.marginTop
+            self.defineForm('header', (0, 0, self.width, self.height),
+                            b"BT " + TEXT_FONT % 10 + TEXT_SHOW % (self.marginLeft, top + 25, b"Printed with SpeakMath Trainer") +
+                            b"ET\n" + LINE % (self.marginLeft, top, self.width - self.marginRight, top))
+        # ...
+        self.pageDraw.append(FORM_AT % (0, 0) + FORM_DO % b'header')
+        if self.title:
+            self.writeText(self.title, 0, -45, fontsize=14)
+        # ...
+        self.writeText("Page %s" % (self.getPageNumber() - self.sheetPage + 1), self.width - 3*self.marginRight, -25, 
+                       fontsize=10)
+    # ...
+
+
+    def defineForm(self, name, box, content, encoded=False):
+        """!
+            @brief Writes a form XObject
+
+            @param name [str] name of the form
+            @param box [tuple] bounding box (x1, y1, x2, y2)
+            @param content [bytes] content stream of the form
+            @param encoded [bool] @param content is already encoded. See encode
+        """
+        self.forms[name.encode()] = self.writeStream(content, b" /Type /XObject /Subtype /Form /BBox [%.2f %.2f %.2f %.2f] /Resources %s"
+                                                     % (tuple(box) + (self.resources(forms=False),)), encoded)
+    # ...
+
+
+    def operationSkeleton(self, shape, fontsize=12, dots=True):
+        """!
+            @brief Static part of the layout of an operation as a form, defined once per shape.
+            See basis.MyPDF.operationSkeleton
+
+            @return name of the form
+        """
+        name, box, lines, points = operationSkeleton(shape, fontsize, dots)
+        if self.skeletons.setdefault(name, bool(points)) != bool(points):
+            name = "dots_" + name if points else "rule_" + name
+        # ...
+        if name.encode() not in self.forms:
+            content = b"".join(LINE % line for line in lines)
+            if points:
+                content += b"BT " + TEXT_FONT % fontsize + b"".join(TEXT_SHOW % (x, y, b".") for x, y in points) + b"ET\n"
+            # ...
+            self.defineForm(name, box, content)
+        # ...
+        return name
+    # ...
+
+
+    def drawOperation(self, shape, glyphs, w, h, fontsize=12, dots=True):
+        """!
+            @brief Display an operation from its shape and its texts. See basis.MyPDF.drawOperation
+        """
+        self.drawFragment(shape, self.operationFragment(glyphs, w, h), fontsize, dots)
+    # ...
+
+
+    def operationFragment(self, glyphs, w, h):
+        """!
+            @brief Content of an operation formatted once for an exercise sheet and its answer key. 
+            See basis.MyPDF.operationFragment
+
+            @return tuple (position of the skeleton, formatted texts) of bytes
+        """
+        return FORM_AT % (self.marginLeft + w, self.height - self.marginTop - h), self.formatGlyphs(glyphs)
+    # ...
+
+
+    def drawFragment(self, shape, fragment, fontsize=12, dots=True):
+        """!
+            @brief Display an operation from its shape and its fragment. See basis.MyPDF.drawFragment
+        """
+        position, text = fragment
+        self.pageDraw.append(position + FORM_DO % self.operationSkeleton(shape, fontsize, dots).encode())
+        self.writeGlyphs(text, fontsize)
+    # ...
+
+
+    def writeOperation(self, operation, w, h, fontsize=12, answer=False):
+        """!
+            @brief Display a well-posed elementary operation. See basis.MyPDF.writeOperation
+        """
+        shape = operationShape(operation)
+        self.drawOperation(shape, operationGlyphs(shape, w, h), w, h, fontsize, dots=not answer)
+        if answer:
+            self.writeGlyphs(self.formatGlyphs(answerGlyphs(operation, shape, w, h)), fontsize, answer=True)
+        # ...
+    # ...
+
+# ... end class
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+"""!
+    @brief Store of the profiles and of their results in the online mode for SpeakMaths Trainer software
+"""
+
+##
+# @file basis.Results.py
+#
+# @brief Store of the profiles and of their results in the online mode for SpeakMaths Trainer software
+#
+# @details One SQLite file in WAL mode, so that a window can read the statistics while a session
+# writes its answers. Tables:
+#     profiles   one row per profile (name)
+#     results    one row per answered operation: profile, level, a, oper, b, right, response time, date
+#     stats      per profile, level and operator: number of answers, of right answers and total time
+# The answers are buffered and inserted by batches, in one transaction with the update of stats:
+# statistics are read from a few rows of stats, whatever the number of results kept.
+#
+# @date 2026-10-18
+#
+# @version 1.1
+#
+# @author MBruliard
+##
+
+
+import os
+import sqlite3
+import time
+
+
+# Global Constants
+# # Default file of the store
+RESULTS_FILE = os.path.join(os.environ.get('XDG_DATA_HOME') or os.path.join(os.path.expanduser('~'), '.local', 'share'),
+                            'speakmaths', 'results.db')
+
+# # Number of answers buffered before they are written
+BATCH = 256
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    profile INTEGER NOT NULL REFERENCES profiles(id),
+    level INTEGER NOT NULL,
+    a REAL NOT NULL,
+    oper TEXT NOT NULL,
+    b REAL NOT NULL,
+    right INTEGER NOT NULL,
+    time REAL NOT NULL,
+    date REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_profile ON results(profile, level, oper, date);
+CREATE INDEX IF NOT EXISTS results_date ON results(profile, date);
+CREATE TABLE IF NOT EXISTS stats (
+    profile INTEGER NOT NULL REFERENCES profiles(id),
+    level INTEGER NOT NULL,
+    oper TEXT NOT NULL,
+    answered INTEGER NOT NULL,
+    right INTEGER NOT NULL,
+    time REAL NOT NULL,
+    PRIMARY KEY (profile, level, oper)
+) WITHOUT ROWID;
+"""
+
+
+class ResultStore:
+    """!
+        Definition of the class ResultStore
+
+        @brief Profiles and results of the online mode, with their statistics kept up to date
+    """
+
+    def __init__(self, filename=RESULTS_FILE, batch=BATCH):
+        """!
+            Class Constructor
+
+            @param filename path of the SQLite file, created if needed. ':memory:' for a temporary store
+            @param batch [int] number of answers buffered before they are written
+        """
+        if filename != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
+        # ...
+        self.filename = filename
+        self.batch = batch
+        self.db = sqlite3.connect(filename)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        # a crash may lose the last transactions, never corrupt the file
+        self.db.execute('PRAGMA synchronous=NORMAL')
+        self.db.executescript(SCHEMA)
+
+        # answers not written yet: (profile, level, a, oper, b, right, time, date)
+        self.pending = []
+        self.profiles = {}
+    # ...
+
+
+    def __enter__(self):
+        return self
+    # ...
+
+
+    def __exit__(self, *exc):
+        self.close()
+    # ...
+
+
+    def profile(self, name):
+        """!
+            @brief Identifier of the profile @param name, created if needed
+        """
+        if name not in self.profiles:
+            with self.db:
+                self.db.execute('INSERT OR IGNORE INTO profiles(name) VALUES (?)', (name,))
+            # ...
+            self.profiles[name] = self.db.execute('SELECT id FROM profiles WHERE name = ?', (name,)).fetchone()[0]
+        # ...
+        return self.profiles[name]
+    # ...
+
+
+    def names(self):
+        """!
+            @brief Names of the profiles, in alphabetical order
+        """
+        return [row[0] for row in self.db.execute('SELECT name FROM profiles ORDER BY name')]
+    # ...
+
+
+    def add(self, name, operation, right, seconds, date=None):
+        """!
+            @brief Records one answer. Written with the next batch, see flush
+
+            @param name [str] profile
+            @param operation [basis.Operation] operation answered
+            @param right [bool] True if the answer was right
+            @param seconds [float] response time
+            @param date [float] time of the answer since the epoch. Now per default
+        """
+        self.pending.append((self.profile(name), operation.level, operation.a, operation.oper, operation.b,
+                             int(bool(right)), seconds, time.time() if date is None else date))
+        if len(self.pending) >= self.batch:
+            self.flush()
+        # ...
+    # ...
+
+
+    def addTrainer(self, name, trainer):
+        """!
+            @brief Records and writes the answers of a session of the online mode
+
+            @param name [str] profile
+            @param trainer [basis.Trainer.Trainer] finished session
+        """
+        date = time.time()
+        for operation, text, right, seconds in trainer.results:
+            self.add(name, operation, right, seconds, date)
+        # ...
+        self.flush()
+    # ...
+
+
+    def flush(self):
+        """!
+            @brief Writes the buffered answers and updates the statistics, in one transaction
+        """
+        if not self.pending:
+            return
+        # ...
+        totals = {}
+        for profile, level, a, oper, b, right, seconds, date in self.pending:
+            answered, nb_right, total = totals.get((profile, level, oper), (0, 0, 0.0))
+            totals[(profile, level, oper)] = (answered + 1, nb_right + right, total + seconds)
+        # ...
+        with self.db:
+            self.db.executemany('INSERT INTO results(profile, level, a, oper, b, right, time, date) '
+                                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)', self.pending)
+            self.db.executemany('INSERT INTO stats(profile, level, oper, answered, right, time) '
+                                'VALUES (?, ?, ?, ?, ?, ?) '
+                                'ON CONFLICT(profile, level, oper) DO UPDATE SET '
+                                'answered = answered + excluded.answered, right = right + excluded.right, '
+                                'time = time + excluded.time',
+                                [key + value for key, value in totals.items()])
+        # ...
+        self.pending = []
+    # ...
+
+
+    def stats(self, name, level=None, oper=None):
+        """!
+            @brief Accuracy and speed of a profile, from the statistics kept up to date
+
+            @param name [str] profile
+            @param level [int] only this level. All of them per default
+            @param oper [str] only this operator. All of them per default
+            @return dictionary of the number of answers, of right answers, the accuracy and the mean response time
+        """
+        self.flush()
+        query = 'SELECT TOTAL(answered), TOTAL(right), TOTAL(time) FROM stats WHERE profile = ?'
+        params = [self.profile(name)]
+        if level is not None:
+            query += ' AND level = ?'
+            params.append(level)
+        # ...
+        if oper is not None:
+            query += ' AND oper = ?'
+            params.append(oper)
+        # ...
+        answered, right, total = self.db.execute(query, params).fetchone()
+        return {'answered': int(answered), 'right': int(right), 'accuracy': right / answered if answered else 0.0,
+                'mean_time': total / answered if answered else 0.0}
+    # ...
+
+
+    def history(self, name, level=None, oper=None, limit=100):
+        """!
+            @brief Last answers of a profile, the most recent first
+
+            @return list of tuples (level, a, oper, b, right, response time, date)
+        """
+        self.flush()
+        query = 'SELECT level, a, oper, b, right, time, date FROM results WHERE profile = ?'
+        params = [self.profile(name)]
+        if level is not None:
+            query += ' AND level = ?'
+            params.append(level)
+        # ...
+        if oper is not None:
+            query += ' AND oper = ?'
+            params.append(oper)
+        # ...
+        query += ' ORDER BY date DESC, id DESC LIMIT ?'
+        params.append(limit)
+        return [(level, a, oper, b, bool(right), seconds, date)
+                for level, a, oper, b, right, seconds, date in self.db.execute(query, params)]
+    # ...
+
+
+    def close(self):
+        """!
+            @brief Writes the buffered answers and closes the file
+        """
+        self.flush()
+        self.db.close()
+    # ...
+
+# ... end class
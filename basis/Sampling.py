@@ -0,0 +1,568 @@
+# -*- coding: utf-8 -*-
+"""!
+    @brief Retry-free samplers of the numbers of an operation, for each difficulty level
+"""
+
+##
+# @file basis.Sampling.py
+#
+# @brief Retry-free samplers of the numbers of an operation, for each difficulty level
+#
+# @details Each sampler draws (a, b) directly in the set of valid operations (a != b, a != 0, b != 0)
+# with the same distribution as the former "draw then reject" loop of Operation, so that every
+# operation costs a bounded amount of time. Scalar samplers use the standard random module,
+# batch samplers a numpy.random.Generator.
+# The real numbers of levels 3 and 4 are drawn on the grid of their decimals (see basis.FixedPoint),
+# as integer units.
+#
+# @date 2026-10-18
+#
+# @version 1.1
+#
+# @author MBruliard
+##
+
+
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from math import ceil, floor
+from random import randint, random
+
+import numpy as np
+
+from basis.FixedPoint import DECIMALS, drawUnits
+
+
+# Global Constants
+# # Level 1: b in [1, 9] with weights P(b) * P(a != b | b) = 1/10 * (10-b)/(11-b), then a in [b+1, 10]
+LEVEL_ONE_CUMWEIGHTS = list(accumulate([(10 - b)/(11 - b) for b in range(1, 10)]))
+
+# # Level 2: kinds of choice for a digit of b, given the digit d of a
+KIND_ZERO, KIND_SAME, KIND_MID = range(3)
+
+# # Largest grid of real numbers, in couples (a, b), listed by enumerateDomain. The integer levels are always listed
+ENUMERATION_MAX = 2**21
+
+
+# Scalar samplers
+def sampleLevelOne():
+    """!
+        @brief Draws (a, b) with the rules of the 1st level: values between 1 and 10, a > b
+
+        @return tuple (a, b)
+    """
+    b = 1 + bisect_right(LEVEL_ONE_CUMWEIGHTS, random() * LEVEL_ONE_CUMWEIGHTS[-1])
+    return randint(b + 1, 10), b
+# ...
+
+
+def sampleLevelTwo(minval, maxval):
+    """!
+        @brief Draws (a, b) with the rules of the 2nd level: a in [minval, maxval] and
+        each digit of b lower or equal than the digit of a at the same position
+
+        @param minval [int] minimal value of a
+        @param maxval [int] maximal value of a
+        @return tuple (a, b)
+    """
+    tables = levelTwoTables(int(minval), int(maxval))
+
+    a = 0
+    b = 0
+    state = tables.start
+    for cum, options in tables.steps:
+        cw = cum[state]
+        d, kind, state = options[state][min(bisect_right(cw, random() * cw[-1]), len(cw) - 1)]
+        a = 10*a + d
+        b = 10*b + _digitOfB(d, kind)
+    # ...
+    return a, b
+# ...
+
+
+def sampleLevelThree(minval, maxval, division=False, decimals=DECIMALS):
+    """!
+        @brief Draws (a, b) with the rules of the 3rd level: euclidian division with 1 number,
+        else a and b uniform on the grid of @param decimals decimals in [minval, maxval]
+
+        @param minval [float] minimal value of a and b
+        @param maxval [float] maximal value of a and b
+        @param division [bool] True for a division
+        @param decimals [int] decimals of a and b. See basis.FixedPoint
+        @return tuple (a, b)
+    """
+    if division:
+        b = randint(1, 9)
+        return randint(2, 100)*b, b
+    # ...
+    return _sampleReals(minval, maxval, decimals)
+# ...
+
+
+def sampleLevelFour(minval, maxval, division=False, decimals=DECIMALS):
+    """!
+        @brief Draws (a, b) with the rules of the 4th level: a and b uniform on the grid of @param decimals
+        decimals in [minval, maxval]. For a division, b is an integer in [2, min(a, c)] where c is drawn like a,
+        drawn again with a and c when b = a, as the former loop of Operation
+
+        @param minval [float] minimal value of a and b
+        @param maxval [float] maximal value of a and b
+        @param division [bool] True for a division
+        @param decimals [int] decimals of a and b. See basis.FixedPoint
+        @return tuple (a, b)
+    """
+    if division:
+        lo, hi = _divisionInterval(minval, maxval, decimals)
+        scale = 10**decimals
+        while True:
+            a = randint(lo, hi)
+            b = randint(2, min(a, randint(lo, hi)) // scale)
+            if b * scale != a:
+                return a / scale, b
+            # ...
+        # ...
+    # ...
+    return _sampleReals(minval, maxval, decimals)
+# ...
+
+
+def _sampleReals(minval, maxval, decimals):
+    """!
+        @brief Draws two different real numbers, not 0, uniformly on the grid of @param decimals decimals
+    """
+    lo, hi, zero = _realInterval(minval, maxval, decimals)
+    a = _sampleUnit(lo, hi, zero)
+    b = _sampleUnit(lo, hi, sorted(zero + [a]))
+    return a / 10**decimals, b / 10**decimals
+# ...
+
+
+def _sampleUnit(lo, hi, excluded):
+    """!
+        @brief Scalar version of basis.FixedPoint.drawUnits, @param excluded being a sorted list
+    """
+    k = randint(lo, hi - len(excluded))
+    for e in excluded:
+        k += k >= e
+    # ...
+    return k
+# ...
+
+
+# Batch samplers
+def drawBatch(level, division, minval, maxval, rng, decimals=DECIMALS):
+    """!
+        @brief Vectorized samplers: draws one valid (a, b) per row
+
+        @param level [int] difficulty level
+        @param division [numpy.ndarray] boolean mask of the rows that are divisions
+        @param minval [float] minimal value to generate randomly a and b
+        @param maxval [float] maximal value to generate randomly a and b
+        @param rng [numpy.random.Generator] random generator
+        @param decimals [int] decimals of the real numbers of levels 3 and 4. See basis.FixedPoint
+        @return tuple (a, b) of float arrays
+    """
+    m = len(division)
+
+    if level == 1:
+        b = 1 + np.searchsorted(LEVEL_ONE_CUMWEIGHTS, rng.random(m) * LEVEL_ONE_CUMWEIGHTS[-1], side='right')
+        a = b + 1 + np.floor(rng.random(m) * (10 - b))
+        return a.astype(float), b.astype(float)
+    elif level == 2:
+        return _drawLevelTwo(int(minval), int(maxval), m, rng)
+    # ...
+
+    k = np.count_nonzero(division)
+    a, b = _drawReals(minval, maxval, m - k, decimals, rng, division)
+
+    if k == 0:
+        return a, b
+    elif level == 3:
+        b[division] = rng.integers(1, 10, k)
+        a[division] = rng.integers(2, 101, k) * b[division]
+    else:
+        lo, hi = _divisionInterval(minval, maxval, decimals)
+        scale = 10**decimals
+        x = np.zeros(k, dtype=np.int64)
+        y = np.zeros(k, dtype=np.int64)
+        todo = np.arange(k)
+        while len(todo):
+            # b uniform in [2, min(a, c)]; the rows where b = a are drawn again, as in sampleLevelFour
+            x[todo] = rng.integers(lo, hi + 1, len(todo))
+            top = np.minimum(x[todo], rng.integers(lo, hi + 1, len(todo))) // scale
+            y[todo] = 2 + np.floor(rng.random(len(todo)) * (top - 1)).astype(np.int64)
+            todo = todo[y[todo] * scale == x[todo]]
+        # ...
+        a[division] = x / scale
+        b[division] = y
+    # ...
+    return a, b
+# ...
+
+
+def _drawReals(minval, maxval, m, decimals, rng, division):
+    """!
+        @brief Vectorized version of _sampleReals, for the rows that are not divisions
+
+        @return tuple (a, b) of float arrays of the length of @param division
+    """
+    a = np.zeros(len(division))
+    b = np.zeros(len(division))
+    if m == 0:
+        return a, b
+    # ...
+    lo, hi, zero = _realInterval(minval, maxval, decimals)
+    x = drawUnits(lo, hi, m, rng, zero)
+    y = drawUnits(lo, hi, m, rng, zero + [x])
+    a[~division] = x / 10**decimals
+    b[~division] = y / 10**decimals
+    return a, b
+# ...
+
+
+def _drawLevelTwo(minval, maxval, m, rng):
+    """!
+        @brief Vectorized version of sampleLevelTwo
+    """
+    tables = levelTwoTables(minval, maxval)
+
+    a = np.zeros(m, dtype=np.int64)
+    b = np.zeros(m, dtype=np.int64)
+    state = np.full(m, tables.start)
+    for flat, last, digits, kinds, nexts in tables.arrays:
+        k = np.minimum(np.searchsorted(flat, state + rng.random(m), side='right'), last[state])
+        d = digits[k]
+        kind = kinds[k]
+        state = nexts[k]
+
+        mid = 1 + np.floor(rng.random(m) * np.maximum(d - 1, 0)).astype(np.int64)
+        a = 10*a + d
+        b = 10*b + np.select([kind == KIND_ZERO, kind == KIND_SAME], [0, d], mid)
+    # ...
+    return a.astype(float), b.astype(float)
+# ...
+
+
+# Domains
+def domainSize(level, division, minval, maxval, decimals=DECIMALS):
+    """!
+        @brief Number of different couples (a, b) that the samplers can draw
+
+        @param level [int] difficulty level
+        @param division [bool] True for a division
+        @param minval [float] minimal value to generate randomly a and b
+        @param maxval [float] maximal value to generate randomly a and b
+        @param decimals [int] decimals of the real numbers of levels 3 and 4, on a finite grid. See basis.FixedPoint
+        @return int
+    """
+    if level == 1:
+        return 45
+    elif level == 2:
+        lo, hi = max(int(minval), 1), int(maxval)
+        if hi < lo:
+            raise ValueError("Error: no valid operation of level 2 between {0} and {1}".format(minval, maxval))
+        # ...
+        # every b with digits lower or equal, but b = 0 and b = a
+        return _digitProducts(hi) - _digitProducts(lo - 1) - 2*(hi - lo + 1)
+    elif level == 3 and division:
+        return 9*99
+    elif division:
+        # b in [2, a//scale] for each a, but b = a
+        lo, hi = _divisionInterval(minval, maxval, decimals)
+        scale = 10**decimals
+        return _floorSum(hi, scale) - _floorSum(lo - 1, scale) - (hi - lo + 1) - (hi//scale - (lo - 1)//scale)
+    # ...
+    lo, hi, zero = _realInterval(minval, maxval, decimals)
+    k = hi - lo + 1 - len(zero)
+    return k*(k - 1)
+# ...
+
+
+def enumerable(level, division, size):
+    """!
+        @brief True if enumerateDomain lists the domain of @param size couples: always for the integer 
+        levels, up to ENUMERATION_MAX couples for the grids of real numbers
+    """
+    return level <= 2 or (level == 3 and division) or size <= ENUMERATION_MAX
+# ...
+
+
+def enumerateDomain(level, division, minval, maxval, decimals=DECIMALS):
+    """!
+        @brief All the couples (a, b) that the samplers can draw, with their probabilities
+
+        @details Same parameters as domainSize
+
+        @return tuple (a, b, p) of arrays, or None when the grid of real numbers is larger than ENUMERATION_MAX
+    """
+    if level == 1:
+        # b in [1, 9] weighted as LEVEL_ONE_CUMWEIGHTS, then a uniform in [b+1, 10]
+        b = np.repeat(np.arange(1, 10), np.arange(9, 0, -1))
+        a = b + 1 + np.arange(45) - np.repeat(np.cumsum(np.arange(9, 0, -1)) - np.arange(9, 0, -1), np.arange(9, 0, -1))
+        p = 1/(11 - b)
+    elif level == 2:
+        lo = max(int(minval), 1)
+        digits = _levelTwoDigits(int(minval), int(maxval))
+        counts = np.prod(digits + 1, axis=1)
+        # the couple k of a number a is the mixed radix number k with the radices d+1 of its digits
+        a = np.repeat(np.arange(lo, lo + len(digits)), counts)
+        k = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        b = np.zeros(len(a), dtype=np.int64)
+        size = digits.shape[1]
+        for i in range(size - 1, -1, -1):
+            radix = np.repeat(digits[:, i] + 1, counts)
+            b += (k % radix) * 10**(size - 1 - i)
+            k //= radix
+        # ...
+        p = np.repeat(1/counts, counts)
+        valid = (b != 0) & (b != a)
+        a, b, p = a[valid], b[valid], p[valid]
+    elif level == 3 and division:
+        b = np.repeat(np.arange(1, 10), 99)
+        a = np.tile(np.arange(2, 101), 9) * b
+        p = np.ones(len(a))
+    elif not enumerable(level, division, domainSize(level, division, minval, maxval, decimals)):
+        return None
+    elif division:
+        return _divisionDomain(minval, maxval, decimals)
+    else:
+        # two different units of the grid, not 0, uniform
+        lo, hi, zero = _realInterval(minval, maxval, decimals)
+        units = np.arange(lo, hi + 1)
+        units = units[units != 0]
+        k = len(units)
+        a = np.repeat(units, k - 1)
+        b = np.tile(units, k).reshape(k, k)[~np.eye(k, dtype=bool)]
+        return a / 10**decimals, b / 10**decimals, np.full(len(a), 1/len(a))
+    # ...
+    return a.astype(float), b.astype(float), p/p.sum()
+# ...
+
+
+def _divisionDomain(minval, maxval, decimals):
+    """!
+        @brief Couples of the divisions of the 4th level with their probabilities. See sampleLevelFour
+
+        @details For a in units and c drawn like a, b is uniform in [2, T] with T = min(a, c)//scale,
+        and the draws where b = a are drawn again. So P(a, b) is proportional, for b != a, to
+        (hi - a + 1)/(a//scale - 1) for the c >= a, plus the sum of 1/(c//scale - 1) over the c < a 
+        with c//scale >= b, read on the cumulative sums G of these terms
+    """
+    lo, hi = _divisionInterval(minval, maxval, decimals)
+    scale = 10**decimals
+    units = np.arange(lo, hi + 1)
+    top = units // scale
+    counts = top - 1
+    a = np.repeat(units, counts)
+    b = 2 + np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    valid = b*scale != a
+    a, b = a[valid], b[valid]
+
+    cumulative = np.concatenate([[0.0], np.cumsum(1/(top - 1))])
+    start = np.maximum(lo, b*scale)
+    p = (hi - a + 1)/(a//scale - 1) + cumulative[a - lo] - cumulative[start - lo]
+    return a / scale, b.astype(float), p/p.sum()
+# ...
+
+
+def _floorSum(x, scale):
+    """!
+        @brief Sum over a from 0 to @param x of a//scale
+    """
+    if x < 0:
+        return 0
+    # ...
+    q, r = divmod(x, scale)
+    return scale*q*(q - 1)//2 + q*(r + 1)
+# ...
+
+
+def _digitProducts(x):
+    """!
+        @brief Sum over a from 0 to @param x of the product of (d+1) for the digits d of a
+    """
+    total = 0
+    prefix = 1
+    digits = [int(c) for c in str(x)]
+    for i, d in enumerate(digits):
+        # numbers with the same prefix and a lower digit here, then any digits: 1+2+...+10 = 55 each
+        total += prefix * d*(d + 1)//2 * 55**(len(digits) - 1 - i)
+        prefix *= d + 1
+    # ...
+    return total + prefix
+# ...
+
+
+def _levelTwoDigits(minval, maxval):
+    """!
+        @brief Digits of the numbers a of the 2nd level, one row per a from max(minval, 1) to maxval
+    """
+    lo = max(minval, 1)
+    if maxval < lo:
+        raise ValueError("Error: no valid operation of level 2 between {0} and {1}".format(minval, maxval))
+    # ...
+    a = np.arange(lo, maxval + 1)
+    return (a[:, None] // 10**np.arange(len(str(maxval)) - 1, -1, -1)) % 10
+# ...
+
+
+# Level 2 tables
+class LevelTwoTables:
+    """!
+        Definition of the class LevelTwoTables
+
+        @brief Precomputed digit-by-digit transition tables of the 2nd level sampler for one range
+
+        @details a and b are built from the most significant digit. The state after a prefix is
+        (a equals the prefix of minval, a equals the prefix of maxval, b is only zeros, b equals a).
+        Choosing the digit d of a and the digit e of b weights 1/(d+1), as in the former sampler,
+        and the final state must have neither "b is only zeros" nor "b equals a".
+    """
+
+    def __init__(self, minval, maxval):
+        """!
+            Class Constructor
+
+            @param minval [int] minimal value of a
+            @param maxval [int] maximal value of a
+        """
+        lo = max(minval, 1)
+        if maxval < lo:
+            raise ValueError("Error: no valid operation of level 2 between {0} and {1}".format(minval, maxval))
+        # ...
+        size = len(str(maxval))
+        low = [int(c) for c in str(lo).zfill(size)]
+        high = [int(c) for c in str(maxval).zfill(size)]
+
+        # weights of the completions from each position and state
+        weight = [1.0 if not (s & 4 or s & 8) else 0.0 for s in range(16)]
+
+        # one (cumulative weights, options) per position, options as (digit of a, kind, next state)
+        self.steps = []
+        for i in range(size - 1, -1, -1):
+            cum = []
+            options = []
+            for s in range(16):
+                opts = self._transitions(s, low[i], high[i])
+                cum.append(list(accumulate([w * weight[t] for w, d, kind, t in opts])) or [0.0])
+                options.append([(d, kind, t) for w, d, kind, t in opts] or [(0, KIND_ZERO, s)])
+            # ...
+            weight = [c[-1] for c in cum]
+            self.steps.insert(0, (cum, options))
+        # ...
+
+        self.start = 15
+        if weight[self.start] <= 0:
+            raise ValueError("Error: no valid operation of level 2 between {0} and {1}".format(minval, maxval))
+        # ...
+
+        # same tables flattened for the vectorized sampler: the cumulative weights of the state s
+        # are scaled into [s, s+1] so that one searchsorted of (state + uniform) picks the options
+        self.arrays = []
+        for cum, options in self.steps:
+            flat, last, rows = [], [], []
+            for s in range(16):
+                total = cum[s][-1] if cum[s][-1] > 0 else 1.0
+                flat += [s + c/total for c in cum[s]]
+                rows += options[s]
+                last.append(len(flat) - 1)
+            # ...
+            rows = np.array(rows, dtype=np.int64)
+            self.arrays.append((np.array(flat), np.array(last), rows[:, 0], rows[:, 1], rows[:, 2]))
+        # ...
+    # ...
+
+
+    @staticmethod
+    def _transitions(state, low, high):
+        """!
+            @brief Possible choices at one position
+
+            @param state [int] bits 1: tight on minval, 2: tight on maxval, 4: b only zeros, 8: b equals a
+            @param low [int] digit of minval at this position
+            @param high [int] digit of maxval at this position
+            @return list of (weight, digit of a, kind of digit of b, next state)
+        """
+        tl, th, zero, same = state & 1, state & 2, state & 4, state & 8
+        result = []
+        for d in range(low if tl else 0, (high if th else 9) + 1):
+            bounds = (1 if tl and d == low else 0) | (2 if th and d == high else 0)
+            if d == 0:
+                result.append((1.0, d, KIND_ZERO, bounds | zero | same))
+                continue
+            # ...
+            result.append((1/(d + 1), d, KIND_ZERO, bounds | zero))
+            result.append((1/(d + 1), d, KIND_SAME, bounds | same))
+            if d > 1:
+                result.append(((d - 1)/(d + 1), d, KIND_MID, bounds))
+            # ...
+        # ...
+        return result
+    # ...
+
+# ... end class
+
+
+@lru_cache(maxsize=64)
+def levelTwoTables(minval, maxval):
+    """!
+        @brief Cached LevelTwoTables of the range [minval, maxval]
+    """
+    return LevelTwoTables(minval, maxval)
+# ...
+
+
+# Helpers
+def _digitOfB(d, kind):
+    """!
+        @brief Digit of b for the chosen kind, given the digit d of a
+    """
+    if kind == KIND_ZERO:
+        return 0
+    elif kind == KIND_SAME:
+        return d
+    # ...
+    return randint(1, d - 1)
+# ...
+
+
+def _realInterval(minval, maxval, decimals):
+    """!
+        @brief Units of the grid of @param decimals decimals in [minval, maxval]
+
+        @details Raises ValueError if two different numbers, not 0, cannot be drawn on it
+
+        @return tuple (lo, hi, [0] if 0 is in [lo, hi] else [])
+    """
+    scale = 10**decimals
+    lo, hi = ceil(min(minval, maxval)*scale), floor(max(minval, maxval)*scale)
+    zero = [0] if lo <= 0 <= hi else []
+    if hi - lo + 1 - len(zero) < 2:
+        raise ValueError("Error: minval and maxval must hold two different numbers, not 0, with {0} decimals".format(decimals))
+    # ...
+    return lo, hi, zero
+# ...
+
+
+def _divisionInterval(minval, maxval, decimals=DECIMALS):
+    """!
+        @brief Interval of a and c for a division of the 4th level, where min(a, c) >= 2
+
+        @return tuple (lo, hi) of units with @param decimals decimals
+    """
+    lo, hi = min(minval, maxval), max(minval, maxval)
+    if hi < 2:
+        raise ValueError("Error: level 4 divisions need maxval >= 2")
+    # ...
+    scale = 10**decimals
+    lo, hi = ceil(max(lo, 2)*scale), floor(hi*scale)
+    if hi < lo:
+        raise ValueError("Error: no number with {0} decimals between {1} and {2}".format(decimals, minval, maxval))
+    # ...
+    if hi == lo == 2*scale:
+        # a = 2 and b = 2 only
+        raise ValueError("Error: level 4 divisions need a number other than 2 between minval and maxval")
+    # ...
+    return lo, hi
+# ...
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""!
+    @brief Local HTTP service exporting exercise sheets for SpeakMaths Trainer software
+"""
+
+##
+# @file basis.Server.py
+#
+# @brief Local HTTP service exporting exercise sheets for SpeakMaths Trainer software
+#
+# @details Routes:
+#     POST /sheet   body: a JSON sheet spec without output (see basis.Batch), returns the PDF file
+#     GET /health   returns the number of workers and of sheets in progress as JSON
+# The sheets are drawn by a pool of worker processes started and warmed up (numpy, reportlab and the
+# fonts loaded) before the first request. At most a fixed number of requests are given to the pool at
+# once: the next ones wait for a free slot, and get the status 503 after QUEUE_TIMEOUT seconds.
+# The sheets of more than MAX_N operations, or with numbers beyond MAX_VALUE, get the status 400: one
+# of them would keep a worker busy for minutes.
+#
+# @date 2026-10-18
+#
+# @version 1.1
+#
+# @author MBruliard
+##
+
+
+import json
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, wait
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from basis.Batch import checkSpec, renderSheet
+
+
+# Global Constants
+# # Largest accepted request body, in bytes
+MAX_BODY = 64*1024
+
+# # Seconds a request waits for a free slot before the answer 503
+QUEUE_TIMEOUT = 30
+
+# # Largest number of operations of a sheet, and largest absolute value of minval and maxval
+MAX_N = 10000
+MAX_VALUE = 10**9
+
+
+def checkLimits(spec):
+    """!
+        @brief Raises ValueError if a completed sheet spec is larger than the limits of the server, 
+        MAX_N and MAX_VALUE. The other parameters are checked by basis.Session
+    """
+    n = spec['n']
+    if isinstance(n, int) and n > MAX_N:
+        raise ValueError("Error: at most {0} operations per sheet".format(MAX_N))
+    # ...
+    for key in ('minval', 'maxval'):
+        value = spec[key]
+        if isinstance(value, (int, float)) and not -MAX_VALUE <= value <= MAX_VALUE:
+            raise ValueError("Error: {0} must be between {1} and {2}".format(key, -MAX_VALUE, MAX_VALUE))
+        # ...
+    # ...
+    if all(isinstance(spec[key], (int, float)) for key in ('minval', 'maxval')) and spec['minval'] > spec['maxval']:
+        raise ValueError("Error: minval must not be larger than maxval")
+    # ...
+# ...
+
+
+def warmWorker():
+    """!
+        @brief Loads numpy, reportlab and the fonts in a worker process, by drawing one small sheet
+    """
+    renderSheet(checkSpec({'level': 2, 'n': 4}, required=['level', 'n']))
+    return os.getpid()
+# ...
+
+
+class SheetServer(ThreadingHTTPServer):
+    """!
+        Definition of the class SheetServer
+
+        @brief HTTP server handing the sheets to a pool of warm worker processes
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address, workers=None, slots=None, cache=None):
+        """!
+            Class Constructor
+
+            @param address tuple (host, port). Port 0 picks a free port
+            @param workers [int] number of worker processes. Number of CPUs per default
+            @param slots [int] number of sheets given to the pool at once. 2 per worker per default
+            @param cache optional directory of a basis.Cache.SheetCache for the sheets with a seed
+        """
+        super().__init__(address, SheetHandler)
+        self.workers = workers or os.cpu_count() or 1
+        self.cache = cache
+        self.slots = slots or 2*self.workers
+        self.free = threading.BoundedSemaphore(self.slots)
+        self.busy = 0
+        self.lock = threading.Lock()
+
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        wait([self.pool.submit(warmWorker) for i in range(self.workers)])
+    # ...
+
+
+    def render(self, spec):
+        """!
+            @brief Draws one sheet in the pool, waiting for a free slot
+
+            @param spec [dict] completed sheet spec
+            @return bytes of the PDF file, or None if no slot was free before QUEUE_TIMEOUT
+        """
+        if not self.free.acquire(timeout=QUEUE_TIMEOUT):
+            return None
+        # ...
+        with self.lock:
+            self.busy += 1
+        # ...
+        try:
+            return self.pool.submit(renderSheet, spec, self.cache).result()
+        finally:
+            with self.lock:
+                self.busy -= 1
+            # ...
+            self.free.release()
+        # ...
+    # ...
+
+
+    def server_close(self):
+        """!
+            @brief Stops the worker processes with the server
+        """
+        super().server_close()
+        self.pool.shutdown()
+    # ...
+
+# ... end class
+
+
+class SheetHandler(BaseHTTPRequestHandler):
+    """!
+        Definition of the class SheetHandler
+
+        @brief Requests of the SheetServer
+    """
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        if self.path != '/health':
+            return self.reply(404, {'error': 'unknown path'})
+        # ...
+        self.reply(200, {'workers': self.server.workers, 'slots': self.server.slots, 'busy': self.server.busy})
+    # ...
+
+
+    def do_POST(self):
+        if self.path != '/sheet':
+            return self.reply(404, {'error': 'unknown path'})
+        # ...
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+            if length < 0:
+                raise ValueError(length)
+            # ...
+        except ValueError:
+            return self.reply(400, {'error': 'invalid Content-Length'})
+        # ...
+        if length > MAX_BODY:
+            return self.reply(413, {'error': 'request too large'})
+        # ...
+        try:
+            spec = checkSpec(json.loads(self.rfile.read(length) or b'null'), required=['level', 'n'])
+            checkLimits(spec)
+        except ValueError as error:
+            return self.reply(400, {'error': str(error)})
+        # ...
+
+        try:
+            pdf = self.server.render(spec)
+        except (TypeError, ValueError) as error:
+            # invalid parameters of the session, raised in the worker
+            return self.reply(400, {'error': str(error)})
+        except Exception as error:
+            return self.reply(500, {'error': str(error)})
+        # ...
+        if pdf is None:
+            return self.reply(503, {'error': 'too many sheets in progress'}, {'Retry-After': '1'})
+        # ...
+        self.reply(200, pdf)
+    # ...
+
+
+    def reply(self, status, body, headers=None):
+        """!
+            @brief Sends a PDF file (bytes) or a JSON object (dict)
+        """
+        if isinstance(body, bytes):
+            kind = 'application/pdf'
+        else:
+            kind = 'application/json'
+            body = json.dumps(body).encode()
+        # ...
+        self.send_response(status)
+        self.send_header('Content-Type', kind)
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        # ...
+        self.end_headers()
+        self.wfile.write(body)
+    # ...
+
+
+    def log_message(self, format, *args):
+        # one line per request on the console would slow down a busy server
+        pass
+    # ...
+
+# ... end class
+
+
+def serve(host='127.0.0.1', port=8000, workers=None, slots=None, cache=None):
+    """!
+        @brief Runs a SheetServer until interrupted
+
+        @details See SheetServer for the parameters
+    """
+    server = SheetServer((host, port), workers, slots, cache)
+    print("Serving sheets on http://{0}:{1}/sheet with {2} workers".format(host, server.server_address[1], server.workers))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    # ...
+# ...
@@ -15,25 +15,195 @@
 # @author MBruliard
 ##
 
+from basis import Instrument
 from basis.Operation import *
-from basis.MyPDF import *
+from basis.OperationTable import OperationTable
+from basis.FixedPoint import DECIMALS, checkDecimals
+from basis.Layout import Layout, layoutOperations, operationGlyphs, answerGlyphs
 
 import time
 
+import numpy as np
+
+# Global Constants
+# # PDF writers: reportlab, or the direct writer basis.RawPDF
+BACKENDS = ['reportlab', 'raw']
+BACKEND = 'reportlab'
+
+# # Number of draws of Session.replace before it gives up
+REPLACE_TRIES = 1000
+
 # Functions 
 def countdown_timer(seconds):
     """!
        @brief Creates a countdown timer and display it on the standard console
        
        @param seconds length of the countdown
+       
+       @details Each second is waited until its date on the monotonic clock, so that the time spent 
+       to print does not add up
     """
+    start = time.monotonic()
     for i in range(seconds, 0, -1):
         print(i, end='\r')
-        time.sleep(1)
+        time.sleep(max(0.0, start + seconds - i + 1 - time.monotonic()))
     print("Time's up!")
 # ...
 
 
+def writeOperations(f, operations, progress=None, key=None):
+    """!
+        @brief Stream operations into an open PDF file, one page at a time
+        
+        @details The operations are packed by basis.Layout as they come: @param operations can be 
+        any iterable or generator, whatever its length. The answer key reuses the positions, page 
+        breaks and formatted operands of the exercise sheet, and its encoded pages. See MyPDF.operationFragment 
+        and MyPDF.shareStreams
+        
+        @param f [basis.MyPDF] PDF file, on a blank page
+        @param operations [iterable] operations to write. See basis.Operation
+        @param progress [callable] optional callback called as progress(nb_operations, nb_pages) after each page
+        @param key [basis.MyPDF] optional PDF file, on a blank page, to write the answer key in the same pass
+        @return number of operations written
+    """
+    layout = Layout(f.width - f.marginLeft - f.marginRight, f.height - f.marginTop - f.marginBottom)
+    
+    placed = layoutOperations(operations, layout)
+    profile = Instrument.current()
+    if profile is not None:
+        placed = profile.timed('layout', placed)
+    # ...
+    
+    if key is not None:
+        key.shareStreams(f)
+    # ...
+    
+    count = 0
+    current = 0
+    with Instrument.stage('drawing'):
+        for operation, shape, page, w, h in placed:
+            if page != current:
+                f.newPage()
+                if key is not None:
+                    key.newPage()
+                # ...
+                current = page
+                if progress is not None:
+                    progress(count, page)
+                # ...
+            # ...
+            # the operands are formatted once for both files: the key only adds the answers
+            fragment = f.operationFragment(operationGlyphs(shape, w, h), w, h)
+            f.drawFragment(shape, fragment)
+            if key is not None:
+                key.drawFragment(shape, fragment, dots=False)
+                key.writeGlyphs(key.formatGlyphs(answerGlyphs(operation, shape, w, h)), answer=True)
+            # ...
+            count += 1
+        # ...
+    # ...
+    if progress is not None and count > 0:
+        progress(count, current + 1)
+    # ...
+    return count
+# ...
+
+
+def pdfBackend(backend=BACKEND):
+    """!
+        @brief Class writing the PDF files of a backend: basis.MyPDF for 'reportlab', basis.RawPDF for 'raw'
+    """
+    if backend not in BACKENDS:
+        raise TypeError("Error: Argument backend must be one of {0}".format(BACKENDS))
+    # ...
+    # reportlab is only loaded by the sessions that are exported with it
+    if backend == 'raw':
+        from basis.RawPDF import RawPDF
+        return RawPDF
+    # ...
+    from basis.MyPDF import MyPDF
+    return MyPDF
+# ...
+
+
+def exportOperations(operations, filename, progress=None, answers=None, backend=BACKEND, title=None):
+    """!
+        @brief Stream operations into a PDF file, one page at a time. See writeOperations
+        
+        @param operations [iterable] operations to write. See basis.Operation
+        @param filename Path of the file to save it on the local computer. The 'raw' backend also takes a binary stream
+        @param progress [callable] optional callback called as progress(nb_operations, nb_pages) after each page
+        @param answers optional path of the answer key, written in the same pass
+        @param backend [str] PDF writer, one of BACKENDS
+        @param title [str] optional title written in the header of the pages
+        @return number of operations written
+    """
+    PDF = pdfBackend(backend)
+    
+    f = PDF(filename, title=title)
+    key = PDF(answers, title=title) if answers is not None else None
+    count = writeOperations(f, operations, progress, key)
+    f.save()
+    if key is not None:
+        key.save()
+    # ...
+    return count
+# ...
+
+
+def exportSessions(sessions, filename, titles=None, progress=None, answers=None, backend=BACKEND):
+    """!
+        @brief Writes many sessions into one PDF file, e.g. the sheets of a whole class
+
+        @details Each session starts a new sheet on a new page, with its header, its title and its
+        pages numbered from 1. The font and the forms of the header and of the operations are defined
+        once for the whole file. With the 'raw' backend the pages are written as they are drawn, so
+        that @param sessions can be a generator of any number of sessions.
+
+        @param sessions [iterable] sessions, or any iterables of operations
+        @param filename Path of the file to save it on the local computer. The 'raw' backend also takes a binary stream
+        @param titles [iterable] optional titles of the sheets, e.g. the names of the children
+        @param progress [callable] optional callback called as progress(nb_sheets, nb_operations) after each sheet
+        @param answers optional path of the answer keys of all the sheets, written in the same pass
+        @param backend [str] PDF writer, one of BACKENDS
+        @return number of sheets written
+    """
+    PDF = pdfBackend(backend)
+    titles = iter(titles) if titles is not None else None
+
+    f = key = None
+    count = 0
+    sheets = 0
+    for operations in sessions:
+        title = next(titles, None) if titles is not None else None
+        if f is None:
+            f = PDF(filename, title=title)
+            key = PDF(answers, title=title) if answers is not None else None
+        else:
+            f.newSheet(title)
+            if key is not None:
+                key.newSheet(title)
+            # ...
+        # ...
+        count += writeOperations(f, operations, key=key)
+        sheets += 1
+        if progress is not None:
+            progress(sheets, count)
+        # ...
+    # ...
+    if f is None:
+        # no session: one empty sheet
+        f = PDF(filename)
+        key = PDF(answers) if answers is not None else None
+    # ...
+    f.save()
+    if key is not None:
+        key.save()
+    # ...
+    return sheets
+# ...
+
+
 class Session:
     """!
         The Session class 
@@ -41,7 +211,7 @@ class Session:
         @brief defines a list of operations to compute
     """    
   
-    def __init__(self, n, level, oper=None, minval=1, maxval=10):
+    def __init__(self, n, level, oper=None, minval=1, maxval=10, seed=None, unique=False, pools=None, decimals=DECIMALS):
         """!
             Class Constructor
             
@@ -50,6 +220,11 @@ class Session:
             @param oper [str] symbol of the type of operation. See basis.Operation.LIST_OPERATIONS
             @param minval [float] minimum possible value to use to generate numbers in Operation
             @param maxval [float] maximum possible value to use to generate numbers
+            @param seed [int] seed of the random generator, to build the same session again. Random per default
+            @param unique [bool] never give twice the same operation. ValueError if @param n is larger than 
+            the number of different operations
+            @param pools optional directory of precomputed pools of operations. See basis.Pool
+            @param decimals [int] decimals of the real numbers of levels 3 and 4. See basis.FixedPoint
             
         """
         if not isinstance(n, int) or n < 1:
@@ -59,6 +234,7 @@ class Session:
         if not isinstance(level, int) or not 1 <= level <= 4:
             raise TypeError('Error: Argument level must be a strict positive integer between 1 and 4 included')
         # ...
+        checkDecimals(decimals)
         
         # Number of operations
         self.n = n; 
@@ -66,63 +242,94 @@ class Session:
         # Difficulty level
         self.level = level;
         
-        # List of operations to store
-        self.list = [];
+        # Parameters of the operations, to draw the replacements
+        self.oper = oper
+        self.minval = minval
+        self.maxval = maxval
+        self.unique = unique
+        self.pools = pools
+        self.decimals = decimals
         
-        if oper == None:
-            oper = LIST_OPERATIONS;
-        # ...
-        if type(oper) is str:
-            oper = [oper]
+        # Table of operations to store
+        with Instrument.stage('generation'):
+            self.table = OperationTable.generate(level, n, oper, minval, maxval, rng=seed, unique=unique, pools=pools, 
+                                                decimals=decimals)
         # ...
-        
-        for i in range(0, n):
-            opr = LIST_OPERATIONS[randint(0, len(oper)-1)]
-            self.list.append(Operation(level=level, a=0, b=0, oper=opr, minval=minval, maxval=maxval))
+        Instrument.count('operations', n)
+    # ...
+    
+    @property
+    def list(self):
+        """!
+            @brief Operations of the session. Kept for compatibility: the OperationTable itself
+        """
+        return self.table
+    # ...
+    
+    def __len__(self):
+        return len(self.table)
+    # ...
+    
+    def __getitem__(self, i):
+        """!
+            @brief Access to the operation @param i of the session as a lightweight Operation view
+        """
+        return self.table[i]
+    # ...
+    
+    def __iter__(self):
+        return iter(self.table)
+    # ...
+    
+    def replace(self, i, rng=None, tries=REPLACE_TRIES):
+        """!
+            @brief Replaces the operation @param i by a new one with the same operator, e.g. when it is rejected
+            
+            @details The new operation is drawn with the parameters of the session, and differs from
+            the one it replaces. With unique, it also differs from all the other operations.
+            
+            @param i [int] index of the operation
+            @param rng [numpy.random.Generator|int] random generator or seed. A fresh generator per default
+            @param tries [int] number of draws before ValueError
+            @return the new operation
+        """
+        i = self.table[i].index
+        code = self.table.codes[i]
+        rng = np.random.default_rng(rng)
+        for k in range(tries):
+            new = OperationTable.generate(self.level, 1, [LIST_OPERATIONS[code]], self.minval, self.maxval, rng=rng, 
+                                          pools=self.pools, decimals=self.decimals)
+            if self.unique:
+                taken = self.table.contains(new.a[0], new.b[0], code)
+            else:
+                taken = new.a[0] == self.table.a[i] and new.b[0] == self.table.b[i]
+            # ...
+            if not taken:
+                self.table.assign(i, new)
+                return self.table[i]
+            # ...
         # ...
+        raise ValueError("Error: no other operation found to replace operation {0}".format(i))
     # ...
     
     def __str__(self):
         """!
             @brief Redefines the standard console output of the class 
         """
-        return "\n".join([str(i) for i in self.list])
+        return "\n".join([str(i) for i in self.table])
     # ...
     
     
-    def export(self, filename):
+    def export(self, filename, progress=None, answers=None, backend=BACKEND, title=None):
         """!
             @brief Export the session into a PDF file.
             
             @param filename Path of the file to save it on the local computer
+            @param progress [callable] optional callback called as progress(nb_operations, nb_pages) after each page
+            @param answers optional path to save the answer key, written in the same pass
+            @param backend [str] PDF writer, one of BACKENDS
+            @param title [str] optional title written in the header of the pages
         """
-        f = MyPDF(filename)
-        
-        start_l = f.marginTop + 20
-        start_c = f.marginLeft 
-        
-        step_c  = (f.width - f.marginLeft - f.marginRight)/2
-        step_l = 150
-        
-        textheight = f.height - 2*f.marginTop
-        nb_per_page = textheight // step_l
-        
-        pos_l = start_l
-        pos_c = [start_c, step_c + start_c]
-        for i in range(0, self.n):
-            
-            print("{0}\t|{1} {2}".format(i, pos_c[i%2], pos_l))
-            f.writeOperation(self.list[i], pos_c[i%2],  pos_l)
-        
-            # change position for next it
-            pos_l = pos_l + (i % 2)*step_l            
-            if i!= 0 and i % nb_per_page == 0:
-                f.newPage()
-                pos_l = start_l
-            # ...
-            
-        # ...
-        
-        f.save()   
+        exportOperations(self, filename, progress, answers, backend, title)
     # ...
-# ...
\ No newline at end of file
+# ...
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+"""!
+    @brief Editable exercise sheet for SpeakMaths Trainer software: one operation replaced, one page drawn again
+"""
+
+##
+# @file basis.Sheet.py
+#
+# @brief Editable exercise sheet for SpeakMaths Trainer software: one operation replaced, one page drawn again
+#
+# @details A Sheet keeps the layout of a Session page by page, and the encoded content stream of
+# each page, drawn by basis.RawPDF. When an operation is replaced, the operations are laid out again
+# from the first one of its page, until a page starts with the same operation as before: from there
+# the layout is the same, since every page starts from an empty layout. Most of the time only the
+# page of the operation is drawn again; a replacement that moves operations across pages draws the
+# following pages up to the first unchanged one. Saving writes the streams kept, without drawing.
+#
+# @date 2026-10-18
+#
+# @version 1.1
+#
+# @author MBruliard
+##
+
+
+import io
+
+import numpy as np
+
+from basis import Instrument
+from basis.Layout import Layout, layoutOperations, operationGlyphs, answerGlyphs
+from basis.RawPDF import RawPDF
+
+
+class PageRenderer(RawPDF):
+    """!
+        Definition of the class PageRenderer
+
+        @brief RawPDF drawing pages as encoded content streams kept in memory, with the forms they use
+    """
+
+    def __init__(self, compress=True, title=None):
+        """!
+            Class Constructor
+
+            @param compress [bool] compress the content streams
+            @param title [str] optional title written in the header of the pages
+        """
+        super().__init__(io.BytesIO(), compress, title, header=False)
+
+        # Number of the page being drawn
+        self.number = 1
+    # ...
+
+
+    def getPageNumber(self):
+        return self.number
+    # ...
+
+
+    def defineForm(self, name, box, content, encoded=False):
+        """!
+            @brief Keeps a form to write it with the pages. See RawPDF.defineForm
+        """
+        self.forms[name.encode()] = (box, content if encoded else self.encode(content))
+    # ...
+
+
+    def renderPage(self, number, placed, key=None):
+        """!
+            @brief Draws a page
+
+            @param number [int] number of the page, from 1
+            @param placed [list] tuples (operation, shape, w, h) of the operations of the page. See basis.Layout
+            @param key [PageRenderer] optional renderer of the answer key, which draws the same page with the 
+            operands formatted once. See basis.Session.writeOperations
+            @return tuple (encoded content streams of the page, of the page of the answer key or None). See RawPDF.pageStreams
+        """
+        renderers = [self] if key is None else [self, key]
+        if key is not None:
+            key.shareStreams(self)
+        # ...
+        for f in renderers:
+            f.number = number
+            f.writeHeader()
+        # ...
+        for operation, shape, w, h in placed:
+            fragment = self.operationFragment(operationGlyphs(shape, w, h), w, h)
+            self.drawFragment(shape, fragment)
+            if key is not None:
+                key.drawFragment(shape, fragment, dots=False)
+                key.writeGlyphs(key.formatGlyphs(answerGlyphs(operation, shape, w, h)), answer=True)
+            # ...
+        # ...
+        streams = [f.pageStreams() for f in renderers]
+        return streams[0], streams[1] if key is not None else None
+    # ...
+
+
+    def write(self, filename, streams):
+        """!
+            @brief Writes a PDF file from the forms kept and encoded content streams
+
+            @param filename local path to save the PDF file, or binary stream to write it to
+            @param streams [list] encoded content streams of each page. See renderPage
+            @return size of the file in bytes
+        """
+        f = RawPDF(filename, self.compress, header=False)
+        for name, (box, content) in self.forms.items():
+            f.defineForm(name.decode(), box, content, encoded=True)
+        # ...
+        for contents in streams:
+            f.writePage(contents, encoded=True)
+        # ...
+        f.close()
+        return f.fileSize()
+    # ...
+
+# ... end class
+
+
+class Sheet:
+    """!
+        Definition of the class Sheet
+
+        @brief Exercise sheet of a Session whose operations can be replaced, drawing again only the pages that change
+    """
+
+    def __init__(self, session, answers=False, title=None, compress=True):
+        """!
+            Class Constructor
+
+            @param session [basis.Session] operations of the sheet. Changed by replace
+            @param answers [bool] also keep the answer key
+            @param title [str] optional title written in the header of the pages
+            @param compress [bool] compress the content streams
+        """
+        self.session = session
+        self.renderer = PageRenderer(compress, title)
+        self.keyRenderer = PageRenderer(compress, title) if answers else None
+        self.area = (self.renderer.width - self.renderer.marginLeft - self.renderer.marginRight,
+                     self.renderer.height - self.renderer.marginTop - self.renderer.marginBottom)
+
+        # Operations of each page: (index, shape, w, h), and page of each operation
+        self.placed = []
+        self.pageOf = np.zeros(len(session), dtype=np.int64)
+
+        # Encoded content streams of the pages, and of the pages of the answer key
+        self.streams = []
+        self.keyStreams = []
+
+        self.layoutFrom(0)
+    # ...
+
+
+    def __len__(self):
+        """!
+            @brief Number of pages
+        """
+        return len(self.placed)
+    # ...
+
+
+    def replace(self, i, rng=None):
+        """!
+            @brief Replaces the operation @param i by a new one and draws again the page it lives on.
+            See basis.Session.replace
+
+            @return number of pages drawn again
+        """
+        self.session.replace(i, rng)
+        return self.layoutFrom(int(self.pageOf[self.session[i].index]))
+    # ...
+
+
+    def layoutFrom(self, page):
+        """!
+            @brief Lays out the operations from the first one of @param page, and draws the pages that change
+
+            @details The layout stops at the first page that starts with the same operation, at the
+            same page number, as before: its layout, and the one of the next pages, is the same
+
+            @return number of pages drawn
+        """
+        start = self.placed[page][0][0] if page < len(self.placed) else 0
+        n = len(self.session)
+        operations = self.session if start == 0 else (self.session[j] for j in range(start, n))
+
+        pages = []
+        stop = len(self.placed)
+        j = start
+        for operation, shape, p, w, h in layoutOperations(operations, Layout(*self.area)):
+            if p == len(pages):
+                if p > 0 and page + p < len(self.placed) and self.placed[page + p][0][0] == j:
+                    stop = page + p
+                    break
+                # ...
+                pages.append([])
+            # ...
+            pages[-1].append((j, shape, w, h))
+            j += 1
+        # ...
+
+        with Instrument.stage('drawing'):
+            streams = []
+            keyStreams = []
+            for k, placed in enumerate(pages):
+                self.pageOf[[index for index, shape, w, h in placed]] = page + k
+                operations = [(self.session[index], shape, w, h) for index, shape, w, h in placed]
+                stream, keyStream = self.renderer.renderPage(page + k + 1, operations, self.keyRenderer)
+                streams.append(stream)
+                keyStreams.append(keyStream)
+            # ...
+        # ...
+        self.placed[page:stop] = pages
+        self.streams[page:stop] = streams
+        if self.keyRenderer is not None:
+            self.keyStreams[page:stop] = keyStreams
+        # ...
+        return len(pages)
+    # ...
+
+
+    def save(self, filename, answers=None):
+        """!
+            @brief Writes the PDF file of the sheet from the pages kept, without drawing them
+
+            @param filename local path to save the PDF file, or binary stream to write it to
+            @param answers optional path of the answer key. The Sheet must keep it, see the constructor
+        """
+        if answers is not None and self.keyRenderer is None:
+            raise ValueError("Error: the answer key of this sheet is not kept")
+        # ...
+        with Instrument.stage('save'):
+            size = self.renderer.write(filename, self.streams)
+            if answers is not None:
+                size += self.keyRenderer.write(answers, self.keyStreams)
+            # ...
+        # ...
+        Instrument.count('bytes', size)
+    # ...
+
+# ... end class
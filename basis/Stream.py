@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""!
+    @brief Streaming of operations as NDJSON or CSV lines for SpeakMaths Trainer software
+"""
+
+##
+# @file basis.Stream.py
+#
+# @brief Streaming of operations as NDJSON or CSV lines for SpeakMaths Trainer software
+#
+# @details The operations are generated by chunks of OperationTable: the memory used does not depend
+# on the number of operations, and the first lines are written before the last chunks are drawn.
+# Each line holds the fields level, a, oper, b and res.
+#
+# @date 2026-10-18
+#
+# @version 1.1
+#
+# @author MBruliard
+##
+
+
+import numpy as np
+
+from basis import Instrument
+from basis.FixedPoint import DECIMALS, checkDecimals, numberText
+from basis.Layout import tableDecimals, digitMatrix, digitsFit, matrixTexts
+from basis.Operation import LIST_OPERATIONS, CODE_DIV
+from basis.OperationTable import OperationTable, _number
+
+
+# Global Constants
+# # Fields of a line, in order
+FIELDS = ['level', 'a', 'oper', 'b', 'res']
+
+# # Default number of operations drawn at once
+CHUNK = 65536
+
+# # Output formats
+FORMATS = ['ndjson', 'csv']
+
+
+def streamOperations(level, n, opers=None, minval=1, maxval=10, seed=None, chunk=CHUNK, pools=None, decimals=DECIMALS):
+    """!
+        @brief Generates @param n operations by tables of at most @param chunk operations
+
+        @details The same seed and chunk give the same operations. See Operation.generateBatch for the
+        other parameters
+
+        @return generator of OperationTable
+    """
+    if not isinstance(n, int) or n < 1:
+        raise TypeError('Error: Argument n must be a strict positive integer')
+    # ...
+    if not isinstance(level, int) or not 1 <= level <= 4:
+        raise TypeError('Error: Argument level must be a strict positive integer between 1 and 4 included')
+    # ...
+    checkDecimals(decimals)
+    rng = np.random.default_rng(seed)
+    for start in range(0, n, chunk):
+        with Instrument.stage('generation'):
+            table = OperationTable.generate(level, min(chunk, n - start), opers, minval, maxval, rng, pools=pools, 
+                                            decimals=decimals)
+        # ...
+        Instrument.count('operations', len(table))
+        yield table
+    # ...
+# ...
+
+
+def _column(x):
+    """!
+        @brief Values of a column as Python numbers: ints when they are all integral, else as _number
+    """
+    if np.array_equal(x, np.floor(x)):
+        return x.astype(np.int64).tolist()
+    # ...
+    return [_number(v) for v in x.tolist()]
+# ...
+
+
+def _results(table):
+    """!
+        @brief Results of a table: the exact texts of their units, see basis.FixedPoint, but the 
+        euclidian divisions as _number
+    """
+    da, db, dres = tableDecimals(table.level, table.codes, table.decimals)
+    if digitsFit(table.units):
+        texts = matrixTexts(digitMatrix(table.units, dres)[0])
+    else:
+        texts = [numberText(int(u), d) for u, d in zip(table.units.tolist(), dres.tolist())]
+    # ...
+    euclid = (table.codes == CODE_DIV) & (da == 0)
+    if euclid.any():
+        texts = [_number(r) if e else t for t, r, e in zip(texts, table.res.tolist(), euclid.tolist())]
+    # ...
+    return texts
+# ...
+
+
+def tableRows(table):
+    """!
+        @brief Rows of an OperationTable as tuples ordered as FIELDS
+    """
+    opers = [LIST_OPERATIONS[c] for c in table.codes.tolist()]
+    return zip([table.level]*len(table), _column(table.a), opers, _column(table.b), _results(table))
+# ...
+
+
+def ndjsonLines(tables):
+    """!
+        @brief NDJSON lines of operations, one JSON object per operation
+
+        @param tables [iterable] tables of operations. See streamOperations
+        @return generator of str, one per table, each holding the lines of the table
+    """
+    line = '{{"level": {0}, "a": {1}, "oper": "{2}", "b": {3}, "res": {4}}}\n'
+    for table in tables:
+        # str of Python ints and finite floats is valid JSON
+        yield ''.join([line.format(*row) for row in tableRows(table)])
+    # ...
+# ...
+
+
+def csvLines(tables):
+    """!
+        @brief CSV lines of operations, after a header line with FIELDS
+
+        @param tables [iterable] tables of operations. See streamOperations
+        @return generator of str, the header then one per table, each holding the lines of the table
+    """
+    yield ','.join(FIELDS) + '\n'
+    for table in tables:
+        yield ''.join(['{0},{1},{2},{3},{4}\n'.format(*row) for row in tableRows(table)])
+    # ...
+# ...
+
+
+def writeStream(tables, out, fmt='ndjson'):
+    """!
+        @brief Writes operations into an open text file as they are generated
+
+        @param tables [iterable] tables of operations. See streamOperations
+        @param out text file, e.g. sys.stdout
+        @param fmt [str] output format. See FORMATS
+        @return number of operations written
+    """
+    if fmt not in FORMATS:
+        raise ValueError("Error: format must be one of {0}".format(', '.join(FORMATS)))
+    # ...
+    count = 0
+
+    def counted():
+        nonlocal count
+        for table in tables:
+            count += len(table)
+            yield table
+        # ...
+    # ...
+    for text in (ndjsonLines if fmt == 'ndjson' else csvLines)(counted()):
+        out.write(text)
+    # ...
+    return count
+# ...
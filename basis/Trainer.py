@@ -0,0 +1,313 @@
+# -*- coding: utf-8 -*-
+"""!
+    @brief Timed online mode: operations shown one by one and answers checked against a deadline
+"""
+
+##
+# @file basis.Trainer.py
+#
+# @brief Timed online mode: operations shown one by one and answers checked against a deadline
+#
+# @details Trainer holds the state of a timed session and never waits: time is read on a monotonic
+# clock and compared with one deadline, so that it does not drift with the number of answers nor the
+# time spent to show them. runTrainer drives a Trainer with asyncio, from a queue of answers; a Qt
+# window can drive it as well with a QTimer and Trainer.remaining().
+#
+# @date 2026-10-18
+#
+# @version 1.1
+#
+# @author MBruliard
+##
+
+
+import asyncio
+import math
+import os
+import sys
+import threading
+import time
+
+from basis.FixedPoint import parseUnits
+from basis.Layout import formatNumber, numberDecimals, resultText
+
+
+# Global Constants
+# # Largest difference accepted between an answer and the quotient of an integer division that is not an integer
+TOLERANCE = 0.005
+
+
+def checkAnswer(operation, text):
+    """!
+        @brief Compares an answer with the result of an operation
+
+        @details An integer division can be answered by its quotient and remainder, as in the answer
+        key: "q r", with an optional remainder 0, or by its quotient up to TOLERANCE. Other results
+        are exact with the decimals of the operation (see basis.FixedPoint): the answer is read as 
+        exact units and compared with the units of the result.
+
+        @param operation [basis.Operation] operation, with its result computed
+        @param text [str] answer
+        @return True if the answer is right
+    """
+    words = text.replace(',', '.').split()
+    quotient, remainder = resultText(operation)
+    if remainder and words in ([quotient, remainder], [quotient] if remainder == '0' else None):
+        return True
+    # ...
+    if len(words) != 1:
+        return False
+    # ...
+    da, db, dres = numberDecimals(operation)
+    if operation.oper == '/' and da == 0:
+        try:
+            value = float(words[0])
+        except ValueError:
+            return False
+        # ...
+        return abs(value - operation.res) <= (0 if float(operation.res).is_integer() else TOLERANCE)
+    # ...
+    return parseUnits(words[0], dres) == operation.units
+# ...
+
+
+def questionText(operation):
+    """!
+        @brief Text of an operation without its result, as shown in the online mode
+    """
+    da, db, dres = numberDecimals(operation)
+    return "{0} {1} {2} = ?".format(formatNumber(operation.a, da), operation.oper, formatNumber(operation.b, db))
+# ...
+
+
+class Trainer:
+    """!
+        Definition of the class Trainer
+
+        @brief State of a timed session: current operation, deadline and answers given
+    """
+
+    def __init__(self, operations, duration, clock=time.monotonic):
+        """!
+            Class Constructor
+
+            @param operations [iterable] operations to answer, e.g. a basis.Session
+            @param duration [float] length of the session in seconds
+            @param clock [callable] monotonic clock in seconds
+        """
+        self.operations = iter(operations)
+        self.duration = duration
+        self.clock = clock
+
+        # Start and end of the session on the clock, set by start
+        self.started = None
+        self.deadline = None
+
+        # Operation waiting for an answer and time it was shown
+        self.current = None
+        self.shown = None
+
+        # Answers given: (operation, answer, right, response time in seconds)
+        self.results = []
+    # ...
+
+
+    def start(self):
+        """!
+            @brief Starts the countdown
+
+            @return the first operation, or None if there is none
+        """
+        self.started = self.clock()
+        self.deadline = self.started + self.duration
+        return self.next()
+    # ...
+
+
+    def next(self):
+        """!
+            @brief Shows the next operation
+
+            @return the operation, or None at the end of the operations
+        """
+        self.current = next(self.operations, None)
+        self.shown = self.clock()
+        return self.current
+    # ...
+
+
+    def remaining(self):
+        """!
+            @brief Seconds left before the deadline, 0 when the time is up
+        """
+        return max(0.0, self.deadline - self.clock())
+    # ...
+
+
+    @property
+    def finished(self):
+        """!
+            @brief True when the time is up or all the operations are answered
+        """
+        return self.current is None or self.clock() >= self.deadline
+    # ...
+
+
+    def answer(self, text):
+        """!
+            @brief Checks an answer to the current operation, then shows the next one
+
+            @param text [str] answer
+            @return tuple (right, response time in seconds), or None if the session is finished
+        """
+        now = self.clock()
+        if self.current is None or now >= self.deadline:
+            return None
+        # ...
+        right = checkAnswer(self.current, text)
+        result = (self.current, text, right, now - self.shown)
+        self.results.append(result)
+        self.next()
+        return result[2:]
+    # ...
+
+
+    def summary(self):
+        """!
+            @brief Score of the session
+
+            @return dictionary of the number of answers, of right answers and the mean response time
+        """
+        answered = len(self.results)
+        right = sum(1 for result in self.results if result[2])
+        mean = sum(result[3] for result in self.results) / answered if answered else 0.0
+        return {'answered': answered, 'right': right, 'mean_time': mean}
+    # ...
+
+# ... end class
+
+
+async def runTrainer(trainer, answers, show, tick=None):
+    """!
+        @brief Runs a Trainer until the time is up or all the operations are answered
+
+        @details Waiting for an answer never lasts longer than the remaining time, and the ticks are
+        scheduled on whole seconds from the start, so that they do not drift
+
+        @param trainer [Trainer] session to run, not started
+        @param answers [asyncio.Queue] answers (str) as they are typed
+        @param show [callable] called as show(operation, result) for each operation, result being
+        (right, response time) of the previous answer or None. Called once more with operation None
+        after the last operation is answered, to give its feedback
+        @param tick [callable] optional callback called as tick(remaining seconds) every second
+        @return the Trainer
+    """
+    operation = trainer.start()
+    ticker = asyncio.ensure_future(_tick(trainer, tick)) if tick is not None else None
+    result = None
+    try:
+        while operation is not None:
+            show(operation, result)
+            remaining = trainer.remaining()
+            if remaining <= 0:
+                break
+            # ...
+            try:
+                text = await asyncio.wait_for(answers.get(), remaining)
+            except asyncio.TimeoutError:
+                break
+            # ...
+            result = trainer.answer(text)
+            if result is None:
+                break
+            # ...
+            operation = trainer.current
+            if operation is None:
+                show(None, result)
+            # ...
+        # ...
+    finally:
+        if ticker is not None:
+            ticker.cancel()
+        # ...
+    # ...
+    return trainer
+# ...
+
+
+async def _tick(trainer, tick):
+    """!
+        @brief Calls tick(remaining seconds) on each whole second from the start of @param trainer
+    """
+    k = 1
+    while trainer.started + k < trainer.deadline:
+        await asyncio.sleep(max(0.0, trainer.started + k - trainer.clock()))
+        tick(math.ceil(trainer.remaining()))
+        k += 1
+    # ...
+# ...
+
+
+def consoleAnswers(loop):
+    """!
+        @brief Queue of the lines typed on the console
+
+        @details The lines are read by a daemon thread, so that the event loop never waits for the console.
+        The thread reads the file descriptor of stdin, not sys.stdin: it can be left waiting when the
+        session ends without holding the lock of sys.stdin.
+
+        @param loop [asyncio.AbstractEventLoop] loop receiving the lines
+        @return asyncio.Queue of str
+    """
+    queue = asyncio.Queue()
+    fd = sys.stdin.fileno()
+
+    def read():
+        pending = b''
+        while True:
+            data = os.read(fd, 4096)
+            if not data:
+                break
+            # ...
+            *lines, pending = (pending + data).split(b'\n')
+            for line in lines:
+                loop.call_soon_threadsafe(queue.put_nowait, line.decode(errors='replace').rstrip('\r'))
+            # ...
+        # ...
+    # ...
+    threading.Thread(target=read, daemon=True).start()
+    return queue
+# ...
+
+
+def trainOnConsole(operations, duration):
+    """!
+        @brief Timed session on the console
+
+        @param operations [iterable] operations to answer, e.g. a basis.Session
+        @param duration [float] length of the session in seconds
+        @return the Trainer, with its results
+    """
+    def show(operation, result):
+        if result is not None:
+            print('right' if result[0] else 'wrong', "({0:.1f} s)".format(result[1]))
+        # ...
+        if operation is not None:
+            print(questionText(operation))
+        # ...
+    # ...
+
+    def tick(remaining):
+        if remaining % 10 == 0 or remaining <= 5:
+            print("[{0} s left]".format(remaining))
+        # ...
+    # ...
+
+    async def main():
+        return await runTrainer(Trainer(operations, duration), consoleAnswers(asyncio.get_running_loop()), show, tick)
+    # ...
+
+    trainer = asyncio.run(main())
+    print("Time's up!" if trainer.current is not None else "All done!")
+    return trainer
+# ...
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""!
+    @brief Background generation and export of a session for SpeakMaths Trainer GUI interface
+"""
+
+
+##
+# @file gui.ExportTask.py
+#
+# @brief Background generation and export of a session for SpeakMaths Trainer GUI interface
+#
+# @date 2026-10-18
+#
+# @version 1.1
+#
+# @author MBruliard
+##
+
+
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+
+class ExportCancelled(Exception):
+    """!
+        @brief Raised from the progress callback of the export to stop a cancelled task
+    """
+# ...
+
+
+class ExportSignals(QObject):
+    """!
+        Defines the ExportSignals class
+
+        Signals of an ExportTask. They are emitted from the thread of the pool and received in the GUI thread
+    """
+
+    # number of operations written, number of operations of the session
+    progress = pyqtSignal(int, int)
+    # path of the PDF file
+    finished = pyqtSignal(str)
+    # error message
+    failed = pyqtSignal(str)
+    # path of the PDF file, not written
+    cancelled = pyqtSignal(str)
+# ...
+
+
+class ExportTask(QRunnable):
+    """!
+        Defines the ExportTask class
+
+        Builds a Session and exports it as a PDF file in a QThreadPool. The task can be cancelled
+        until the file is saved: the export stops at the next page and nothing is written
+    """
+
+    def __init__(self, filename, n, level, oper=None, minval=1, maxval=10, unique=False):
+        """!
+            @brief Class Constructor
+
+            @param filename path of the PDF file
+            @param n, level, oper, minval, maxval, unique parameters of the session. See basis.Session
+        """
+        super().__init__()
+
+        # Parameters of the session and of the file
+        self.filename = filename
+        self.params = dict(n=n, level=level, oper=oper, minval=minval, maxval=maxval, unique=unique)
+
+        # Signals to the GUI, created in the GUI thread
+        self.signals = ExportSignals()
+
+        # Set from the GUI thread, read by the task
+        self.isCancelled = False
+    # ...
+
+
+    def cancel(self):
+        """!
+            @brief Asks the task to stop. A task waiting in the queue of the pool does not start
+        """
+        self.isCancelled = True
+    # ...
+
+
+    def progress(self, count, pages):
+        """!
+            @brief Progress callback of the export, called after each page
+        """
+        if self.isCancelled:
+            raise ExportCancelled()
+        # ...
+        self.signals.progress.emit(count, self.params['n'])
+    # ...
+
+
+    def run(self):
+        """!
+            @brief Builds and exports the session, in a thread of the pool
+        """
+        try:
+            if self.isCancelled:
+                raise ExportCancelled()
+            # ...
+            # numpy and reportlab are loaded by the first export, not at the start of the GUI
+            from basis.Session import Session
+            
+            session = Session(**self.params)
+            session.export(self.filename, progress=self.progress)
+        except ExportCancelled:
+            self.signals.cancelled.emit(self.filename)
+        except Exception as error:
+            self.signals.failed.emit(str(error))
+        else:
+            self.signals.finished.emit(self.filename)
+        # ...
+    # ...
+
+# ...
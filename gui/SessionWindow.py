@@ -19,10 +19,11 @@
 
 
 from PyQt5.QtWidgets import *
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QThreadPool
 
-from basis.Session import Session
+from gui.ExportTask import ExportTask
 
+import os
 import sys
 import subprocess
 
@@ -138,6 +139,18 @@ class SessionWindow(QFrame):
                
         
         self.layout.addWidget(range_wid)
+        
+        # no operation given twice
+        self.unique = QCheckBox('Different operations', self)
+        self.layout.addWidget(self.unique)
+        
+        # exports in progress, one row per export
+        self.exports_layout = QVBoxLayout()
+        self.layout.addLayout(self.exports_layout)
+        
+        # pool running the exports in the background, the next ones wait in its queue
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
     
         # define buttons
         self.layout.addStretch()
@@ -178,6 +191,7 @@ class SessionWindow(QFrame):
       self.maxval.setValue(100)
       
       self.nb_operations.setValue(10)
+      self.unique.setChecked(False)
     # ...
     
     
@@ -207,23 +221,111 @@ class SessionWindow(QFrame):
         minval = self.minval.value()
         maxval = self.maxval.value()
         
-        # create Session
-        session = Session(n=nb, level=level, oper=available_oper, minval=minval, maxval=maxval)
-        
         # export as PDF file
         # --  open a File Opener to define where to save it
         fname = QFileDialog.getSaveFileName(self, 'Save file', 
          'C:\\Documents',"*.pdf")
         
         if fname[0] != '':
-            fname = fname[0]
-            session.export(fname)
+            # --  create and export the Session in the background
+            task = ExportTask(fname[0], n=nb, level=level, oper=available_oper, minval=minval, maxval=maxval, 
+                              unique=self.unique.isChecked())
+            self.exports_layout.addWidget(ExportRow(task, parent=self))
+            self.pool.start(task)
+        # ...
+    # ...
+    
+# ...
+
+
+class ExportRow(QWidget):
+    """!
+        Defines the ExportRow class
+        
+        Shows the progress of an ExportTask, with a button to cancel it
+    """
+    
+    def __init__(self, task, parent=None):
+        """!
+            @brief Class Constructor
             
-            # --  opening the file in standard PDF viewer
-            if sys.platform == 'win32':
-                subprocess.Popen(f'AcroRd32.exe {fname}', shell=True)
-            else:
-                subprocess.Popen(['xdg-open', fname], shell=True)
+            @param task [gui.ExportTask.ExportTask] export to follow
+        """
+        super().__init__(parent)
+        
+        # Followed export
+        self.task = task
+        
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        
+        self.label = QLabel(os.path.basename(task.filename))
+        layout.addWidget(self.label)
+        
+        self.progress = QProgressBar(self)
+        self.progress.setMaximum(task.params['n'])
+        self.progress.setValue(0)
+        layout.addWidget(self.progress)
+        
+        self.cancel_button = QPushButton('Cancel')
+        self.cancel_button.clicked.connect(self.cancel)
+        layout.addWidget(self.cancel_button)
+        
+        task.signals.progress.connect(self.setProgress)
+        task.signals.finished.connect(self.finish)
+        task.signals.failed.connect(self.fail)
+        task.signals.cancelled.connect(self.cancelled)
+    # ...
+    
+    
+    def setProgress(self, count, total):
+        """!
+            @brief Event action for the progress of the export
+        """
+        self.progress.setValue(count)
+    # ...
+    
+    
+    def cancel(self):
+        """!
+            @brief Event action for the Cancel button
+        """
+        self.task.cancel()
+        self.cancel_button.setEnabled(False)
+        self.label.setText(os.path.basename(self.task.filename) + ' (cancelling)')
+    # ...
+    
+    
+    def cancelled(self, fname):
+        """!
+            @brief Event action once the export is stopped: nothing was written
+        """
+        self.deleteLater()
+    # ...
+    
+    
+    def fail(self, message):
+        """!
+            @brief Event action when the export raised an error
+        """
+        self.cancel_button.setEnabled(False)
+        self.label.setText(os.path.basename(self.task.filename) + ' (failed)')
+        QMessageBox.warning(self, 'Export failed', message)
+    # ...
+    
+    
+    def finish(self, fname):
+        """!
+            @brief Event action once the PDF file is saved: opens it in the standard PDF viewer
+        """
+        self.progress.setValue(self.progress.maximum())
+        self.cancel_button.setEnabled(False)
+        self.label.setText(os.path.basename(fname) + ' (done)')
+        
+        if sys.platform == 'win32':
+            subprocess.Popen(f'AcroRd32.exe {fname}', shell=True)
+        else:
+            subprocess.Popen(['xdg-open', fname], shell=True)
         # ...
     # ...
     
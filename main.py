@@ -5,13 +5,190 @@
     @version 1.1
 """
 
+import os
 import sys
-from PyQt5.QtWidgets import QApplication
+import argparse
 
-from gui.MainWindow import MainWindow
-from gui.SessionWindow import SessionWindow
+from basis import Instrument
 
-from basis.Session import Session
+# PyQt5, numpy and reportlab are imported by the mode which uses them, so that each mode starts 
+# without loading the others
+
+
+def number(text):
+    """!
+        Reads a bound of the numbers of the command line
+        
+        @param text [str] value given on the command line
+        @return int when the value is integral, so that the sheets keep the keys of their cache, else float
+    """
+    value = float(text)
+    return int(value) if value.is_integer() else value
+# ...
+
+
+def parseArguments(argv):
+    """!
+        Reads the optional arguments of the command line
+        
+        @param argv [list] arguments, without the program name
+        @return tuple (known arguments, remaining arguments for Qt). The remaining arguments are errors 
+        out of the GUI
+    """
+    parser = argparse.ArgumentParser(description='SpeakMaths Trainer')
+    parser.add_argument('-nogui', action='store_true', 
+                        help='create one sheet from the console. Level and number of operations are asked if not given')
+    
+    session = parser.add_argument_group('session', 'operations of a sheet or of a stream, without the GUI')
+    session.add_argument('-level', type=int, help='difficulty level, from 1 to 4')
+    session.add_argument('-n', type=int, help='number of operations')
+    session.add_argument('-oper', nargs='+', metavar='OPER', help="operators among + - x /. All of them per default")
+    session.add_argument('-minval', type=number, default=1, help='minimal value of the numbers')
+    session.add_argument('-maxval', type=number, default=10, help='maximal value of the numbers')
+    session.add_argument('-seed', type=int, help='seed of the random generator, to get the same operations again')
+    session.add_argument('-decimals', type=int, default=2, 
+                         help='decimals of the real numbers of levels 3 and 4, 2 per default')
+    session.add_argument('-unique', action='store_true', help='never give twice the same operation in a sheet')
+    session.add_argument('-pools', metavar='DIR', 
+                         help='draw the operations of levels 1, 2 and of the divisions of level 3 from the pools '
+                         'built in DIR by tools.build_pools')
+    session.add_argument('-output', metavar='FILE', 
+                         help="PDF file of the sheet, test.pdf per default. With -format, file of the stream, '-' for stdout")
+    session.add_argument('-answers', metavar='FILE', help='PDF file of the answer key of the sheet')
+    session.add_argument('-backend', choices=['reportlab', 'raw'], default='reportlab', 
+                         help='PDF writer: reportlab, or raw to write the PDF objects directly. reportlab per default')
+    session.add_argument('-cache', metavar='DIR', nargs='?', const='', default=None,
+                         help='get the sheets with a seed from a cache directory, ~/.cache/speakmaths per default. '
+                         'Also used by -batch')
+    session.add_argument('-format', choices=['ndjson', 'csv'], 
+                         help='stream the operations as NDJSON or CSV lines in place of a PDF sheet, on stdout per default')
+    session.add_argument('-online', metavar='SECONDS', type=float, 
+                         help='timed training on the console: answer the operations one by one before the time is up')
+    session.add_argument('-user', metavar='NAME', help='profile recording the results of -online')
+    session.add_argument('-results', metavar='DB', default=None, 
+                         help='SQLite file of the profiles and results. See basis.Results for the default')
+    
+    parser.add_argument('-batch', metavar='SPECS', 
+                        help='JSON file with a list of sheet specs to export in parallel. See basis.Batch')
+    parser.add_argument('-merge', metavar='FILE', 
+                        help='with -batch, write all the sheets into one PDF file, each one from a new page. '
+                        'The output of the specs is not required, -answers and -backend apply to the whole file')
+    parser.add_argument('-workers', type=int, default=None, 
+                        help='number of processes of the batch and serve modes. Number of CPUs per default')
+    parser.add_argument('-serve', metavar='[HOST:]PORT', 
+                        help='serve sheets over HTTP: POST a JSON sheet spec to /sheet. See basis.Server')
+    parser.add_argument('-profile', metavar='JSON', nargs='?', const='-', default=None,
+                        help='time the stages of the sheets and count operations, pages and bytes. '
+                        'Saved as JSON in the given file, printed on the console otherwise')
+    args, others = parser.parse_known_args(argv)
+    headless = (args.nogui or args.level is not None or args.n is not None or args.serve is not None 
+                or args.batch is not None or args.online is not None or args.format is not None)
+    if headless and others:
+        parser.error("unrecognized arguments: " + " ".join(others))
+    # ...
+    return args, others
+# ...
+
+
+def writeProfile(profile, filename):
+    """!
+        Prints the summary of @param profile, or saves it as JSON when @param filename is not '-'
+        
+        @param profile [basis.Instrument.Profile] recorded profile, or None if not enabled
+        @param filename path of the JSON file, or '-'
+    """
+    if profile is None:
+        return
+    # ...
+    if filename == '-':
+        print(profile.summary(), file=sys.stderr)
+    else:
+        profile.dump(filename)
+    # ...
+# ...
+
+
+def cacheDirectory(args):
+    """!
+        Directory of the sheet cache asked on the command line
+        
+        @param args arguments of the command line. See parseArguments
+        @return path of the directory, or None without -cache
+    """
+    if args.cache is None:
+        return None
+    # ...
+    if args.cache == '':
+        from basis.Cache import CACHE_DIR
+        
+        return CACHE_DIR
+    # ...
+    return args.cache
+# ...
+
+
+def streamOperations(args):
+    """!
+        Writes the operations asked on the command line as NDJSON or CSV lines, as they are generated
+        
+        @param args arguments of the command line. See parseArguments
+    """
+    from basis.Stream import streamOperations, writeStream
+    
+    if args.level is None or args.n is None:
+        sys.exit("Error: -level and -n are required with -format")
+    # ...
+    tables = streamOperations(args.level, args.n, args.oper, args.minval, args.maxval, args.seed, pools=args.pools, 
+                               decimals=args.decimals)
+    if args.output is None or args.output == '-':
+        try:
+            writeStream(tables, sys.stdout, args.format)
+            sys.stdout.flush()
+        except BrokenPipeError:
+            # the reader stopped, e.g. head: no error message on the closed stdout
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        # ...
+    else:
+        with open(args.output, 'w', newline='') as f:
+            writeStream(tables, f, args.format)
+        # ...
+    # ...
+# ...
+
+
+def trainOnline(args):
+    """!
+        Runs a timed training on the console with the operations asked on the command line
+        
+        @param args arguments of the command line. See parseArguments
+    """
+    from basis.Session import Session
+    from basis.Trainer import trainOnConsole
+    
+    if args.level is None or args.n is None:
+        sys.exit("Error: -level and -n are required with -online")
+    # ...
+    try:
+        session = Session(args.n, args.level, oper=args.oper, minval=args.minval, maxval=args.maxval, seed=args.seed, 
+                          unique=args.unique, pools=args.pools, decimals=args.decimals)
+    except (TypeError, ValueError) as error:
+        sys.exit(str(error))
+    # ...
+    trainer = trainOnConsole(session, args.online)
+    summary = trainer.summary()
+    print("{0} right answers out of {1}, {2:.1f} s per answer".format(summary['right'], summary['answered'], 
+                                                                      summary['mean_time']))
+    if args.user is not None:
+        from basis.Results import ResultStore, RESULTS_FILE
+        
+        with ResultStore(args.results or RESULTS_FILE) as store:
+            store.addTrainer(args.user, trainer)
+            stats = store.stats(args.user)
+        # ...
+        print("{0}: {1:.0%} right answers out of {2} since the first session, {3:.1f} s per answer".format(
+              args.user, stats['accuracy'], stats['answered'], stats['mean_time']))
+    # ...
+# ...
 
 
 def main():
@@ -19,23 +196,80 @@ def main():
         Main Program
     """
     # check optional arguments
-    args = sys.argv[0:]
-    if len(args) > 1 and args[1] == '-nogui':
-        lev = int(input("Level of Operations ? "))
-        n = int(input('Number of operations desired ? '));
-        
-        session = Session(n, lev);
-        print(session)
-        session.export("test.pdf")
-    else:
+    args, others = parseArguments(sys.argv[1:])
+    profile = Instrument.enable() if args.profile is not None else None
     
-        app = QApplication(sys.argv)
+    if args.serve is not None:
+        from basis.Server import serve
+        
+        host, _, port = args.serve.rpartition(':')
+        serve(host or '127.0.0.1', int(port), workers=args.workers, cache=cacheDirectory(args))
+    elif args.batch is not None:
+        from basis.Batch import loadSpecs, exportBatch, exportMerged, MERGE_REQUIRED, MERGE_IGNORED
+        
+        try:
+            if args.merge is not None:
+                nb, seconds = exportMerged(loadSpecs(args.batch, MERGE_REQUIRED, MERGE_IGNORED), args.merge, 
+                                           answers=args.answers, backend=args.backend)
+            else:
+                nb, seconds = exportBatch(loadSpecs(args.batch), workers=args.workers, profile=profile, 
+                                          cache=cacheDirectory(args))
+            # ...
+        except (TypeError, ValueError) as error:
+            sys.exit(str(error))
+        # ...
+        print("{0} sheets in {1:.2f} s ({2:.1f} sheets per second)".format(nb, seconds, nb / seconds))
+    elif args.online is not None:
+        trainOnline(args)
+    elif args.format is not None:
+        try:
+            streamOperations(args)
+        except (TypeError, ValueError) as error:
+            sys.exit(str(error))
+        # ...
+    elif args.nogui or args.level is not None or args.n is not None:
+        from basis.Session import Session
+        
+        interactive = args.level is None or args.n is None
+        lev = args.level if args.level is not None else int(input("Level of Operations ? "))
+        n = args.n if args.n is not None else int(input('Number of operations desired ? '));
+        
+        if args.cache is not None and args.seed is not None:
+            from basis.Cache import SheetCache
+            
+            try:
+                SheetCache(cacheDirectory(args)).export(args.output or "test.pdf", lev, n, oper=args.oper, 
+                    minval=args.minval, maxval=args.maxval, seed=args.seed, answers=args.answers, unique=args.unique, 
+                    pools=args.pools, decimals=args.decimals, backend=args.backend)
+            except (TypeError, ValueError) as error:
+                sys.exit(str(error))
+            # ...
+        else:
+            try:
+                session = Session(n, lev, oper=args.oper, minval=args.minval, maxval=args.maxval, seed=args.seed, 
+                                  unique=args.unique, pools=args.pools, decimals=args.decimals);
+            except (TypeError, ValueError) as error:
+                sys.exit(str(error))
+            # ...
+            if interactive:
+                print(session)
+            # ...
+            session.export(args.output or "test.pdf", answers=args.answers, backend=args.backend)
+        # ...
+    else:
+        from PyQt5.QtWidgets import QApplication
+        from gui.MainWindow import MainWindow
+        
+        app = QApplication(sys.argv[:1] + others)
         
         window = MainWindow(parent=app)
         window.show()
         
-        sys.exit(app.exec_())
+        status = app.exec_()
+        writeProfile(profile, args.profile)
+        sys.exit(status)
     # ...
+    writeProfile(profile, args.profile)
 # ...
     
 
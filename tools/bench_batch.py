@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""!
+    @brief Benchmark of the batch export: sheets per second for an increasing number of processes
+"""
+
+##
+# @file tools.bench_batch.py
+#
+# @brief Benchmark of the batch export of basis.Batch
+#
+# @details Run from the root of the repository:
+#     python -m tools.bench_batch [--sheets 200] [-n 40] [--workers 1 2 4 8]
+#
+# @date 2026-10-18
+#
+# @version 1.1
+#
+# @author MBruliard
+##
+
+import argparse
+import os
+import tempfile
+
+from basis.Batch import exportBatch
+
+
+def main():
+    """!
+        @brief Prints the throughput of the batch export for each number of processes
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--sheets', type=int, default=200, help='number of sheets')
+    parser.add_argument('-n', type=int, default=40, help='number of operations per sheet')
+    parser.add_argument('--level', type=int, default=2)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    print("cpus: {0}".format(os.cpu_count()))
+    print("{0:>7} {1:>10} {2:>14} {3:>8}".format('workers', 'time (s)', 'sheets per s', 'scaling'))
+    with tempfile.TemporaryDirectory() as tmp:
+        specs = [{'output': os.path.join(tmp, 'sheet_{0}.pdf'.format(i)), 'level': args.level,
+                  'n': args.n, 'minval': 1, 'maxval': 1000, 'seed': i} for i in range(args.sheets)]
+        reference = None
+        for workers in args.workers:
+            nb, seconds = exportBatch(specs, workers=workers)
+            reference = reference or nb / seconds
+            print("{0:>7} {1:>10.2f} {2:>14.1f} {3:>7.2f}x".format(workers, seconds, nb / seconds, nb / seconds / reference))
+        # ...
+    # ...
+# ...
+
+
+if __name__ == "__main__":
+    main()
+# ...
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""!
+    @brief Benchmark of the generation of operations: one Operation at a time versus Operation.generateBatch
+"""
+
+##
+# @file tools.bench_generation.py
+#
+# @brief Benchmark of the generation of operations
+#
+# @details Run from the root of the repository:
+#     python -m tools.bench_generation [--max 1000000] [--levels 1 2 3 4]
+#
+# @date 2026-10-18
+#
+# @version 1.1
+#
+# @author MBruliard
+##
+
+import argparse
+import time
+
+from basis.Operation import Operation, LIST_OPERATIONS
+from random import randint
+
+
+def perObject(level, n, minval, maxval):
+    """!
+        @brief Previous path of Session: one Operation built per exercise
+    """
+    return [Operation(level=level, a=0, b=0,
+                      oper=LIST_OPERATIONS[randint(0, len(LIST_OPERATIONS)-1)],
+                      minval=minval, maxval=maxval) for i in range(0, n)]
+# ...
+
+
+def batch(level, n, minval, maxval):
+    """!
+        @brief Vectorized path: Operation.generateBatch
+    """
+    return Operation.generateBatch(level, n, LIST_OPERATIONS, minval, maxval)
+# ...
+
+
+def timeit(func, *args):
+    """!
+        @brief Time one call of @param func in seconds
+    """
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+# ...
+
+
+def main():
+    """!
+        @brief Prints the timings of both paths for n = 10^3 up to --max
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--max', type=int, default=10**6, help='largest number of operations')
+    parser.add_argument('--levels', type=int, nargs='+', default=[1, 2, 3, 4])
+    parser.add_argument('--minval', type=int, default=1)
+    parser.add_argument('--maxval', type=int, default=100)
+    args = parser.parse_args()
+
+    print("{0:>5} {1:>9} {2:>12} {3:>12} {4:>8}".format('level', 'n', 'objects (s)', 'batch (s)', 'speedup'))
+    for level in args.levels:
+        # the one-object path raises on level 4 divisions when min(a, b) < 2
+        minval = max(args.minval, 2) if level == 4 else args.minval
+        batch(level, 10, minval, args.maxval)
+        
+        n = 1000
+        while n <= args.max:
+            t_obj = timeit(perObject, level, n, minval, args.maxval)
+            t_batch = timeit(batch, level, n, minval, args.maxval)
+            print("{0:>5} {1:>9} {2:>12.4f} {3:>12.4f} {4:>7.1f}x".format(level, n, t_obj, t_batch, t_obj / t_batch))
+            n *= 10
+        # ...
+    # ...
+# ...
+
+
+if __name__ == "__main__":
+    main()
+# ...
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""!
+    @brief Cold start time of each path of SpeakMaths Trainer, measured with python -X importtime
+"""
+
+##
+# @file tools.bench_importtime.py
+#
+# @brief Import time and start time of the GUI, headless generation and PDF export paths
+#
+# @details Run from the root of the repository:
+#     python -m tools.bench_importtime [--repeat 5] [--top 8]
+# Each path runs in a new interpreter started with -X importtime. The table gives the best wall time
+# of the whole process, the total import time reported by the interpreter, whether numpy, reportlab
+# and PyQt5 were loaded, and the slowest top-level imports of the path.
+#
+# @date 2026-10-18
+#
+# @version 1.1
+#
+# @author MBruliard
+##
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import time
+
+
+# Global Constants
+# # Paths of the software: name and code run by a new interpreter
+PATHS = [
+    ('main', "import main; main.parseArguments(['-nogui'])"),
+    ('gui', "import main; from PyQt5.QtWidgets import QApplication; from gui.MainWindow import MainWindow"),
+    ('generation', "from basis.Session import Session; Session(10, 2, seed=1)"),
+    ('export', "import io; from basis.Session import Session; Session(10, 2, seed=1).export(io.BytesIO())"),
+]
+
+# # Packages reported as loaded or not
+PACKAGES = ['numpy', 'reportlab', 'PyQt5']
+
+# # Line of -X importtime: self time, cumulative time (us) and indented module name
+IMPORTTIME = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)')
+
+
+def runPath(code):
+    """!
+        @brief Runs @param code in a new interpreter with -X importtime
+
+        @return tuple (wall time in seconds, list of (cumulative us, module) of the top-level imports,
+        set of the loaded packages)
+    """
+    probe = "; import sys; print(' '.join(p for p in {0!r} if p in sys.modules))".format(PACKAGES)
+    env = dict(os.environ, QT_QPA_PLATFORM=os.environ.get('QT_QPA_PLATFORM', 'offscreen'))
+    start = time.perf_counter()
+    done = subprocess.run([sys.executable, '-X', 'importtime', '-c', code + probe],
+                          capture_output=True, text=True, env=env, check=True)
+    elapsed = time.perf_counter() - start
+
+    imports = []
+    for line in done.stderr.splitlines():
+        match = IMPORTTIME.match(line)
+        if match and len(match.group(3)) == 1:
+            imports.append((int(match.group(2)), match.group(4)))
+        # ...
+    # ...
+    return elapsed, imports, set(done.stdout.split())
+# ...
+
+
+def main():
+    """!
+        @brief Prints the start time of each path
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=5, help='runs of each path, the best one is kept')
+    parser.add_argument('--top', type=int, default=5, help='number of top-level imports listed per path')
+    args = parser.parse_args()
+
+    print("{0:<11} {1:>9} {2:>11}   {3:<24}".format('path', 'wall (s)', 'import (s)', 'loaded'))
+    details = []
+    for name, code in PATHS:
+        best = None
+        for i in range(args.repeat):
+            result = runPath(code)
+            if best is None or result[0] < best[0]:
+                best = result
+            # ...
+        # ...
+        elapsed, imports, loaded = best
+        total = sum(us for us, module in imports)/1e6
+        print("{0:<11} {1:>9.3f} {2:>11.3f}   {3:<24}".format(name, elapsed, total, ' '.join(p for p in PACKAGES if p in loaded) or '-'))
+        details.append((name, sorted(imports, reverse=True)[:args.top]))
+    # ...
+    for name, imports in details:
+        print("\n{0}: slowest top-level imports".format(name))
+        for us, module in imports:
+            print("  {0:>9.3f} s  {1}".format(us/1e6, module))
+        # ...
+    # ...
+# ...
+
+
+if __name__ == "__main__":
+    main()
+# ...
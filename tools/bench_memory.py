@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""!
+    @brief Memory footprint of a session: list of Operation objects versus OperationTable
+"""
+
+##
+# @file tools.bench_memory.py
+#
+# @brief Memory footprint of a session, in bytes per operation
+#
+# @details Run from the root of the repository:
+#     python -m tools.bench_memory [-n 100000] [--level 3]
+#
+# @date 2026-10-18
+#
+# @version 1.1
+#
+# @author MBruliard
+##
+
+import argparse
+import tracemalloc
+
+from basis.Operation import Operation, LIST_OPERATIONS
+from basis.OperationTable import OperationTable
+
+
+def measure(func, *args):
+    """!
+        @brief Bytes still allocated by the result of @param func
+    """
+    tracemalloc.start()
+    result = func(*args)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+# ...
+
+
+def objects(level, n):
+    """!
+        @brief Previous storage of Session: one Operation instance per exercise
+    """
+    a, b, codes, res = Operation.generateBatch(level, n)
+    return [Operation(level=level, a=x, b=y, oper=LIST_OPERATIONS[c])
+            for x, y, c in zip(a.tolist(), b.tolist(), codes.tolist())]
+# ...
+
+
+def main():
+    """!
+        @brief Prints the bytes per operation of both storages
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', type=int, default=100000, help='number of operations')
+    parser.add_argument('--level', type=int, default=3)
+    args = parser.parse_args()
+
+    before = measure(objects, args.level, args.n)
+    after = measure(OperationTable.generate, args.level, args.n)
+    print("list of Operation : {0:8.1f} bytes per operation".format(before / args.n))
+    print("OperationTable    : {0:8.1f} bytes per operation".format(after / args.n))
+# ...
+
+
+if __name__ == "__main__":
+    main()
+# ...
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""!
+    @brief Benchmark of the PDF export: time, peak memory and file size of one sheet
+"""
+
+##
+# @file tools.bench_pdf.py
+#
+# @brief Benchmark of the PDF export of a Session
+#
+# @details Run from the root of the repository:
+#     python -m tools.bench_pdf [-n 1000] [--level 2] [--repeat 5] [--per-call] [--answers] [--max-ratio 1.9] [--backend reportlab raw]
+#
+# Each backend is timed on its best run, then run once more under tracemalloc for its peak memory.
+# With --answers the sheet alone is timed too, in turn with the sheet and its answer key: the exit
+# status is 1 if writing the key makes the export more than --max-ratio times slower.
+#
+# @date 2026-10-18
+#
+# @version 1.1
+#
+# @author MBruliard
+##
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from basis.Session import Session, BACKENDS, pdfBackend, writeOperations
+
+
+# Global Constants
+# # Highest time of the export of a sheet and its answer key, over the time of the sheet alone
+MAX_KEY_RATIO = 1.9
+
+
+def export(backend, session, filename, perCall=False, answers=None):
+    """!
+        @brief Exports @param session with a backend, and its answer key in the same pass if @param answers is set
+
+        @return number of pages
+    """
+    PDF = pdfBackend(backend)
+    create = (lambda name: PDF(name, batchText=not perCall)) if backend == 'reportlab' else PDF
+    f = create(filename)
+    key = create(answers) if answers is not None else None
+    pages = [0]
+    writeOperations(f, session, progress=lambda count, nb: pages.append(nb), key=key)
+    f.save()
+    if key is not None:
+        key.save()
+    # ...
+    return pages[-1]
+# ...
+
+
+def main():
+    """!
+        @brief Prints the best export time, the time per page, the peak memory and the size of the PDF file of each backend
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', type=int, default=1000, help='number of operations')
+    parser.add_argument('--level', type=int, default=2)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--per-call', action='store_true', help='one text operation per writeText call, with reportlab')
+    parser.add_argument('--answers', action='store_true', help='also write the answer key, in the same pass')
+    parser.add_argument('--max-ratio', type=float, default=MAX_KEY_RATIO, 
+                        help='highest time of the sheet and its answer key over the time of the sheet alone')
+    parser.add_argument('--backend', nargs='+', choices=BACKENDS, default=BACKENDS)
+    args = parser.parse_args()
+
+    session = Session(args.n, args.level, minval=1, maxval=10000, seed=2023)
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, 'sheet.pdf')
+        answers = os.path.join(tmp, 'answers.pdf') if args.answers else None
+        failed = 0
+        for backend in args.backend:
+            # the sheet alone and with its key in turn, on the same load of the machine
+            runs = [None, answers] if answers is not None else [None]
+            times = [None for run in runs]
+            for i in range(args.repeat):
+                for j, run in enumerate(runs):
+                    start = time.perf_counter()
+                    pages = export(backend, session, filename, args.per_call, run)
+                    elapsed = time.perf_counter() - start
+                    times[j] = elapsed if times[j] is None else min(times[j], elapsed)
+                # ...
+            # ...
+            best = times[-1]
+            tracemalloc.start()
+            export(backend, session, filename, args.per_call, answers)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print("{0:>9} n = {1}: export {2:.3f} s, {3:.2f} ms per page, peak {4:.1f} MiB, {5} pages, {6} bytes".format(
+                backend, args.n, best, 1000*best / pages, peak / 2**20, pages, os.path.getsize(filename)))
+            if answers is not None:
+                ratio = times[1] / times[0]
+                failed += ratio > args.max_ratio
+                print("{0:>9} answer key: {1:.2f} times the sheet alone ({2:.3f} s), at most {3:.2f}: {4}".format(
+                    backend, ratio, times[0], args.max_ratio, 'ok' if ratio <= args.max_ratio else 'TOO SLOW'))
+            # ...
+        # ...
+    # ...
+    sys.exit(1 if failed else 0)
+# ...
+
+
+if __name__ == "__main__":
+    main()
+# ...
@@ -0,0 +1,298 @@
+# -*- coding: utf-8 -*-
+"""!
+    @brief Benchmark suite of SpeakMaths Trainer: generation, layout and PDF export, saved as JSON
+"""
+
+##
+# @file tools.benchmark.py
+#
+# @brief Reproducible benchmark suite with JSON results to compare two commits
+#
+# @details Run from the root of the repository:
+#     python -m tools.benchmark [-o results.json] [--only generate export] [--sizes 10 1000] [--quick]
+#     python -m tools.benchmark --compare base.json [new.json] [--threshold 1.2]
+# Each benchmark is run on every level and operator with n from 10 to 10^5. The per-object and
+# rendering benchmarks stop at --max-render operations. Exports of n = 10 fit in one page, the
+# larger ones are multi-page. With --compare, the current run (or new.json) is compared with
+# base.json and the exit status is 1 if one benchmark is slower by more than --threshold.
+#
+# @date 2026-10-18
+#
+# @version 1.1
+#
+# @author MBruliard
+##
+
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import reportlab
+
+from basis.Layout import layoutOperations
+from basis.MyPDF import MyPDF
+from basis.Operation import Operation, LIST_OPERATIONS, decomposition
+from basis.Session import Session
+
+
+# Global Constants
+# # Format of the JSON results
+FORMAT_VERSION = 1
+# # Seed of all the random draws of the suite
+SEED = 2023
+# # Range of the numbers: level 4 divisions need numbers of at least 2
+MINVAL, MAXVAL = 2, 10000
+# # Default numbers of operations
+SIZES = [10, 100, 1000, 10000, 100000]
+
+
+# Benchmarks: each one returns a callable to time, its setup is not timed
+def benchDecomposition(level, oper, n):
+    """!
+        @brief decomposition of the first numbers of @param n operations
+    """
+    numbers = Session(n, level, oper, MINVAL, MAXVAL, seed=SEED).table.a.astype(int).tolist()
+    return lambda: [decomposition(x) for x in numbers]
+# ...
+
+
+def benchOperation(level, oper, n):
+    """!
+        @brief @param n operations built one by one with Operation.__init__
+    """
+    def run():
+        random.seed(SEED)
+        return [Operation(level, 0, 0, oper, MINVAL, MAXVAL) for i in range(n)]
+    # ...
+    return run
+# ...
+
+
+def benchGenerate(level, oper, n):
+    """!
+        @brief @param n operations drawn by Operation.generateBatch
+    """
+    return lambda: Operation.generateBatch(level, n, [oper], MINVAL, MAXVAL, rng=SEED)
+# ...
+
+
+def benchSession(level, oper, n):
+    """!
+        @brief Session.__init__ with @param n operations
+    """
+    return lambda: Session(n, level, oper, MINVAL, MAXVAL, seed=SEED)
+# ...
+
+
+def benchLayout(level, oper, n):
+    """!
+        @brief Shapes and positions of @param n operations on the pages
+    """
+    session = Session(n, level, oper, MINVAL, MAXVAL, seed=SEED)
+    return lambda: list(layoutOperations(session))
+# ...
+
+
+def benchWriteOperation(level, oper, n):
+    """!
+        @brief @param n calls of MyPDF.writeOperation on one page kept in memory
+    """
+    operations = list(Session(n, level, oper, MINVAL, MAXVAL, seed=SEED))
+    def run():
+        f = MyPDF(io.BytesIO())
+        for operation in operations:
+            f.writeOperation(operation, 50, 50)
+        # ...
+        f.flushText()
+    # ...
+    return run
+# ...
+
+
+def benchExport(level, oper, n):
+    """!
+        @brief Session.export of @param n operations into a temporary file
+    """
+    session = Session(n, level, oper, MINVAL, MAXVAL, seed=SEED)
+    filename = os.path.join(tempfile.gettempdir(), 'speakmaths_benchmark_%d.pdf' % os.getpid())
+    return lambda: session.export(filename)
+# ...
+
+
+# # name: (function, per operator, limited to --max-render)
+BENCHMARKS = {
+    'decomposition': (benchDecomposition, False, False),
+    'operation': (benchOperation, True, True),
+    'generate': (benchGenerate, True, False),
+    'session': (benchSession, False, False),
+    'layout': (benchLayout, False, False),
+    'writeOperation': (benchWriteOperation, False, True),
+    'export': (benchExport, False, True),
+}
+
+
+def measure(func, repeat, mintime):
+    """!
+        @brief Times @param func as timeit does: loops of calls lasting at least @param mintime seconds,
+        repeated @param repeat times
+
+        @return dictionary of the best, median and mean time of one call in seconds, and the number of loops
+    """
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for i in range(loops):
+            func()
+        # ...
+        elapsed = time.perf_counter() - start
+        if elapsed >= mintime:
+            break
+        # ...
+        loops *= 10 if elapsed < mintime/10 else 2
+    # ...
+    times = [elapsed/loops]
+    for r in range(1, repeat):
+        start = time.perf_counter()
+        for i in range(loops):
+            func()
+        # ...
+        times.append((time.perf_counter() - start)/loops)
+    # ...
+    return {'min': min(times), 'median': statistics.median(times), 'mean': statistics.mean(times), 'loops': loops, 'repeat': repeat}
+# ...
+
+
+def machine():
+    """!
+        @brief Description of the machine and of the commit, stored with the results
+    """
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    # ...
+    return {
+        'commit': commit,
+        'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'cpus': os.cpu_count(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'reportlab': reportlab.Version,
+    }
+# ...
+
+
+def run(args):
+    """!
+        @brief Runs the selected benchmarks and returns the results
+    """
+    results = {}
+    for name in args.only:
+        func, perOperator, render = BENCHMARKS[name]
+        for level in args.levels:
+            for oper in (args.opers if perOperator else [None]):
+                for n in args.sizes:
+                    if render and n > args.max_render:
+                        continue
+                    # ...
+                    key = "{0}[level={1},oper={2},n={3}]".format(name, level, oper or 'all', n)
+                    result = measure(func(level, oper, n), args.repeat, args.mintime)
+                    result.update({'benchmark': name, 'level': level, 'oper': oper, 'n': n})
+                    results[key] = result
+                    print("{0:<48} {1:>12.6f} s".format(key, result['min']), flush=True)
+                # ...
+            # ...
+        # ...
+    # ...
+    return {'format': FORMAT_VERSION, 'machine': machine(), 'results': results}
+# ...
+
+
+def compare(base, new, threshold):
+    """!
+        @brief Prints the ratio new/base of the best times of the benchmarks run in both files
+
+        @return number of benchmarks slower by more than @param threshold
+    """
+    print("base: {0} ({1})   new: {2} ({3})".format(base['machine']['commit'], base['machine']['date'],
+                                                  new['machine']['commit'], new['machine']['date']))
+    slower = 0
+    for key, result in new['results'].items():
+        if key not in base['results']:
+            continue
+        # ...
+        ratio = result['min'] / base['results'][key]['min']
+        flag = ''
+        if ratio > threshold:
+            slower += 1
+            flag = '  SLOWER'
+        elif ratio < 1/threshold:
+            flag = '  faster'
+        # ...
+        print("{0:<48} {1:>12.6f} {2:>12.6f} {3:>7.2f}x{4}".format(key, base['results'][key]['min'], result['min'], ratio, flag))
+    # ...
+    return slower
+# ...
+
+
+def main():
+    """!
+        @brief Runs the suite and saves it, or compares two results
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-o', '--output', help='JSON file of the results')
+    parser.add_argument('--only', nargs='+', choices=list(BENCHMARKS), default=list(BENCHMARKS))
+    parser.add_argument('--levels', type=int, nargs='+', default=[1, 2, 3, 4])
+    parser.add_argument('--opers', nargs='+', choices=LIST_OPERATIONS, default=LIST_OPERATIONS)
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES, help='numbers of operations')
+    parser.add_argument('--max-render', type=int, default=10000,
+                        help='largest number of operations of the per-object and rendering benchmarks')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--mintime', type=float, default=0.2, help='minimal duration of one timing, in seconds')
+    parser.add_argument('--quick', action='store_true', help='3 repeats of at least 0.05 s, n up to 1000')
+    parser.add_argument('--compare', nargs='+', metavar='JSON', help='base results [and new results instead of a run]')
+    parser.add_argument('--threshold', type=float, default=1.2, help='ratio of times reported as a regression')
+    args = parser.parse_args()
+
+    if args.quick:
+        args.repeat, args.mintime = 3, 0.05
+        args.sizes = [n for n in args.sizes if n <= 1000]
+    # ...
+
+    if args.compare and len(args.compare) > 1:
+        with open(args.compare[1]) as f:
+            results = json.load(f)
+        # ...
+    else:
+        results = run(args)
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump(results, f, indent=1)
+            # ...
+        # ...
+    # ...
+
+    if args.compare:
+        with open(args.compare[0]) as f:
+            base = json.load(f)
+        # ...
+        sys.exit(1 if compare(base, results, args.threshold) else 0)
+    # ...
+# ...
+
+
+if __name__ == "__main__":
+    main()
+# ...
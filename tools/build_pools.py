@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""!
+    @brief Builds the memory-mapped pools of operations of the integer levels. See basis.Pool
+"""
+
+##
+# @file tools.build_pools.py
+#
+# @brief Builds the memory-mapped pools of operations of the integer levels
+#
+# @details Run from the root of the repository:
+#     python -m tools.build_pools DIR [--ranges 1-100 1-1000] [--bench]
+# Builds the pool of level 1, the pool of the divisions of level 3 and one pool of level 2 per range.
+# With --bench, compares for each pool the time to open it and to draw one million couples with the
+# samplers of basis.Sampling.
+#
+# @date 2026-10-18
+#
+# @version 1.1
+#
+# @author MBruliard
+##
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from basis.Pool import buildPool, OperationPool
+from basis.Sampling import drawBatch
+
+
+def parseRange(text):
+    """!
+        @brief Reads a range written as min-max
+    """
+    minval, maxval = text.split('-')
+    return int(minval), int(maxval)
+# ...
+
+
+def bench(path, level, division, minval, maxval, m):
+    """!
+        @brief Prints the time to open the pool of @param path and to draw @param m couples from it
+        and with the samplers
+    """
+    start = time.perf_counter()
+    pool = OperationPool(path)
+    opened = time.perf_counter() - start
+
+    rng = np.random.default_rng(2023)
+    start = time.perf_counter()
+    pool.draw(m, rng)
+    pooled = time.perf_counter() - start
+
+    start = time.perf_counter()
+    drawBatch(level, np.full(m, division), minval, maxval, rng)
+    sampled = time.perf_counter() - start
+    print("    open {0:.2f} ms, {1} draws: pool {2:.3f} s, samplers {3:.3f} s".format(1000*opened, m, pooled, sampled))
+# ...
+
+
+def main():
+    """!
+        @brief Builds the pools into a directory
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('directory', help='directory of the pools, given to Session(pools=...) or main.py -pools')
+    parser.add_argument('--ranges', nargs='+', default=['1-10', '1-100', '1-1000'], help='ranges min-max of level 2')
+    parser.add_argument('--bench', action='store_true', help='time the draws from each pool')
+    parser.add_argument('-m', type=int, default=10**6, help='number of draws of --bench')
+    args = parser.parse_args()
+
+    pools = [(1, False, 1, 10), (3, True, 1, 10)] + [(2, False) + parseRange(r) for r in args.ranges]
+    for level, division, minval, maxval in pools:
+        start = time.perf_counter()
+        path = buildPool(args.directory, level, division, minval, maxval)
+        elapsed = time.perf_counter() - start
+        print("{0}: {1} operations, {2} bytes, built in {3:.3f} s".format(
+            os.path.basename(path), len(OperationPool(path)), os.path.getsize(path), elapsed))
+        if args.bench:
+            bench(path, level, division, minval, maxval, args.m)
+        # ...
+    # ...
+# ...
+
+
+if __name__ == "__main__":
+    main()
+# ...
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+"""!
+    @brief Statistical check that the retry-free samplers of basis.Sampling follow the distribution
+    of the former "draw then reject" loop of Operation
+"""
+
+##
+# @file tools.check_distributions.py
+#
+# @brief Chi-square homogeneity test between the former samplers and basis.Sampling
+#
+# @details Run from the root of the repository:
+#     python -m tools.check_distributions [-n 100000] [--alpha 0.001]
+# Exit status is 1 if one of the comparisons is rejected.
+#
+# @date 2026-10-18
+#
+# @version 1.1
+#
+# @author MBruliard
+##
+
+import argparse
+import sys
+from collections import Counter
+from math import erfc, floor, sqrt
+from random import randint, uniform
+
+import numpy as np
+
+from basis.FixedPoint import DECIMALS
+from basis.Operation import decomposition
+from basis.Sampling import sampleLevelOne, sampleLevelTwo, sampleLevelThree, sampleLevelFour, drawBatch
+
+
+# Former samplers, as they were written in Operation
+def legacy(level, oper, minval, maxval, decimals=DECIMALS):
+    """!
+        @brief Former loop of Operation.__init__: draw, then draw again while a == b, a == 0 or b == 0.
+        With @param decimals 0, a and c of the divisions of level 4 are integers
+    """
+    a = b = 0
+    while (a == b) or (a == 0) or (b == 0):
+        if level == 1:
+            x = randint(1, 10)
+            a, b = randint(x, 10), x
+        elif level == 2:
+            a = randint(minval, maxval)
+            b = int(''.join([str(randint(0, int(d))) for d in decomposition(a)]))
+        else:
+            if decimals == 0:
+                a, b = randint(minval, maxval), randint(minval, maxval)
+            else:
+                a, b = uniform(minval, maxval), uniform(minval, maxval)
+            # ...
+            if oper == '/' and level == 3:
+                b = randint(1, 9)
+                a = randint(1, 100)*b
+            elif oper == '/':
+                # the former code raised ValueError when min(a, b) < 2: the reference draws again
+                b = randint(2, floor(min(a, b))) if min(a, b) >= 2 else 0
+            # ...
+        # ...
+    # ...
+    return a, b
+# ...
+
+
+def scalar(level, oper, minval, maxval, decimals=DECIMALS):
+    """!
+        @brief New scalar samplers
+    """
+    if level == 1:
+        return sampleLevelOne()
+    elif level == 2:
+        return sampleLevelTwo(minval, maxval)
+    elif level == 3:
+        return sampleLevelThree(minval, maxval, oper == '/')
+    # ...
+    return sampleLevelFour(minval, maxval, oper == '/', decimals)
+# ...
+
+
+def batch(level, oper, minval, maxval, n, rng, decimals=DECIMALS):
+    """!
+        @brief New batch samplers
+    """
+    a, b = drawBatch(level, np.full(n, oper == '/'), minval, maxval, rng, decimals)
+    return list(zip(a.tolist(), b.tolist()))
+# ...
+
+
+def category(level, oper, minval, maxval, decimals=DECIMALS):
+    """!
+        @brief Maps a couple (a, b) to a discrete category: the couple itself for integers,
+        the bins of a and b (and b itself for a division) for real numbers
+    """
+    if level <= 2 or (level == 3 and oper == '/') or decimals == 0:
+        return lambda a, b: (int(a), int(b))
+    # ...
+    lo = max(minval, 2) if oper == '/' else minval
+    width = (maxval - lo)/10
+    if oper == '/':
+        return lambda a, b: (int((a - lo)//width), int(b))
+    # ...
+    return lambda a, b: (int((a - lo)//width), int((b - lo)//width))
+# ...
+
+
+def homogeneity(first, second):
+    """!
+        @brief Chi-square homogeneity test of two samples of categories
+
+        @return tuple (statistic, degrees of freedom, approximate p-value by Wilson-Hilferty)
+    """
+    c1, c2 = Counter(first), Counter(second)
+    n1, n2 = len(first), len(second)
+    stat = 0.0
+    keys = set(c1) | set(c2)
+    for k in keys:
+        total = c1[k] + c2[k]
+        e1, e2 = total*n1/(n1 + n2), total*n2/(n1 + n2)
+        stat += (c1[k] - e1)**2/e1 + (c2[k] - e2)**2/e2
+    # ...
+    dof = max(len(keys) - 1, 1)
+    z = ((stat/dof)**(1/3) - (1 - 2/(9*dof)))/sqrt(2/(9*dof))
+    return stat, dof, 0.5*erfc(z/sqrt(2))
+# ...
+
+
+CASES = [
+    (1, '+', 1, 10),
+    (2, '+', 1, 100),
+    (2, '+', 1, 30),
+    (2, '+', 5, 12),
+    (2, '+', 95, 130),
+    (3, '/', 1, 100),
+    (3, '+', 1, 100),
+    (4, '+', 1, 100),
+    (4, '/', 1, 30),
+    # integer a: b = a is drawn again, b = max(a, c) must stay possible
+    (4, '/', 1, 10, 0),
+    (4, '/', 1, 3, 0),
+]
+
+
+def main():
+    """!
+        @brief Compares the former sampler with the scalar and batch samplers on each case
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', type=int, default=100000, help='sample size of each sampler')
+    parser.add_argument('--alpha', type=float, default=0.001, help='rejection threshold of the p-value')
+    parser.add_argument('--seed', type=int, default=2023)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    failed = 0
+    print("{0:>5} {1:>4} {2:>10} {3:>7} {4:>6} {5:>9} {6:>9}".format('level', 'op', 'range', 'sampler', 'dof', 'chi2', 'p-value'))
+    for case in CASES:
+        level, oper, minval, maxval = case[:4]
+        key = category(*case)
+        ref = [key(*legacy(*case)) for i in range(args.n)]
+        samples = {
+            'scalar': [key(*scalar(*case)) for i in range(args.n)],
+            'batch': [key(a, b) for a, b in batch(level, oper, minval, maxval, args.n, rng, *case[4:])],
+        }
+        for name, sample in samples.items():
+            stat, dof, p = homogeneity(ref, sample)
+            failed += p < args.alpha
+            print("{0:>5} {1:>4} {2:>10} {3:>7} {4:>6} {5:>9.1f} {6:>9.4f}{7}".format(
+                level, oper, "{0}-{1}".format(minval, maxval), name, dof, stat, p,
+                '  REJECTED' if p < args.alpha else ''))
+        # ...
+    # ...
+    sys.exit(1 if failed else 0)
+# ...
+
+
+if __name__ == "__main__":
+    main()
+# ...
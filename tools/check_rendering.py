@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""!
+    @brief Regression check of the batched text rendering of MyPDF: same page content as one text
+    operation per writeText call
+"""
+
+##
+# @file tools.check_rendering.py
+#
+# @brief Compares the drawing operations of MyPDF with and without batchText
+#
+# @details Run from the root of the repository:
+#     python -m tools.check_rendering [-n 200] [--levels 1 2 3]
+# Both renderings are decoded into the list of glyphs (font, size, position, text), lines and forms of
+# each page and each form, with absolute positions. Exit status is 1 if they differ.
+#
+# @date 2026-10-18
+#
+# @version 1.1
+#
+# @author MBruliard
+##
+
+import argparse
+import base64
+import io
+import re
+import sys
+import zlib
+from collections import Counter
+
+from basis.MyPDF import MyPDF
+from basis.Session import Session, writeOperations
+
+
+# Global Constants
+# # Tokens of a content stream: strings, names, numbers and operators
+TOKENS = re.compile(rb'\((?:\\.|[^\\)])*\)|/[^\s/\[\]()<>]+|[-+]?(?:\d+\.?\d*|\.\d+)|[A-Za-z*\'"]+')
+
+
+def render(session, batchText):
+    """!
+        @brief PDF bytes of @param session, without compression of the streams
+    """
+    buffer = io.BytesIO()
+    f = MyPDF(buffer, batchText=batchText)
+    f.setPageCompression(0)
+    writeOperations(f, session)
+    f.save()
+    return buffer.getvalue()
+# ...
+
+
+def interpret(stream):
+    """!
+        @brief Decodes the drawing operations of one content stream
+
+        @return tuple (Counter of the drawings, number of text objects)
+    """
+    drawings = Counter()
+    stack = []
+    ctm = (0.0, 0.0)
+    font = None
+    start = (0.0, 0.0)
+    texts = 0
+    args = []
+    for token in TOKENS.findall(stream):
+        if token[:1] == b'(':
+            args.append(re.sub(rb'\\(.)', rb'\1', token[1:-1]).decode('latin-1'))
+        elif token[:1] == b'/' or token[:1] in b'-+.0123456789':
+            args.append(token.decode() if token[:1] == b'/' else float(token))
+        else:
+            op = token.decode()
+            if op == 'q':
+                stack.append(ctm)
+            elif op == 'Q':
+                ctm = stack.pop()
+            elif op == 'cm':
+                ctm = (ctm[0] + args[4], ctm[1] + args[5])
+            elif op == 'BT':
+                texts += 1
+                origin = (0.0, 0.0)
+            elif op == 'Tf':
+                font = (args[0], args[1])
+            elif op == 'Tm':
+                origin = (args[4], args[5])
+            elif op == 'Td':
+                origin = (origin[0] + args[0], origin[1] + args[1])
+            elif op == 'Tj':
+                drawings[('text', font, round(ctm[0] + origin[0], 1), round(ctm[1] + origin[1], 1), args[0])] += 1
+            elif op == 'm':
+                start = (ctm[0] + args[0], ctm[1] + args[1])
+            elif op == 'l':
+                end = (ctm[0] + args[0], ctm[1] + args[1])
+                drawings[('line',) + tuple(round(v, 1) for v in start + end)] += 1
+            elif op == 'Do':
+                drawings[('form', args[0], round(ctm[0], 1), round(ctm[1], 1))] += 1
+            # ...
+            args = []
+        # ...
+    # ...
+    return drawings, texts
+# ...
+
+
+def streams(pdf):
+    """!
+        @brief Content of the pages and of the forms of a PDF file, in the order of the file
+
+        @details The content streams of a page are joined. Streams written before the compression was 
+        switched off are ASCII85 and Flate encoded
+    """
+    objects = dict(re.findall(rb'(\d+) 0 obj\s*(.*?)endobj', pdf, re.DOTALL))
+
+    def content(number):
+        stream = re.search(rb'stream\r?\n(.*?)endstream', objects[number], re.DOTALL).group(1).strip()
+        if stream.endswith(b'~>'):
+            stream = zlib.decompress(base64.a85decode(stream[:-2]))
+        # ...
+        return stream
+    # ...
+
+    result = []
+    for number, body in objects.items():
+        if re.search(rb'/Type /Page\b', body):
+            contents = re.search(rb'/Contents (\d+) 0 R', body).group(1)
+            if not objects[contents].lstrip().startswith(b'<<'):
+                # an array of content streams
+                result.append(b"\n".join(content(ref) for ref in re.findall(rb'(\d+) 0 R', objects[contents])))
+            else:
+                result.append(content(contents))
+            # ...
+        elif re.search(rb'/Subtype /Form\b', body):
+            result.append(content(number))
+        # ...
+    # ...
+    return result
+# ...
+
+
+def main():
+    """!
+        @brief Renders sessions of each level with both paths and compares them
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-n', type=int, default=200, help='number of operations per session')
+    parser.add_argument('--levels', type=int, nargs='+', default=[1, 2, 3])
+    args = parser.parse_args()
+
+    failed = 0
+    for level in args.levels:
+        session = Session(args.n, level, minval=1, maxval=10000, seed=level)
+        first = streams(render(session, False))
+        second = streams(render(session, True))
+
+        same = len(first) == len(second)
+        texts = [0, 0]
+        for one, two in zip(first, second):
+            d1, t1 = interpret(one)
+            d2, t2 = interpret(two)
+            same = same and d1 == d2
+            texts[0] += t1
+            texts[1] += t2
+        # ...
+        failed += not same
+        print("level {0}: {1} streams, text objects {2} -> {3}: {4}".format(
+            level, len(first), texts[0], texts[1], 'same drawings' if same else 'DIFFERENT'))
+    # ...
+    sys.exit(1 if failed else 0)
+# ...
+
+
+if __name__ == "__main__":
+    main()
+# ...
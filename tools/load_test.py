@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""!
+    @brief Load test of the HTTP sheet service of basis.Server: latency percentiles and throughput
+"""
+
+##
+# @file tools.load_test.py
+#
+# @brief Load test of the HTTP sheet service of basis.Server
+#
+# @details Run from the root of the repository, against a running service:
+#     python main.py -serve 8000 &
+#     python -m tools.load_test --url http://127.0.0.1:8000 [-c 8] [-r 200] [--level 2] [-n 40]
+# or with --start, which starts a service on a free port for the test.
+# Each client sends its requests one after the other; the seeds differ so that no sheet is the same.
+#
+# @date 2026-10-18
+#
+# @version 1.1
+#
+# @author MBruliard
+##
+
+import argparse
+import json
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+
+def request(url, spec):
+    """!
+        @brief Sends one sheet spec
+
+        @return tuple (HTTP status, latency in seconds, size of the answer)
+    """
+    data = json.dumps(spec).encode()
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url + '/sheet', data, {'Content-Type': 'application/json'})) as answer:
+            body = answer.read()
+            status = answer.status
+        # ...
+    except urllib.error.HTTPError as error:
+        body = error.read()
+        status = error.code
+    # ...
+    return status, time.perf_counter() - start, len(body)
+# ...
+
+
+def percentile(values, q):
+    """!
+        @brief Percentile @param q (0 to 100) of sorted @param values, by the nearest rank
+    """
+    return values[min(len(values) - 1, max(0, int(round(q/100*len(values) + 0.5)) - 1))]
+# ...
+
+
+def main():
+    """!
+        @brief Sends the requests and prints the latency percentiles and the requests per second
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--url', default='http://127.0.0.1:8000')
+    parser.add_argument('--start', action='store_true', help='start a service on a free port for the test')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes of the service started with --start')
+    parser.add_argument('-c', '--concurrency', type=int, default=8, help='number of clients')
+    parser.add_argument('-r', '--requests', type=int, default=200, help='total number of requests')
+    parser.add_argument('--level', type=int, default=2)
+    parser.add_argument('-n', type=int, default=40, help='operations per sheet')
+    parser.add_argument('--maxval', type=int, default=1000)
+    args = parser.parse_args()
+
+    server = None
+    url = args.url
+    if args.start:
+        from basis.Server import SheetServer
+
+        server = SheetServer(('127.0.0.1', 0), workers=args.workers)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = 'http://127.0.0.1:{0}'.format(server.server_address[1])
+    # ...
+
+    specs = [{'level': args.level, 'n': args.n, 'maxval': args.maxval, 'seed': i} for i in range(args.requests)]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as clients:
+        results = list(clients.map(lambda spec: request(url, spec), specs))
+    # ...
+    elapsed = time.perf_counter() - start
+
+    if server is not None:
+        server.shutdown()
+        server.server_close()
+    # ...
+
+    latencies = sorted(latency for status, latency, size in results if status == 200)
+    errors = len(results) - len(latencies)
+    print("{0} requests, {1} clients: {2:.1f} requests per second, {3} errors".format(
+        len(results), args.concurrency, len(results)/elapsed, errors))
+    if latencies:
+        print("latency: p50 {0:.1f} ms, p90 {1:.1f} ms, p99 {2:.1f} ms, max {3:.1f} ms, mean {4:.1f} ms".format(
+            1000*percentile(latencies, 50), 1000*percentile(latencies, 90), 1000*percentile(latencies, 99),
+            1000*latencies[-1], 1000*statistics.mean(latencies)))
+    # ...
+# ...
+
+
+if __name__ == "__main__":
+    main()
+# ...